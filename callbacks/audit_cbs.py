@@ -0,0 +1,99 @@
+# foundry_dash/callbacks/audit_cbs.py
+
+import dash
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+import time
+
+# --- CORE LOGIC IMPORTS ---
+from core.io.data_persistence import get_universe_members, list_universe_names
+from core.logic.backtest_engine import list_strategy_names
+from core.logic.monte_carlo import MonteCarloError, run_stress_test, strategy_trade_returns
+from core.logic.strategy_sandbox import StrategyExecutionError
+
+
+def _bands_figure(bands):
+    """Line chart of the equity percentiles by trade number (p5/p95 and p25/p75 as shaded bands)."""
+    trades = bands.index.tolist()
+    data = []
+    for low, high, opacity in (("p5", "p95", 0.15), ("p25", "p75", 0.3)):
+        data.append({'x': trades, 'y': bands[low].tolist(), 'mode': 'lines', 'line': {'width': 0}, 'name': low, 'showlegend': False})
+        data.append({
+            'x': trades, 'y': bands[high].tolist(), 'mode': 'lines', 'line': {'width': 0}, 'fill': 'tonexty',
+            'fillcolor': f'rgba(44, 62, 80, {opacity})', 'name': f"{low}–{high}",
+        })
+    data.append({'x': trades, 'y': bands["p50"].tolist(), 'mode': 'lines', 'name': 'median', 'line': {'color': '#e74c3c'}})
+    return {
+        'data': data,
+        'layout': {
+            'title': 'Equity percentile bands', 'xaxis': {'title': 'Trade #'}, 'yaxis': {'title': 'Equity (start = 1)'},
+            'margin': {'t': 40, 'r': 10},
+        },
+    }
+
+
+# ============================================================================
+# CALLBACK A1: Populate Selectors (read fresh on every visit)
+# ============================================================================
+@dash.callback(
+    Output('audit-universe-selector', 'options'),
+    Output('audit-strategy-selector', 'options'),
+    Input('url', 'pathname'),
+)
+def populate_audit_selectors(pathname):
+    if pathname != '/audit':
+        raise PreventUpdate
+    return list_universe_names(), list_strategy_names()
+
+
+# ============================================================================
+# CALLBACK A2: Run Stress Test (Background Callback)
+# Path chunks run across a process pool; progress is reported per chunk.
+# ============================================================================
+@dash.callback(
+    Output('audit-summary-table', 'data'),
+    Output('audit-summary-table', 'columns'),
+    Output('audit-equity-bands-graph', 'figure'),
+    Output('audit-status', 'children'),
+    Output('audit-status', 'color'),
+    Input('run-audit-button', 'n_clicks'),
+    State('audit-universe-selector', 'value'),
+    State('audit-strategy-selector', 'value'),
+    State('audit-method-selector', 'value'),
+    State('audit-paths-input', 'value'),
+    background=True,
+    running=[(Output('run-audit-button', 'disabled'), True, False)],
+    progress=[Output('audit-progress-bar', 'value')],
+    progress_default=[0],
+    prevent_initial_call=True
+)
+def run_audit_stress_test(set_progress, n_clicks, universe_name, strategy_name, method, n_paths):
+    if not n_clicks:
+        raise PreventUpdate
+
+    if not universe_name or not strategy_name:
+        return [], [], dash.no_update, "Choose a universe and a strategy first.", "warning"
+    tickers = get_universe_members(universe_name)
+    if not tickers:
+        return [], [], dash.no_update, f"Universe '{universe_name}' has no stocks.", "warning"
+
+    started = time.perf_counter()
+    try:
+        trade_returns = strategy_trade_returns(strategy_name, tickers)
+        result = run_stress_test(
+            trade_returns, method=method, n_paths=int(n_paths or 0),
+            on_progress=lambda done, total, message: set_progress((round(100 * done / total),)),
+        )
+    except (MonteCarloError, StrategyExecutionError, KeyError) as e:
+        return [], [], dash.no_update, f"Stress test failed: {e}", "danger"
+    elapsed = time.perf_counter() - started
+
+    summary = result['summary'].round(4).reset_index()
+    message = (
+        f"✅ {result['paths']:,} {method} paths over {result['trades']:,} trades of '{strategy_name}' "
+        f"in {elapsed:.2f}s · P(loss) = {result['prob_loss']:.1%}"
+    )
+    return (
+        summary.to_dict('records'), [{"name": col, "id": col} for col in summary.columns],
+        _bands_figure(result['bands']), message, "success",
+    )
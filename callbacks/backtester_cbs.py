@@ -0,0 +1,109 @@
+# foundry_dash/callbacks/backtester_cbs.py
+
+import dash
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+import time
+
+# --- CORE LOGIC IMPORTS ---
+from core.io.data_persistence import get_universe_members, list_universe_names
+from core.io.market_data import load_price_panel
+from core.logic.parameter_sweep import SWEEP_FAMILIES, SweepError, build_grid, parse_param_values, run_sweep
+
+
+# ============================================================================
+# CALLBACK B1: Populate Universe Selector (read fresh on every visit)
+# ============================================================================
+@dash.callback(
+    Output('backtester-universe-selector', 'options'),
+    Input('url', 'pathname'),
+)
+def populate_backtester_universes(pathname):
+    if pathname != '/backtester':
+        raise PreventUpdate
+    return list_universe_names()
+
+
+# ============================================================================
+# CALLBACK B2: Parameter Inputs follow the selected strategy family
+# ============================================================================
+@dash.callback(
+    Output('backtester-param-1-label', 'children'),
+    Output('backtester-param-1-input', 'value'),
+    Output('backtester-param-2-label', 'children'),
+    Output('backtester-param-2-input', 'value'),
+    Output('backtester-param-2-group', 'style'),
+    Input('backtester-family-selector', 'value'),
+)
+def update_param_inputs(family):
+    spec = SWEEP_FAMILIES.get(family)
+    if spec is None:
+        raise PreventUpdate
+    names, defaults = spec['params'], spec['defaults']
+    if len(names) == 1:
+        return names[0], defaults[0], "", "", {'display': 'none'}
+    return names[0], defaults[0], names[1], defaults[1], {}
+
+
+# ============================================================================
+# CALLBACK B3: Run Sweep (Background Callback)
+# The whole grid runs as one batched computation; progress is reported per
+# chunk of grid points, and walk-forward folds reuse the same indicators.
+# ============================================================================
+@dash.callback(
+    Output('backtester-walk-forward-table', 'data'),
+    Output('backtester-walk-forward-table', 'columns'),
+    Output('backtester-grid-table', 'data'),
+    Output('backtester-grid-table', 'columns'),
+    Output('backtester-status', 'children'),
+    Output('backtester-status', 'color'),
+    Input('run-sweep-button', 'n_clicks'),
+    State('backtester-universe-selector', 'value'),
+    State('backtester-family-selector', 'value'),
+    State('backtester-param-1-input', 'value'),
+    State('backtester-param-2-input', 'value'),
+    State('backtester-folds-input', 'value'),
+    background=True,
+    running=[(Output('run-sweep-button', 'disabled'), True, False)],
+    progress=[Output('backtester-progress-bar', 'value')],
+    progress_default=[0],
+    prevent_initial_call=True
+)
+def run_parameter_sweep(set_progress, n_clicks, universe_name, family, param_1, param_2, n_folds):
+    if not n_clicks:
+        raise PreventUpdate
+
+    empty = ([], [], [], [])
+    if not universe_name:
+        return *empty, "Choose a universe first.", "warning"
+    tickers = get_universe_members(universe_name)
+    if not tickers:
+        return *empty, f"Universe '{universe_name}' has no stocks.", "warning"
+
+    try:
+        texts = [param_1, param_2][:len(SWEEP_FAMILIES[family]['params'])]
+        param_values = [parse_param_values(text) for text in texts]
+        n_points = len(build_grid(family, param_values))
+
+        started = time.perf_counter()
+        close_panel = load_price_panel(tickers)
+        grid_results, walk_forward = run_sweep(
+            close_panel, family, param_values, n_folds=int(n_folds or 1),
+            on_progress=lambda done, total, message: set_progress((round(100 * done / total),)),
+        )
+    except SweepError as e:
+        return *empty, f"Invalid sweep: {e}", "danger"
+    except Exception as e:  # data loading or simulation failure: report it instead of killing the job
+        return *empty, f"Sweep failed: {type(e).__name__}: {e}", "danger"
+    elapsed = time.perf_counter() - started
+
+    grid_results, walk_forward = grid_results.round(3), walk_forward.round(3)
+    message = (
+        f"✅ {SWEEP_FAMILIES[family]['label']}: {n_points} grid points x {len(tickers)} stocks x "
+        f"{len(walk_forward)} folds in {elapsed:.2f}s"
+    )
+    return (
+        walk_forward.to_dict('records'), [{"name": col, "id": col} for col in walk_forward.columns],
+        grid_results.to_dict('records'), [{"name": col, "id": col} for col in grid_results.columns],
+        message, "success",
+    )
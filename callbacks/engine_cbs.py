@@ -0,0 +1,112 @@
+# foundry_dash/callbacks/engine_cbs.py
+
+import dash
+from dash import html, dash_table
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+import time
+import uuid
+from collections import deque
+import dash_bootstrap_components as dbc
+
+# --- CORE LOGIC IMPORTS ---
+from core.io.data_persistence import (
+    DEFAULT_LIBRARY_PATH, DEFAULT_UNIVERSES_PATH, list_universe_names, load_library, load_universes, save_library,
+)
+from core.logic.backtest_engine import list_strategy_names, run_library_build
+from core.logic.dashboard_snapshot import record_activity
+from core.logic.library_query import top_runs
+from core.logic.parallel import default_worker_count
+from core.logic.telemetry import engine_job_finished, engine_job_heartbeat
+
+# Only the tail of the job log is streamed, so progress payloads stay small on long runs.
+LOG_TAIL_LINES = 40
+
+
+# ============================================================================
+# CALLBACK E1: Populate Engine Selectors
+# Fires off the load trigger (not the tab value) so the selectors exist when it runs.
+# ============================================================================
+@dash.callback(
+    Output('engine-universe-selector', 'options'),
+    Output('engine-strategy-selector', 'options'),
+    Input('research-hub-load-trigger', 'data'),
+    State('research-hub-tabs', 'value'),
+    prevent_initial_call=True
+)
+def populate_engine_selectors(load_trigger, active_tab):
+    if active_tab != 'performance-engine-tab' or not load_trigger:
+        raise PreventUpdate
+
+    universe_options = list_universe_names()
+    strategy_options = list_strategy_names()
+    return universe_options, strategy_options
+
+
+# ============================================================================
+# CALLBACK E2: Launch Engine (Background Callback on the app's DiskcacheManager)
+# Shards run in a process pool; per-shard progress streams through `set_progress`.
+# Cancelling kills the job process and, with it, the pool workers.
+# ============================================================================
+@dash.callback(
+    Output('engine-result-output', 'children'),
+    Input('launch-engine-button', 'n_clicks'),
+    State('engine-universe-selector', 'value'),
+    State('engine-strategy-selector', 'value'),
+    State('engine-mode-selector', 'value'),
+    background=True,
+    running=[
+        (Output('launch-engine-button', 'disabled'), True, False),
+        (Output('cancel-engine-button', 'disabled'), False, True),
+    ],
+    cancel=[Input('cancel-engine-button', 'n_clicks')],
+    progress=[Output('engine-progress-bar', 'value'), Output('engine-log-output', 'children')],
+    progress_default=[0, None],
+    prevent_initial_call=True
+)
+def launch_engine(set_progress, n_clicks, universe_names, strategy_names, mode):
+    if not n_clicks:
+        raise PreventUpdate
+
+    if not universe_names or not strategy_names:
+        return dbc.Alert("Select at least one universe and one strategy preset.", color="warning")
+
+    log_lines = deque(maxlen=LOG_TAIL_LINES)
+    job_id = uuid.uuid4().hex  # counted in the health sidebar's queue depth while it heartbeats
+
+    def report(done, total, message):
+        engine_job_heartbeat(job_id)
+        log_lines.append(f"[{time.strftime('%H:%M:%S')}] {done}/{total} {message}")
+        set_progress((round(100 * done / total), html.Pre("\n".join(log_lines), className="small mb-0")))
+
+    workers = default_worker_count()
+    report(0, 1, f"starting {mode} build on {workers} worker processes")
+
+    started = time.perf_counter()
+    try:
+        existing = load_library(DEFAULT_LIBRARY_PATH) if mode == 'update' else None
+        library, stats, curves = run_library_build(
+            load_universes(DEFAULT_UNIVERSES_PATH), universe_names, strategy_names,
+            mode=mode, existing=existing, max_workers=workers, on_progress=report,
+        )
+        elapsed = time.perf_counter() - started
+        save_library(DEFAULT_LIBRARY_PATH, library, curves)
+        record_activity('engine', f"Performance library {mode} build: {stats['computed']} computed, {stats['failed']} failed")
+    finally:
+        engine_job_finished(job_id)
+
+    best = top_runs('sharpe', 10, universe_names, strategy_names).round(3)
+    best = best.drop(columns=['start_date', 'end_date', 'fingerprint'])
+    return html.Div([
+        dbc.Alert(
+            f"{'⚠️' if stats['failed'] else '✅'} [{mode}] {stats['computed']} cells computed, "
+            f"{stats['skipped']} unchanged skipped, {stats['failed']} failed "
+            f"({len(library)} library rows) in {elapsed:.2f}s at {time.strftime('%H:%M:%S')}",
+            color="warning" if stats['failed'] else "success"
+        ),
+        dash_table.DataTable(
+            columns=[{"name": col, "id": col} for col in best.columns],
+            data=best.to_dict('records'),  # type: ignore
+            style_header={'backgroundColor': 'var(--bs-gray-200)', 'fontWeight': 'bold'},
+        ),
+    ])
@@ -0,0 +1,44 @@
+# foundry_dash/callbacks/health_cbs.py
+
+import dash
+from dash.dependencies import Input, Output
+from dash.exceptions import PreventUpdate
+
+# --- CORE LOGIC IMPORTS ---
+from core.logic.telemetry import telemetry_sampler
+
+
+def _bar(name, percent):
+    """Value, label and color for one sidebar progress bar."""
+    if percent is None:
+        return 0, f"{name}: n/a", "secondary"
+    color = "success" if percent < 60 else "warning" if percent < 85 else "danger"
+    return round(percent), f"{name}: {percent:.0f}%", color
+
+
+# ============================================================================
+# CALLBACK H1: System Health Sidebar
+# Reads the sampler's newest snapshot only; sampling itself happens on the
+# sampler thread, so a refresh costs a dict lookup and a few formatted strings.
+# ============================================================================
+@dash.callback(
+    Output('health-cpu-bar', 'value'), Output('health-cpu-bar', 'label'), Output('health-cpu-bar', 'color'),
+    Output('health-ram-bar', 'value'), Output('health-ram-bar', 'label'), Output('health-ram-bar', 'color'),
+    Output('health-disk-bar', 'value'), Output('health-disk-bar', 'label'), Output('health-disk-bar', 'color'),
+    Output('health-engine-text', 'children'),
+    Output('health-process-text', 'children'),
+    Input('health-interval', 'n_intervals'),
+)
+def refresh_system_health(n_intervals):
+    snapshot = telemetry_sampler.latest()
+    if snapshot is None:
+        raise PreventUpdate
+
+    rss = f"{snapshot['rss_mb']:.0f} MB" if snapshot['rss_mb'] is not None else "n/a"
+    return (
+        *_bar("CPU", snapshot['cpu_percent']),
+        *_bar("RAM", snapshot['ram_percent']),
+        *_bar("Disk", snapshot['disk_percent']),
+        f"Engine: {snapshot['queue_depth']} jobs running · {snapshot['engine_cells_per_second']:.1f} cells/s",
+        f"Worker RSS {rss} · Cache {snapshot['cache_mb']:.1f} MB",
+    )
@@ -0,0 +1,31 @@
+# foundry_dash/callbacks/home_cbs.py
+
+import dash
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+
+# --- CORE LOGIC IMPORTS ---
+from core.logic.dashboard_snapshot import get_dashboard_snapshot
+
+# --- UI IMPORTS ---
+from components.home_ui import quick_stats_body, recent_activity_body
+
+
+# ============================================================================
+# CALLBACK HM1: Home Page Live Data
+# One read of the precomputed dashboard snapshot per tick; the cards are only
+# re-sent when a writer has updated it since the browser's copy.
+# ============================================================================
+@dash.callback(
+    Output('home-quick-stats', 'children'),
+    Output('home-recent-activity', 'children'),
+    Output('home-snapshot-version', 'data'),
+    Input('home-snapshot-interval', 'n_intervals'),
+    State('home-snapshot-version', 'data'),
+    prevent_initial_call=True,
+)
+def refresh_home_snapshot(n_intervals, version):
+    snapshot = get_dashboard_snapshot()
+    if snapshot['updated_at'] == version:
+        raise PreventUpdate
+    return quick_stats_body(snapshot), recent_activity_body(snapshot), snapshot['updated_at']
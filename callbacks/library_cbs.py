@@ -0,0 +1,71 @@
+# foundry_dash/callbacks/library_cbs.py
+
+import dash
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+import math
+
+# --- CORE LOGIC IMPORTS ---
+from core.logic.library_query import query_library, top_runs
+from components.research_library_ui import TOP_RUNS_COUNT
+
+
+# ============================================================================
+# CALLBACK L1: Research Library Query (Server-side filter / sort / page)
+# Fires when the table mounts and on every page, sort or filter interaction;
+# only the requested page of rows is serialized back to the browser.
+# ============================================================================
+@dash.callback(
+    Output('research-results-table', 'data'),
+    Output('research-results-table', 'page_count'),
+    Output('library-status-alert', 'children'),
+    Input('research-results-table', 'page_current'),
+    Input('research-results-table', 'page_size'),
+    Input('research-results-table', 'sort_by'),
+    Input('research-results-table', 'filter_query'),
+)
+def update_research_results(page_current, page_size, sort_by, filter_query):
+    page, total = query_library(filter_query, sort_by, page_current or 0, page_size)
+
+    if total == 0:
+        message = "Showing 0 results. Run the Performance Engine first." if not filter_query else "No results match the current filter."
+        return [], 1, message
+
+    first = (page_current or 0) * page_size + 1
+    message = f"Showing {first}-{first + len(page) - 1} of {total:,} results."
+    return _table_records(page), max(1, math.ceil(total / page_size)), message
+
+
+def _table_records(page):
+    """Library rows as DataTable records (no fingerprints, ISO dates, 3 decimals)."""
+    page = page.drop(columns=['fingerprint'], errors='ignore')
+    for column in ('start_date', 'end_date'):
+        if column in page.columns:
+            page[column] = page[column].dt.strftime('%Y-%m-%d')
+    return page.round(3).to_dict('records')
+
+
+# ============================================================================
+# CALLBACK L2: Top Runs Shortcut
+# Answered from the metric indexes stored with each library partition: only
+# the index, the universe codes and the candidate rows are read, so "top 50 by
+# Sharpe in universe X" never loads or sorts the library. Any later page, sort
+# or filter interaction hands the table back to L1.
+# ============================================================================
+@dash.callback(
+    Output('research-results-table', 'data', allow_duplicate=True),
+    Output('research-results-table', 'page_count', allow_duplicate=True),
+    Output('library-status-alert', 'children', allow_duplicate=True),
+    Input('library-top-button', 'n_clicks'),
+    State('library-top-universe', 'value'),
+    State('library-top-metric', 'value'),
+    prevent_initial_call=True,
+)
+def show_top_runs(n_clicks, universe, metric):
+    if not n_clicks or not metric:
+        raise PreventUpdate
+    top = top_runs(metric, TOP_RUNS_COUNT, universes=[universe] if universe else None)
+    if top.empty:
+        return [], 1, "No results. Run the Performance Engine first."
+    scope = f" in {universe}" if universe else ""
+    return _table_records(top), 1, f"Top {len(top)} runs by {metric}{scope}."
@@ -0,0 +1,67 @@
+# foundry_dash/callbacks/screener_cbs.py
+
+import dash
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+import time
+
+# --- CORE LOGIC IMPORTS ---
+from core.io.data_persistence import get_universe_members, list_universe_names
+from core.logic.dashboard_snapshot import record_activity
+from core.logic.screener import SCREEN_PRESETS, ScreenRuleError, get_cross_section, run_screen
+
+
+# ============================================================================
+# CALLBACK S1: Populate Universe Selector (read fresh on every visit)
+# ============================================================================
+@dash.callback(
+    Output('screener-universe-selector', 'options'),
+    Input('url', 'pathname'),
+)
+def populate_screener_universes(pathname):
+    if pathname != '/screener':
+        raise PreventUpdate
+    return list_universe_names()
+
+
+# ============================================================================
+# CALLBACK S2: Run Scan
+# The selected rules compile into one boolean expression evaluated over the
+# universe's whole cross-section at once.
+# ============================================================================
+@dash.callback(
+    Output('screener-results-table', 'data'),
+    Output('screener-status', 'children'),
+    Output('screener-status', 'color'),
+    Input('run-screen-button', 'n_clicks'),
+    State('screener-universe-selector', 'value'),
+    State('screener-preset-selector', 'value'),
+    State('screener-custom-left', 'value'),
+    State('screener-custom-op', 'value'),
+    State('screener-custom-right', 'value'),
+    prevent_initial_call=True
+)
+def run_screener_scan(n_clicks, universe_name, presets, custom_left, custom_op, custom_right):
+    if not n_clicks:
+        raise PreventUpdate
+
+    rules = [rule for name in (presets or []) for rule in SCREEN_PRESETS.get(name, [])]
+    if custom_left and custom_op and custom_right not in (None, ''):
+        rules.append({'left': custom_left, 'op': custom_op, 'right': str(custom_right).strip()})
+
+    if not universe_name or not rules:
+        return [], "Choose a universe and at least one rule, then run the scan.", "warning"
+
+    tickers = get_universe_members(universe_name)
+    started = time.perf_counter()
+    try:
+        cross_section = get_cross_section(tickers)
+        matches = run_screen(cross_section, rules)
+    except ScreenRuleError as e:
+        return [], f"Invalid rule: {e}", "danger"
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    record_activity('screener', f"Screener scan on '{universe_name}': {len(matches)} signals")
+    rows = matches.round(2).reset_index().to_dict('records')
+    message = f"✅ {len(matches)} of {len(cross_section)} stocks in '{universe_name}' match {len(rules)} rules ({elapsed_ms:.0f} ms)"
+    return rows, message, "success"
@@ -0,0 +1,119 @@
+# foundry_dash/callbacks/strategy_cbs.py
+
+import dash
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+
+# --- CORE LOGIC IMPORTS ---
+from core.io.strategy_store import save_strategy
+from core.logic.backtest_engine import STRATEGY_PRESETS, dry_run_rule_graph
+from core.logic.dashboard_snapshot import record_activity
+from core.logic.rule_graph import RuleGraphError, compile_rule_graph, describe_graph, graph_hash
+from core.logic.strategy_sandbox import dry_run_strategy, source_hash
+
+
+# ============================================================================
+# CALLBACK SB1: Save Python Strategy (Coder's Pad)
+# Source is validated and test-run in a separate, time-limited process, so a
+# broken or hanging strategy can never stall this web worker.
+# ============================================================================
+@dash.callback(
+    Output('strategy-save-status', 'children'),
+    Input('save-strategy-button', 'n_clicks'),
+    State('strategy-name-input', 'value'),
+    State('strategy-coder-pad', 'value'),
+    prevent_initial_call=True
+)
+def save_python_strategy(n_clicks, name, source):
+    if not n_clicks:
+        raise PreventUpdate
+
+    name = (name or "").strip()
+    if not name or not (source or "").strip():
+        return dbc.Alert("Enter a strategy name and paste the strategy code.", color="warning")
+    if name in STRATEGY_PRESETS:
+        return dbc.Alert(f"'{name}' is a built-in preset name; choose another name.", color="warning")
+
+    error = dry_run_strategy(source)
+    if error:
+        return dbc.Alert(f"❌ Strategy rejected: {error}", color="danger")
+
+    save_strategy(name, {'type': 'python', 'source': source, 'hash': source_hash(source)})
+    record_activity('strategy', f"Strategy saved: '{name}' (Coder's Pad)")
+    return dbc.Alert(f"✅ '{name}' validated and saved. It is now available in the Performance Engine.", color="success")
+
+
+# ============================================================================
+# CALLBACK SB2: Add Rule Rows (Visual Rule Builder)
+# ============================================================================
+@dash.callback(
+    Output('entry-rules-table', 'data'),
+    Input('add-entry-rule-button', 'n_clicks'),
+    State('entry-rules-table', 'data'),
+    prevent_initial_call=True
+)
+def add_entry_rule(n_clicks, rows):
+    return (rows or []) + [{'left': 'close', 'op': '>', 'right': 'sma(50)'}]
+
+
+@dash.callback(
+    Output('exit-rules-table', 'data'),
+    Input('add-exit-rule-button', 'n_clicks'),
+    State('exit-rules-table', 'data'),
+    prevent_initial_call=True
+)
+def add_exit_rule(n_clicks, rows):
+    return (rows or []) + [{'left': 'close', 'op': '<', 'right': 'sma(50)'}]
+
+
+# ============================================================================
+# CALLBACK SB3: Save Rule Strategy (Visual Rule Builder)
+# Rules compile to a deduplicated expression DAG; the DAG (not code) is saved
+# and evaluated by the engine as array ops across all tickers at once.
+# ============================================================================
+@dash.callback(
+    Output('rules-save-status', 'children'),
+    Input('save-rules-strategy-button', 'n_clicks'),
+    State('rules-strategy-name-input', 'value'),
+    State('entry-rules-table', 'data'),
+    State('exit-rules-table', 'data'),
+    prevent_initial_call=True
+)
+def save_rules_strategy(n_clicks, name, entry_rows, exit_rows):
+    if not n_clicks:
+        raise PreventUpdate
+
+    name = (name or "").strip()
+    if not name:
+        return dbc.Alert("Enter a strategy name.", color="warning")
+    if name in STRATEGY_PRESETS:
+        return dbc.Alert(f"'{name}' is a built-in preset name; choose another name.", color="warning")
+
+    entry_rules, exit_rules = _complete_rows(entry_rows), _complete_rows(exit_rows)
+    try:
+        graph = compile_rule_graph(entry_rules, exit_rules)
+    except RuleGraphError as e:
+        return dbc.Alert(f"❌ Strategy rejected: {e}", color="danger")
+    error = dry_run_rule_graph(graph)
+    if error:
+        return dbc.Alert(f"❌ Strategy rejected: {error}", color="danger")
+
+    save_strategy(name, {
+        'type': 'rules',
+        'rules': {'entry': entry_rules, 'exit': exit_rules},
+        'graph': graph,
+        'hash': graph_hash(graph),
+    })
+    record_activity('strategy', f"Strategy saved: '{name}' (Rule Builder)")
+    summary = describe_graph(graph, len(entry_rules) + len(exit_rules))
+    return dbc.Alert(f"✅ '{name}' saved ({summary}). It is now available in the Performance Engine.", color="success")
+
+
+def _complete_rows(rows):
+    """Drops half-filled rows the user has not finished editing."""
+    return [
+        {'left': row['left'], 'op': row['op'], 'right': str(row['right']).strip()}
+        for row in (rows or [])
+        if row.get('left') and row.get('op') and str(row.get('right') or '').strip()
+    ]
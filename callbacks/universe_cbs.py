@@ -1,18 +1,21 @@
 # foundry_dash/callbacks/universe_cbs.py (FINAL FIX)
 
 import dash
-from dash import dcc, html, dash_table
+from dash import dcc, html
 from dash.dependencies import Input, Output, State
 from dash.exceptions import PreventUpdate
-from pathlib import Path
 import time
-import copy
+import math
 import pandas as pd 
 import dash_bootstrap_components as dbc
 
 # --- CORE LOGIC IMPORTS ---
-from core.io.data_persistence import save_universes, load_universes, get_all_known_tickers
-from core.logic.universe_helpers import apply_universe_changes, get_available_stocks, get_stock_details_df
+from core.io.data_persistence import (
+    create_universe, delete_universe, get_universe_members, list_universe_names, set_universe_members,
+)
+from core.logic.dashboard_snapshot import record_activity
+from core.logic.ticker_index import get_ticker_index
+from core.logic.universe_helpers import apply_universe_changes, get_stock_details_page, stock_details_provider
 
 # --- MODULAR UI IMPORTS (Used to render the content for each tab) ---
 from components.universe_manager_ui import layout as universe_manager_layout
@@ -82,30 +85,28 @@ def toggle_universe_manager_visibility(active_tab, pathname):
         return {'display': 'none'}
     
 # ============================================================================
-# CALLBACK 2 (REMOVED/ABSORBED): No longer a separate callback. The data 
-# loading logic is executed in 01_research_hub.py's initialization phase.
-# The `universe-data-store` is initialized directly from disk and is static.
+# CALLBACK 2 (REMOVED/ABSORBED): No longer a separate callback. Universes live
+# in the server-side repository (core.io.data_persistence); `universe-data-store`
+# only holds its revision token, which edits bump to re-fire dependent callbacks.
 # ============================================================================
 
 # ============================================================================
-# CALLBACK 3: Persistence Trigger (Saves the state to disk)
+# CALLBACK 3: Persistence Status (edits are persisted by the repository as
+# they are applied; this only reports the save)
 # ============================================================================
 @dash.callback(
     Output('status-output', 'children'),
     Input('save-trigger-store', 'data'),
-    State('universe-data-store', 'data'),
     State('research-hub-active-flag', 'data'), # <--- NEW ACTIVE FLAG STATE
     prevent_initial_call=True
 )
-def trigger_persistence_save(save_trigger_count, universe_data, is_active): # <--- NEW ARGUMENT
+def trigger_persistence_save(save_trigger_count, is_active): # <--- NEW ARGUMENT
     if not is_active: # <-- CHECK THE MASTER SWITCH
         raise PreventUpdate
         
     if save_trigger_count == 0:
         raise PreventUpdate
 
-    universes_path = Path('./data/universes.yaml') 
-    save_universes(universes_path, universe_data)
     return f"✅ Changes saved and persisted at {time.strftime('%H:%M:%S')}"
 
 
@@ -121,12 +122,12 @@ def trigger_persistence_save(save_trigger_count, universe_data, is_active): # <-
     
     Input('research-hub-load-trigger', 'data'), # <--- NEW: ONLY fires when the page is loaded
     Input('research-hub-tabs', 'value'), 
-    State('universe-data-store', 'data'),
+    Input('universe-data-store', 'data'), # revision token: re-lists names after a create/delete
     State('research-hub-active-flag', 'data'),
     State('selected-universe-name-store', 'data'),
     prevent_initial_call=True # <--- KEEP TRUE: Only run on trigger
 )
-def update_dropdown_options_delayed(load_trigger, active_tab, universe_data, is_active, selected_name): 
+def update_dropdown_options_delayed(load_trigger, active_tab, universe_revision, is_active, selected_name): 
     # Must use the Active Flag and Tab Gate
     if not is_active or active_tab != 'universe-manager-tab':
         raise PreventUpdate
@@ -135,7 +136,7 @@ def update_dropdown_options_delayed(load_trigger, active_tab, universe_data, is_
         raise PreventUpdate
     
     # ... (Rest of logic from old Callback 4 remains the same) ...
-    names = sorted(list(universe_data.keys()))
+    names = list_universe_names()
     new_selected_name = selected_name if selected_name in names else (names[0] if names else None)
 
     options = [{'label': n, 'value': n} for n in names]
@@ -163,6 +164,8 @@ def sync_dropdown_to_store(dropdown_value, is_active):
 
 # ============================================================================
 # CALLBACK 6a: Update Editor UI (Title and Dropdown Options)
+# The add dropdown only receives the first page of suggestions here; typing
+# fetches the top matches from the server-side ticker index (Callback 6c).
 # ============================================================================
 @dash.callback(
     Output('editing-title', 'children'),
@@ -175,21 +178,20 @@ def sync_dropdown_to_store(dropdown_value, is_active):
     Input('selected-universe-name-store', 'data'),  
     Input('universe-data-store', 'data'),   
     Input('url', 'pathname'), # <--- CORRECTLY ADDED INPUT        
-    State('global-known-tickers-store', 'data'),
     prevent_initial_call=True
 )
-def update_editor_ui_options(active_tab, selected_name, universe_data, pathname, all_known_tickers):
+def update_editor_ui_options(active_tab, selected_name, universe_revision, pathname):
     if pathname != '/research-hub':
         raise PreventUpdate
         
     if active_tab != 'universe-manager-tab':
         raise PreventUpdate
 
-    if selected_name is None or universe_data is None:
+    if selected_name is None:
         raise PreventUpdate
     
-    current_stocks = universe_data.get(selected_name, [])
-    available_to_add = get_available_stocks(current_stocks, all_known_tickers)
+    current_stocks = get_universe_members(selected_name)
+    available_to_add = get_ticker_index().search("", exclude=current_stocks)
     remove_options = current_stocks
     
     return (
@@ -202,52 +204,70 @@ def update_editor_ui_options(active_tab, selected_name, universe_data, pathname,
 
 
 # ============================================================================
-# CALLBACK 6b: Isolated Stock Viewer Table Update (Data Processing)
+# CALLBACK 6c: Search-driven Add Options
+# Returns only the top matches for the typed text, plus the values already
+# picked (a multi-select drops values that are missing from its options).
+# ============================================================================
+@dash.callback(
+    Output('stocks-to-add-dropdown', 'options', allow_duplicate=True),
+    Input('stocks-to-add-dropdown', 'search_value'),
+    State('stocks-to-add-dropdown', 'value'),
+    State('selected-universe-name-store', 'data'),
+    prevent_initial_call=True
+)
+def search_stocks_to_add(search_value, selected_values, selected_name):
+    if not search_value:
+        raise PreventUpdate
+
+    current_stocks = get_universe_members(selected_name) if selected_name else []
+    selected_values = selected_values or []
+    matches = get_ticker_index().search(search_value, exclude=set(current_stocks) | set(selected_values))
+    return selected_values + matches
+
+
+# ============================================================================
+# CALLBACK 6b: Isolated Stock Viewer Table Update (Server-side Paging)
+# Only the visible page of rows is computed and serialized; a universe switch
+# resets the table to its first page.
 # ============================================================================
 @dash.callback(
     Output('table-count', 'children'),
-    Output('stock-viewer-area', 'children'),
+    Output('current-universe-viewer-table', 'data'),
+    Output('current-universe-viewer-table', 'page_count'),
+    Output('current-universe-viewer-table', 'page_current'),
     Input('selected-universe-name-store', 'data'), 
     Input('universe-data-store', 'data'),
     Input('research-hub-tabs', 'value'),           
     Input('url', 'pathname'), # <--- CORRECTLY ADDED INPUT
+    Input('current-universe-viewer-table', 'page_current'),
+    Input('current-universe-viewer-table', 'sort_by'),
+    State('current-universe-viewer-table', 'page_size'),
     prevent_initial_call=True
 )
-def update_stock_viewer_table(selected_name, universe_data, active_tab, pathname):
+def update_stock_viewer_table(selected_name, universe_revision, active_tab, pathname, page_current, sort_by, page_size):
     if pathname != '/research-hub':
         raise PreventUpdate
         
     if active_tab != 'universe-manager-tab':
         raise PreventUpdate
 
-    if selected_name is None or universe_data is None:
+    if selected_name is None:
         raise PreventUpdate
 
-    current_stocks = universe_data.get(selected_name, [])
-    stock_details_df = get_stock_details_df(current_stocks)
-    
-    if stock_details_df.empty: 
-        viewer_table_data = []
-    else:
-        viewer_table_data = stock_details_df.to_dict('records')
-    
-    viewer_table = dash_table.DataTable(
-        id='current-universe-viewer-table', 
-        columns=[{"name": col, "id": col} for col in stock_details_df.columns],
-        data=viewer_table_data,# type: ignore
-        page_action='native',
-        page_size=12,
-        sort_action='native',
-        style_header={'backgroundColor': 'var(--bs-gray-200)', 'fontWeight': 'bold'},
-        style_data_conditional=[
-            {'if': {'column_id': 'Change (%)', 'filter_query': '{Change (%)} > 0.0'}, 'color': 'green'},
-            {'if': {'column_id': 'Change (%)', 'filter_query': '{Change (%)} < 0.0'}, 'color': 'red'},
-        ],# type: ignore
-    )
+    triggered = [t['prop_id'] for t in dash.callback_context.triggered]
+    if not any(t.startswith('current-universe-viewer-table.') for t in triggered):
+        page_current = 0
+
+    current_stocks = get_universe_members(selected_name)
+    page_size = page_size or 12
+    page_df = get_stock_details_page(current_stocks, page_current or 0, page_size, sort_by)
     
+    cache_stats = stock_details_provider.stats()
     return (
-        f"Stocks in Universe: {len(current_stocks)}",
-        viewer_table
+        f"Stocks in Universe: {len(current_stocks)} · details cache {cache_stats['hits']} hits / {cache_stats['misses']} misses",
+        page_df.to_dict('records'),
+        max(1, math.ceil(len(current_stocks) / page_size)),
+        page_current or 0,
     )
 
 
@@ -261,24 +281,22 @@ def update_stock_viewer_table(selected_name, universe_data, active_tab, pathname
     Input('create-universe-button', 'n_clicks'),
     Input('url', 'pathname'), # <--- CRITICAL FIX: ADDED INPUT
     State('new-universe-name-input', 'value'),
-    State('universe-data-store', 'data'),
     State('research-hub-tabs', 'value'), 
     prevent_initial_call=True
 )
-def create_new_universe(n_clicks, pathname, new_name, universe_data, active_tab): # <--- CRITICAL FIX: ADDED ARGUMENT
+def create_new_universe(n_clicks, pathname, new_name, active_tab): # <--- CRITICAL FIX: ADDED ARGUMENT
     if pathname != '/research-hub':
         raise PreventUpdate # <-- NEW GLOBAL GATE CHECK
 
     if active_tab != 'universe-manager-tab':
         raise PreventUpdate
         
-    if not n_clicks or not new_name or new_name in universe_data:
+    if not n_clicks or not new_name or new_name in list_universe_names():
         raise PreventUpdate
         
-    updated_universes = copy.deepcopy(universe_data)
-    updated_universes[new_name] = []
-    
-    return updated_universes, "", n_clicks
+    revision = create_universe(new_name)
+    record_activity('universe', f"Universe created: '{new_name}'")
+    return revision, "", n_clicks
 
 
 # ============================================================================
@@ -294,14 +312,13 @@ def create_new_universe(n_clicks, pathname, new_name, universe_data, active_tab)
     Input('save-changes-button', 'n_clicks'),
     Input('url', 'pathname'), # <--- CRITICAL FIX: ADDED INPUT
     State('selected-universe-name-store', 'data'),
-    State('universe-data-store', 'data'),
     State('stocks-to-add-dropdown', 'value'),
     State('stocks-to-remove-dropdown', 'value'),
     State('manual-stocks-textarea', 'value'),
     State('research-hub-tabs', 'value'), 
     prevent_initial_call=True
 )
-def save_universe_changes(n_clicks, pathname, selected_name, universe_data, stocks_to_add, stocks_to_remove, manual_stocks_text, active_tab): # <--- CRITICAL FIX: ADDED ARGUMENT
+def save_universe_changes(n_clicks, pathname, selected_name, stocks_to_add, stocks_to_remove, manual_stocks_text, active_tab): # <--- CRITICAL FIX: ADDED ARGUMENT
     if pathname != '/research-hub':
         raise PreventUpdate # <-- NEW GLOBAL GATE CHECK
         
@@ -311,18 +328,22 @@ def save_universe_changes(n_clicks, pathname, selected_name, universe_data, stoc
     if n_clicks is None or n_clicks == 0:
         raise PreventUpdate
 
+    if not selected_name or selected_name not in list_universe_names():
+        raise PreventUpdate
+
     stocks_to_add = stocks_to_add if stocks_to_add else []
     stocks_to_remove = stocks_to_remove if stocks_to_remove else []
     
-    updated_universes = apply_universe_changes(
-        current_universes=universe_data,
-        selected_universe=selected_name,
+    updated_stocks = apply_universe_changes(
+        current_stocks=get_universe_members(selected_name),
         stocks_to_add=stocks_to_add,
         stocks_to_remove=stocks_to_remove,
         manual_stocks_text=manual_stocks_text if manual_stocks_text else ""
     )
     
-    return updated_universes, n_clicks, [], [], ""
+    revision = set_universe_members(selected_name, updated_stocks)
+    record_activity('universe', f"Universe saved: '{selected_name}' ({len(updated_stocks)} stocks)")
+    return revision, n_clicks, [], [], ""
 
 
 # ============================================================================
@@ -373,11 +394,10 @@ def toggle_delete_modal(open_clicks, cancel_clicks, pathname, is_open, selected_
     Input('confirm-delete-button', 'n_clicks'), 
     Input('url', 'pathname'), # <--- CRITICAL FIX: ADDED INPUT
     State('selected-universe-name-store', 'data'),
-    State('universe-data-store', 'data'),
     State('research-hub-tabs', 'value'), 
     prevent_initial_call=True
 )
-def delete_universe_confirmed(n_clicks, pathname, selected_name, universe_data, active_tab): # <--- CRITICAL FIX: ADDED ARGUMENT
+def delete_universe_confirmed(n_clicks, pathname, selected_name, active_tab): # <--- CRITICAL FIX: ADDED ARGUMENT
     if pathname != '/research-hub':
         raise PreventUpdate # <-- NEW GLOBAL GATE CHECK
 
@@ -387,11 +407,10 @@ def delete_universe_confirmed(n_clicks, pathname, selected_name, universe_data,
     if not n_clicks:
         raise PreventUpdate
 
-    if selected_name in universe_data:
-        updated_universes = copy.deepcopy(universe_data)
-        del updated_universes[selected_name]
-        
-        return updated_universes, n_clicks, False 
+    if selected_name in list_universe_names():
+        revision = delete_universe(selected_name)
+        record_activity('universe', f"Universe deleted: '{selected_name}'")
+        return revision, n_clicks, False
         
     return dash.no_update, dash.no_update, False
 
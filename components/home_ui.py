@@ -0,0 +1,46 @@
+# foundry_dash/components/home_ui.py
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from dash import html
+import dash_bootstrap_components as dbc
+
+# Card bodies for the Home page's live data. Rendered from a dashboard snapshot
+# (core/logic/dashboard_snapshot.py) both by the page layout and by its polling
+# callback, so the first paint and every refresh look the same.
+
+ACTIVITY_ICONS = {
+    'engine': 'fa-gear',
+    'screener': 'fa-magnifying-glass-chart',
+    'universe': 'fa-layer-group',
+    'strategy': 'fa-code',
+}
+
+
+def quick_stats_body(snapshot: Dict[str, Any]) -> List:
+    stats = snapshot['stats']
+    updated = datetime.fromtimestamp(snapshot['updated_at']).strftime('%H:%M')
+    return [
+        html.H5("📊 QUICK STATS", className="card-title text-muted mb-3"),
+        dbc.Row([
+            dbc.Col(html.P(f"Strategies: {stats['strategies']}"), md=6),
+            dbc.Col(html.P(f"Universes: {stats['universes']}"), md=6),
+            dbc.Col(html.P(f"Library Size: {stats['library_size']:,} backtests"), md=12),
+            dbc.Col(html.P(f"Last Update: {updated}"), md=12, className="text-info small"),
+        ], className="g-1")  # g-1 for compact spacing
+    ]
+
+
+def recent_activity_body(snapshot: Dict[str, Any]) -> List:
+    items = [
+        html.Li([
+            html.I(className=f"fa-solid {ACTIVITY_ICONS.get(entry['kind'], 'fa-circle-dot')} me-2 text-info small"),
+            f"{entry['message']} ({datetime.fromtimestamp(entry['at']).strftime('%d %b %H:%M')})",
+        ], className="mb-1")
+        for entry in snapshot['activity']
+    ]
+    return [
+        html.H5("📚 RECENT ACTIVITY", className="card-title text-muted mb-3"),
+        html.Ul(items, className="list-unstyled small") if items else html.P("No activity yet.", className="small text-muted"),
+    ]
@@ -16,7 +16,12 @@ def layout() -> dbc.Card:
                 dbc.Col(dcc.Dropdown(id='engine-strategy-selector', placeholder="Select Strategy Presets", multi=True), md=4),
                 dbc.Col(dcc.Dropdown(id='engine-mode-selector', options=['update', 'full'], value='update', placeholder="Execution Mode"), md=4),
             ], className="mb-4 g-2"),
-            dbc.Button("🚀 Launch Engine", id='launch-engine-button', color="success", className="w-100"),
-            html.Div(id='engine-log-output', className="mt-4"),
+            dbc.Row([
+                dbc.Col(dbc.Button("🚀 Launch Engine", id='launch-engine-button', color="success", className="w-100"), md=9),
+                dbc.Col(dbc.Button("⛔ Cancel", id='cancel-engine-button', color="danger", outline=True, disabled=True, className="w-100"), md=3),
+            ], className="g-2"),
+            dbc.Progress(id='engine-progress-bar', value=0, striped=True, animated=True, className="mt-3"),
+            html.Div(id='engine-log-output', className="mt-3"),
+            html.Div(id='engine-result-output', className="mt-3"),
         ])
     ], className="mt-3")
\ No newline at end of file
@@ -1,18 +1,68 @@
 # foundry_dash/components/research_library_ui.py
 
-from dash import html, dash_table
+from dash import html, dcc, dash_table
 import dash_bootstrap_components as dbc
 
+from core.io.data_persistence import list_universe_names
+from core.io.library_store import INDEXED_METRICS
+from core.logic.backtest_engine import LIBRARY_COLUMNS
+
+# Text columns filter with `contains`; everything else is numeric (dates excepted).
+TEXT_COLUMNS = {"universe", "strategy", "ticker"}
+DATE_COLUMNS = {"start_date", "end_date"}
+LIBRARY_PAGE_SIZE = 15
+TOP_RUNS_COUNT = 50
+
+
+def _column_spec(column: str) -> dict:
+    if column in TEXT_COLUMNS:
+        return {"name": column, "id": column, "type": "text"}
+    if column in DATE_COLUMNS:
+        return {"name": column, "id": column, "type": "datetime"}
+    return {"name": column, "id": column, "type": "numeric"}
+
+
 def layout() -> dbc.Card:
     """The complete UI layout for the Research Library tab."""
-    # Renamed and self-contained
+    # Paging, sorting and filtering are all custom: the query runs server-side and
+    # only the visible page is sent to the browser.
+    display_columns = [c for c in LIBRARY_COLUMNS if c != "fingerprint"]
+    display_columns.insert(display_columns.index("ticker") + 1, "rs_rank")
+    columns = [_column_spec(c) for c in display_columns]
     return dbc.Card([
         dbc.CardHeader(html.H4("📚 Research Library", className="mb-0")),
         dbc.CardBody([
             html.P("Analyze backtest results, filter insights, and manage watchlists."),
+            dbc.Row([
+                dbc.Col(dcc.Dropdown(
+                    id='library-top-universe',
+                    options=list_universe_names(),  # type: ignore
+                    placeholder="All universes",
+                ), md=4),
+                dbc.Col(dcc.Dropdown(
+                    id='library-top-metric',
+                    options=INDEXED_METRICS,  # type: ignore
+                    value='sharpe',
+                    clearable=False,
+                ), md=3),
+                dbc.Col(dbc.Button(f"Top {TOP_RUNS_COUNT}", id='library-top-button', color="secondary"), md="auto"),
+            ], className="g-2 mb-3"),
             dbc.Alert("Showing 0 results. Run the Performance Engine first.", color="info", id='library-status-alert'),
             html.Div(id='library-data-table', children=[
-                dash_table.DataTable(id='research-results-table', data=[], columns=[], page_size=15)
+                dash_table.DataTable(
+                    id='research-results-table',
+                    data=[],
+                    columns=columns,  # type: ignore
+                    page_current=0,
+                    page_size=LIBRARY_PAGE_SIZE,
+                    page_action='custom',
+                    sort_action='custom',
+                    sort_mode='multi',
+                    sort_by=[],
+                    filter_action='custom',
+                    filter_query='',
+                    style_header={'backgroundColor': 'var(--bs-gray-200)', 'fontWeight': 'bold'},
+                )
             ]),
         ])
-    ], className="mt-3")
\ No newline at end of file
+    ], className="mt-3")
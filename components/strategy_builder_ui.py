@@ -1,9 +1,40 @@
 # foundry_dash/components/strategy_builder_ui.py
 
 import dash
-from dash import dcc, html
+from dash import dcc, html, dash_table
 import dash_bootstrap_components as dbc
 
+from core.logic.rule_graph import RULE_OPERATORS, RULE_TERMS
+
+CODER_PAD_TEMPLATE = """import numpy as np
+
+def signals(df):
+    # df: one ticker's OHLCV bars (open, high, low, close, volume).
+    # Return one target position per bar: 1 = long, 0 = flat.
+    sma = df['close'].rolling(50).mean()
+    return (df['close'] > sma).to_numpy()
+"""
+
+def rules_table(table_id: str, rules: list) -> dash_table.DataTable:
+    """Editable rule rows: term dropdown, operator dropdown, and a free-text right side (term or number)."""
+    return dash_table.DataTable(
+        id=table_id,
+        columns=[
+            {'name': 'Left', 'id': 'left', 'presentation': 'dropdown'},
+            {'name': 'Operator', 'id': 'op', 'presentation': 'dropdown'},
+            {'name': 'Right (term or number)', 'id': 'right'},
+        ],
+        data=rules,
+        editable=True,
+        row_deletable=True,
+        dropdown={
+            'left': {'options': [{'label': t, 'value': t} for t in RULE_TERMS], 'clearable': False},
+            'op': {'options': [{'label': o, 'value': o} for o in RULE_OPERATORS], 'clearable': False},
+        },
+        style_cell={'textAlign': 'left'},
+        css=[{'selector': '.Select-menu-outer', 'rule': 'display: block !important'}],
+    )
+
 def layout() -> dbc.Card:
     """The complete UI layout for the Strategy Builder tab."""
     # Renamed and self-contained
@@ -13,12 +44,40 @@ def layout() -> dbc.Card:
             html.P("Visually create and manage your trading strategies."),
             dcc.Tabs(id='strategy-builder-tabs', children=[
                 dcc.Tab(label="Visual Rule Builder", value='visual-tab', children=[
-                    dbc.Alert("Visualization logic will be migrated here.", color="info", className="mt-3"),
+                    dcc.Input(
+                        id='rules-strategy-name-input',
+                        placeholder="Strategy name, e.g. Golden_Cross_RSI",
+                        type='text',
+                        className="form-control mt-3"
+                    ),
+                    html.H6("Entry: go long when ALL of these hold", className="mt-3"),
+                    rules_table('entry-rules-table', [{'left': 'sma(50)', 'op': 'crosses above', 'right': 'sma(200)'}]),
+                    dbc.Button("+ Entry rule", id='add-entry-rule-button', color="link", size="sm"),
+                    html.H6("Exit: go flat when ALL of these hold (leave empty to hold only while entry holds)", className="mt-3"),
+                    rules_table('exit-rules-table', [{'left': 'sma(50)', 'op': 'crosses below', 'right': 'sma(200)'}]),
+                    dbc.Button("+ Exit rule", id='add-exit-rule-button', color="link", size="sm"),
+                    html.Small(
+                        "Terms: open, high, low, close, volume, or sma/ema/rsi/highest/lowest/roc(window), e.g. rsi(14).",
+                        className="text-muted d-block"
+                    ),
+                    dbc.Button(
+                        "💾 Save as Rule Strategy",
+                        id='save-rules-strategy-button',
+                        color="secondary",
+                        className="mt-3"
+                    ),
+                    html.Div(id='rules-save-status', className="mt-3"),
                 ]),
                 dcc.Tab(label="🐍 Python Coder's Pad", value='coder-tab', children=[
+                    dcc.Input(
+                        id='strategy-name-input',
+                        placeholder="Strategy name, e.g. Momentum_V3",
+                        type='text',
+                        className="form-control mt-3"
+                    ),
                     dcc.Textarea(
                         id='strategy-coder-pad',
-                        placeholder="Paste Python Strategy Code here...", 
+                        placeholder=CODER_PAD_TEMPLATE, 
                         rows=10, 
                         className="form-control mt-3"
                     ),
@@ -27,7 +86,8 @@ def layout() -> dbc.Card:
                         id='save-strategy-button',
                         color="secondary", 
                         className="mt-3"
-                    )
+                    ),
+                    html.Div(id='strategy-save-status', className="mt-3"),
                 ]),
             ])
         ])
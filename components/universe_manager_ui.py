@@ -4,7 +4,9 @@ import dash
 from dash import dcc, html, dash_table
 import dash_bootstrap_components as dbc
 # Ensure core logic is available only to the component that needs it
-from core.logic.universe_helpers import get_stock_details_df 
+from core.logic.universe_helpers import STOCK_DETAIL_COLUMNS
+
+STOCK_VIEWER_PAGE_SIZE = 12
 
 # --- Component Functions (Kept as internal helpers) ---
 
@@ -96,9 +98,8 @@ def _universe_editor_section() -> dbc.Card:
 
 def _stock_viewer_section() -> dbc.Card:
     """New section for professional stock viewing."""
-    # (Content remains identical to your original stock_viewer_section)
-    mock_df = get_stock_details_df([])
-    columns = [{"name": col, "id": col} for col in mock_df.columns]
+    # Custom paging/sorting: the callback computes and sends only the visible rows.
+    columns = [{"name": col, "id": col} for col in STOCK_DETAIL_COLUMNS]
     
     return dbc.Card([
         dbc.CardHeader(html.H4("Current Universe Stock Details", className="mb-0")),
@@ -106,7 +107,21 @@ def _stock_viewer_section() -> dbc.Card:
             html.P(id='table-count', className="card-text font-weight-bold mb-3"),
             
             html.Div(id='stock-viewer-area', children=[
-                 dash_table.DataTable(id='current-universe-viewer-table', columns=columns, data=[], page_size=12, sort_action='native') #type:ignore
+                 dash_table.DataTable(
+                     id='current-universe-viewer-table',
+                     columns=columns,
+                     data=[],
+                     page_current=0,
+                     page_size=STOCK_VIEWER_PAGE_SIZE,
+                     page_action='custom',
+                     sort_action='custom',
+                     sort_by=[],
+                     style_header={'backgroundColor': 'var(--bs-gray-200)', 'fontWeight': 'bold'},
+                     style_data_conditional=[
+                         {'if': {'column_id': 'Change (%)', 'filter_query': '{Change (%)} > 0.0'}, 'color': 'green'},
+                         {'if': {'column_id': 'Change (%)', 'filter_query': '{Change (%)} < 0.0'}, 'color': 'red'},
+                     ],
+                 ) #type:ignore
             ])
         ])
     ], className="h-100")
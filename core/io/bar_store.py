@@ -0,0 +1,114 @@
+# foundry_dash/core/io/bar_store.py
+
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import quote, unquote
+import numpy as np
+import pandas as pd
+
+# Layout: one directory per ticker, one raw .npy file per column:
+#   data/bars/NSE%3ARELIANCE-EQ/{date,open,high,low,close,volume}.npy
+# Reads memory-map the files, so a caller asking for the last 2 closes only
+# pages in those bytes instead of the whole history. Each ticker entry is a
+# symlink into data/bars/.versions/<ticker>/<version>/, replaced atomically on write.
+
+DEFAULT_BAR_STORE_ROOT = Path("./data/bars")
+BAR_COLUMNS = ["open", "high", "low", "close", "volume"]
+DATE_COLUMN = "date"
+VERSIONS_DIR = ".versions"
+
+
+def ticker_dir(ticker: str, root: Path = DEFAULT_BAR_STORE_ROOT) -> Path:
+    """Filesystem-safe, reversible directory name for a ticker (e.g. ':' is not valid on Windows)."""
+    return root / quote(ticker, safe="")
+
+
+def has_ticker(ticker: str, root: Path = DEFAULT_BAR_STORE_ROOT) -> bool:
+    return (ticker_dir(ticker, root) / f"{DATE_COLUMN}.npy").exists()
+
+
+def list_tickers(root: Path = DEFAULT_BAR_STORE_ROOT) -> List[str]:
+    """Returns every ticker that has bars in the store."""
+    if not root.exists():
+        return []
+    return sorted(
+        unquote(p.name) for p in root.iterdir()
+        if p.name != VERSIONS_DIR and ".link-" not in p.name and (p / f"{DATE_COLUMN}.npy").exists()
+    )
+
+
+def _version_root(ticker: str, root: Path) -> Path:
+    return root / VERSIONS_DIR / quote(ticker, safe="")
+
+
+def write_bars(ticker: str, bars: pd.DataFrame, root: Path = DEFAULT_BAR_STORE_ROOT):
+    """Writes a ticker's full history (date-indexed OHLCV frame), replacing any existing columns.
+
+    Columns are written into a new version directory, then the ticker's symlink is atomically
+    re-pointed at it (os.replace), so readers always find a complete history: never a mix of old
+    and new column files, and never a missing ticker. The previous version is kept for readers
+    still holding it; older ones are removed.
+    """
+    target = ticker_dir(ticker, root)
+    versions = _version_root(ticker, root)
+    version = versions / f"{time.time_ns()}-{os.getpid()}"
+    bars = bars[~bars.index.duplicated(keep="last")].sort_index()
+
+    version.mkdir(parents=True)
+    np.save(version / f"{DATE_COLUMN}.npy", bars.index.to_numpy(dtype="datetime64[D]"))
+    for column in BAR_COLUMNS:
+        np.save(version / f"{column}.npy", bars[column].to_numpy(dtype=np.float64))
+
+    previous = target.resolve() if target.is_symlink() else None
+    link = target.with_name(f"{target.name}.link-{os.getpid()}")
+    if link.is_symlink():
+        link.unlink()
+    link.symlink_to(os.path.relpath(version, target.parent), target_is_directory=True)
+    os.replace(link, target)
+
+    keep = {version.name, previous.name if previous else None}
+    for old in versions.iterdir():
+        if old.name not in keep:
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def read_dates(ticker: str, root: Path = DEFAULT_BAR_STORE_ROOT) -> np.ndarray:
+    """The ticker's memory-mapped date column (empty if not stored); its length and last date cost one page read."""
+    path = ticker_dir(ticker, root).resolve() / f"{DATE_COLUMN}.npy"
+    if not path.exists():
+        return np.empty(0, dtype="datetime64[D]")
+    return np.load(path, mmap_mode="r")
+
+
+def read_bars(
+    ticker: str,
+    columns: Optional[List[str]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    last_n: Optional[int] = None,
+    root: Path = DEFAULT_BAR_STORE_ROOT,
+) -> pd.DataFrame:
+    """Reads only the requested columns and date range of a ticker's bars via memory-mapped files.
+
+    `start`/`end` are inclusive dates; `last_n` keeps only the final n bars of that range.
+    Returns an empty frame if the ticker is not in the store.
+    """
+    # Resolve the symlink once, so every column comes from the same version.
+    folder = ticker_dir(ticker, root).resolve()
+    columns = columns or BAR_COLUMNS
+    if not (folder / f"{DATE_COLUMN}.npy").exists():
+        return pd.DataFrame(columns=columns)
+
+    dates = np.load(folder / f"{DATE_COLUMN}.npy", mmap_mode="r")
+    lo = int(np.searchsorted(dates, np.datetime64(start, "D"), side="left")) if start else 0
+    hi = int(np.searchsorted(dates, np.datetime64(end, "D"), side="right")) if end else len(dates)
+    if last_n is not None:
+        lo = max(lo, hi - last_n)
+
+    # Slicing a memmap only touches the pages for [lo, hi); np.array copies just that window.
+    data = {column: np.array(np.load(folder / f"{column}.npy", mmap_mode="r")[lo:hi]) for column in columns}
+    index = pd.DatetimeIndex(np.array(dates[lo:hi]).astype("datetime64[ns]"), name=DATE_COLUMN)
+    return pd.DataFrame(data, index=index)
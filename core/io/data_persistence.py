@@ -1,47 +1,121 @@
 # foundry_dash/core/io/data_persistence.py
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
-import yaml
+from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 
+from core.io.bar_store import DEFAULT_BAR_STORE_ROOT, list_tickers
+from core.io.library_store import load_library_store, save_library_store
+from core.io.universe_store import get_universe_store
+from core.logic.instruments import canonicalize_tickers, normalize_universes
+
 # Assume the actual file operations (yaml.safe_load, etc.) are wrapped 
 # in a separate data_io utility module that is accessible here.
 # We will mock the wrapper calls for this example.
 
+DEFAULT_UNIVERSES_PATH = Path("./data/universes.yaml")
+DEFAULT_UNIVERSE_NAME = "Nifty 50"
+
 def load_universes(path: Path) -> Dict[str, List[str]]:
-    """Loads stock universes from the YAML file."""
-    if not path.exists():
+    """Loads stock universes: the YAML snapshot plus any changes logged since it was written."""
+    store = get_universe_store(path)
+    if not path.exists() and not store.log_path.exists():
         # IMPORTANT: Return a valid structure with a default universe if file is missing
-        return {"Nifty 50": []}
+        return {DEFAULT_UNIVERSE_NAME: []}
     
     try:
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
-            # Ensure the structure is a dict, even if the file is empty
-            return data if isinstance(data, dict) else {"Nifty 50": []}
+        # NSE:TCS-EQ, BSE:TCS-EQ and TCS are one instrument: members are stored as canonical IDs.
+        return normalize_universes(store.load())
     except Exception as e:
         print(f"Error loading universes from {path}: {e}")
-        return {"Nifty 50": []}
+        return {DEFAULT_UNIVERSE_NAME: []}
+
+# --- Server-side Universe Repository ---
+# Callbacks read and edit universes here and keep only the revision token in
+# `universe-data-store`, so their payloads stay the same size however large the
+# universes grow. Edits persist immediately as change-log entries.
+def universe_revision(path: Path = DEFAULT_UNIVERSES_PATH) -> str:
+    """Version token of the persisted universes; changes on every edit (any process)."""
+    return get_universe_store(path).revision()
+
+def list_universe_names(path: Path = DEFAULT_UNIVERSES_PATH) -> List[str]:
+    """Sorted universe names (the default universe if none have been saved)."""
+    return get_universe_store(path).names() or [DEFAULT_UNIVERSE_NAME]
+
+def get_universe_members(name: str, path: Path = DEFAULT_UNIVERSES_PATH) -> List[str]:
+    """One universe's members as sorted canonical IDs ([] if it does not exist)."""
+    return sorted(canonicalize_tickers(get_universe_store(path).members(name)))
+
+def set_universe_members(name: str, stocks: List[str], path: Path = DEFAULT_UNIVERSES_PATH) -> str:
+    """Replaces one universe's members and returns the new revision."""
+    store = get_universe_store(path)
+    store.replace_members(name, sorted(canonicalize_tickers(stocks)))
+    return store.revision()
+
+def create_universe(name: str, path: Path = DEFAULT_UNIVERSES_PATH) -> str:
+    """Creates an empty universe (no-op if it exists) and returns the new revision."""
+    store = get_universe_store(path)
+    store.append([{"op": "create", "universe": name}])
+    return store.revision()
+
+def delete_universe(name: str, path: Path = DEFAULT_UNIVERSES_PATH) -> str:
+    """Deletes a universe and returns the new revision."""
+    store = get_universe_store(path)
+    store.append([{"op": "delete", "universe": name}])
+    return store.revision()
 
-def save_universes(path: Path, data: Dict[str, List[str]]):
-    """Saves the current stock universes dictionary to the YAML file."""
+# --- Performance Library Persistence ---
+# A directory of typed, strategy-partitioned columns (see core/io/library_store.py).
+DEFAULT_LIBRARY_PATH = Path("./data/performance_library")
+
+def load_library(
+    path: Path = DEFAULT_LIBRARY_PATH,
+    strategies: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Loads the Performance Library results table (empty frame if none has been built).
+
+    Pass `strategies`/`columns` to read only those partitions and columns.
+    """
+    try:
+        return load_library_store(path, strategies, columns)
+    except Exception as e:
+        print(f"Error loading performance library from {path}: {e}")
+        return pd.DataFrame()
+
+def save_library(path: Path, library: pd.DataFrame, curves: Optional[Dict[str, Dict[str, pd.DataFrame]]] = None):
+    """Saves the Performance Library results table, with the equity curves and trades of `curves`."""
     try:
-        # Ensure the parent directory exists before writing
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w') as f:
-            yaml.safe_dump(data, f, default_flow_style=False)
-        print(f"[I/O] Universes saved to disk successfully at {path}")
+        save_library_store(path, library, curves)
+        print(f"[I/O] Performance library saved ({len(library)} rows) at {path}")
     except Exception as e:
-        print(f"[I/O ERROR] Could not save universes to {path}: {e}")
+        print(f"[I/O ERROR] Could not save performance library to {path}: {e}")
+
+# --- Known Tickers ---
+# Seed list for a fresh install, before anything has been ingested into the bar store.
+SEED_TICKERS = [
+    "NSE:RELIANCE-EQ", "BSE:TCS-EQ", "NSE:INFY-EQ", "NSE:HDFCBANK",
+    "ADANIENT", "ASIANPAINT", "ICICIBANK", "KOTAKBANK", "MARUTI",
+    "WIPRO", "TECHM", "TITAN", "ULTRACEMCO", "HEROMOTOCO", "EICHERMOT",
+    "TCS", "SBIN", "BHARTIARTL",
+]
+
+# Read on interactive paths (ticker search, viewer), so the list is cached per
+# universe store version and bar-store directory mtime (which moves whenever a
+# ticker entry is added or rewritten).
+@lru_cache(maxsize=2)
+def _known_tickers(universes_path: Path, version: Tuple) -> Tuple[str, ...]:
+    members = {t for stocks in load_universes(universes_path).values() for t in (stocks or [])}
+    ingested = set(list_tickers())
+    return tuple(sorted(set(canonicalize_tickers(ingested | members | (set() if ingested else set(SEED_TICKERS))))))
+
+def known_tickers_version(universes_path: Path = DEFAULT_UNIVERSES_PATH) -> Tuple:
+    """Changes whenever get_all_known_tickers can change (a universe edit or a bar-store ticker entry)."""
+    bar_mtime = DEFAULT_BAR_STORE_ROOT.stat().st_mtime_ns if DEFAULT_BAR_STORE_ROOT.exists() else 0
+    return get_universe_store(universes_path).version(), bar_mtime
 
-# --- Utility to get Tickers (Replaces DataManagementState's all_known_tickers logic) ---
-def get_all_known_tickers() -> List[str]:
-    """Returns a placeholder list of all known tickers."""
+def get_all_known_tickers(universes_path: Path = DEFAULT_UNIVERSES_PATH) -> List[str]:
+    """Canonical IDs of every ticker with ingested bars plus every universe member (the seed list until data is ingested)."""
     # CRITICAL: Returning a simple list of strings ensures serialization works.
-    return [
-        "NSE:RELIANCE-EQ", "BSE:TCS-EQ", "NSE:INFY-EQ", "NSE:HDFCBANK", 
-        "ADANIENT", "ASIANPAINT", "ICICIBANK", "KOTAKBANK", "MARUTI",
-        "WIPRO", "TECHM", "TITAN", "ULTRACEMCO", "HEROMOTOCO", "EICHERMOT",
-        "TCS", "SBIN", "BHARTIARTL" # Added more to guarantee options
-    ]
\ No newline at end of file
+    return list(_known_tickers(universes_path, known_tickers_version(universes_path)))
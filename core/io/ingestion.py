@@ -0,0 +1,217 @@
+# foundry_dash/core/io/ingestion.py
+
+import argparse
+import asyncio
+import io
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
+import pandas as pd
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # only HttpBarFeed needs it; the local feed works without it
+    requests = None
+
+from core.io.bar_store import BAR_COLUMNS, DATE_COLUMN, DEFAULT_BAR_STORE_ROOT, read_bars, write_bars
+from core.io.data_persistence import DEFAULT_UNIVERSES_PATH, load_universes
+from core.io.market_data import get_synthetic_bars
+from core.io.shared_cache import BARS_GENERATION, bump_cache_generation
+
+# Refreshes the on-disk bar store for every ticker in every universe. Symbols are
+# fetched concurrently (bounded by a semaphore, over one pooled set of
+# connections), each fetch only asks for bars after the ticker's last stored
+# bar, and transient failures are retried per symbol with exponential backoff,
+# so one slow or failing symbol never holds up the rest of the batch.
+
+DEFAULT_CONCURRENCY = 32
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 0.5
+DEFAULT_FEED_ROOT = Path("./data/feed")
+
+
+class FeedError(RuntimeError):
+    """A fetch failed in a way worth retrying (timeouts, 5xx, throttling)."""
+
+
+class SymbolNotFoundError(FeedError):
+    """The feed does not know the symbol; retrying will not help."""
+
+
+# --- Feeds: blocking `fetch(ticker, start) -> OHLCV frame` (run on the pool's threads) ---
+class LocalFileBarFeed:
+    """Offline stand-in feed: one CSV of daily bars per ticker under `root` (see `build_fake_feed`).
+
+    `latency_seconds` and `failure_rate` simulate a remote API so concurrency and retries can be
+    exercised without a network.
+    """
+
+    def __init__(self, root: Path = DEFAULT_FEED_ROOT, latency_seconds: float = 0.0, failure_rate: float = 0.0):
+        self.root = root
+        self.latency_seconds = latency_seconds
+        self.failure_rate = failure_rate
+
+    def fetch(self, ticker: str, start: Optional[str] = None) -> pd.DataFrame:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise FeedError(f"simulated transient failure for {ticker}")
+        path = self.root / f"{quote(ticker, safe='')}.csv"
+        if not path.exists():
+            raise SymbolNotFoundError(f"{ticker} is not in the local feed")
+        bars = pd.read_csv(path, index_col=DATE_COLUMN, parse_dates=[DATE_COLUMN])
+        return bars.loc[start:] if start else bars
+
+
+class HttpBarFeed:
+    """Fetches CSV bars from `{base_url}/bars/{ticker}?start=YYYY-MM-DD` over a pooled HTTP session."""
+
+    def __init__(self, base_url: str, pool_size: int = DEFAULT_CONCURRENCY, timeout_seconds: float = 15.0):
+        if requests is None:
+            raise ImportError("HttpBarFeed requires the 'requests' package")
+        self.base_url = base_url.rstrip("/")
+        self.timeout_seconds = timeout_seconds
+        # One session shared by every worker thread: keep-alive connections are reused
+        # instead of opening a new TCP/TLS connection per symbol.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, ticker: str, start: Optional[str] = None) -> pd.DataFrame:
+        try:
+            response = self.session.get(
+                f"{self.base_url}/bars/{quote(ticker, safe='')}",
+                params={"start": start} if start else None,
+                timeout=self.timeout_seconds,
+            )
+        except requests.RequestException as e:
+            raise FeedError(str(e))
+        if response.status_code == 404:
+            raise SymbolNotFoundError(f"{ticker} is not known to the feed")
+        if response.status_code == 429 or response.status_code >= 500:
+            raise FeedError(f"HTTP {response.status_code} for {ticker}")
+        response.raise_for_status()
+        return pd.read_csv(io.StringIO(response.text), index_col=DATE_COLUMN, parse_dates=[DATE_COLUMN])
+
+
+def build_fake_feed(tickers: List[str], root: Path = DEFAULT_FEED_ROOT, end: Optional[str] = None):
+    """Writes deterministic synthetic bars for each ticker as the local feed's CSV files."""
+    root.mkdir(parents=True, exist_ok=True)
+    for ticker in tickers:
+        bars = get_synthetic_bars(ticker, end=end)
+        bars.index.name = DATE_COLUMN
+        bars.to_csv(root / f"{quote(ticker, safe='')}.csv", float_format="%.4f")
+    print(f"[I/O] Local feed written for {len(tickers)} tickers at {root}")
+
+
+# --- Ingestion ---
+def universe_tickers(universes_path: Path = DEFAULT_UNIVERSES_PATH) -> List[str]:
+    """Every distinct ticker across all universes."""
+    return sorted({t for stocks in load_universes(universes_path).values() for t in (stocks or [])})
+
+
+def _refresh_ticker(feed, ticker: str, root: Path) -> int:
+    """Fetches bars after the last stored bar and merges them in; returns the number of new bars."""
+    stored = read_bars(ticker, root=root)
+    start = None
+    if not stored.empty:
+        start = (stored.index[-1] + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    fresh = feed.fetch(ticker, start)
+    if fresh.empty:
+        return 0
+    fresh = fresh[BAR_COLUMNS]
+    write_bars(ticker, pd.concat([stored, fresh]) if not stored.empty else fresh, root=root)
+    return len(fresh)
+
+
+async def _refresh_with_retry(feed, ticker, root, executor, semaphore, max_retries, backoff_seconds):
+    """Returns (ticker, new bar count, error message or None); never raises, so one symbol cannot stop the batch."""
+    loop = asyncio.get_running_loop()
+    for attempt in range(max_retries + 1):
+        try:
+            async with semaphore:
+                return ticker, await loop.run_in_executor(executor, _refresh_ticker, feed, ticker, root), None
+        except SymbolNotFoundError as e:
+            return ticker, 0, str(e)
+        except FeedError as e:
+            if attempt == max_retries:
+                return ticker, 0, f"{e} (after {max_retries} retries)"
+        except Exception as e:
+            return ticker, 0, f"{type(e).__name__}: {e}"
+        # Exponential backoff with jitter, outside the semaphore so the slot goes to another symbol.
+        await asyncio.sleep(backoff_seconds * (2 ** attempt) * (1.0 + random.random()))
+
+
+async def ingest_async(
+    feed,
+    tickers: List[str],
+    root: Path = DEFAULT_BAR_STORE_ROOT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+    on_progress: Optional[Callable[[int, int, str], None]] = None,
+) -> Dict[str, Any]:
+    """Refreshes every ticker with at most `concurrency` fetches in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    report: Dict[str, Any] = {"updated": 0, "unchanged": 0, "bars": 0, "failed": {}}
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ingest") as executor:
+        jobs = [
+            _refresh_with_retry(feed, ticker, root, executor, semaphore, max_retries, backoff_seconds)
+            for ticker in tickers
+        ]
+        for done, job in enumerate(asyncio.as_completed(jobs), start=1):
+            ticker, new_bars, error = await job
+            if error:
+                report["failed"][ticker] = error
+                message = f"{ticker} failed: {error}"
+            elif new_bars:
+                report["updated"] += 1
+                report["bars"] += new_bars
+                message = f"{ticker}: +{new_bars} bars"
+            else:
+                report["unchanged"] += 1
+                message = f"{ticker}: up to date"
+            if on_progress:
+                on_progress(done, len(jobs), message)
+    if report["updated"]:
+        # New bars: caches derived from them (in any worker) must recompute.
+        bump_cache_generation(BARS_GENERATION)
+    return report
+
+
+def run_ingestion(
+    feed,
+    tickers: Optional[List[str]] = None,
+    root: Path = DEFAULT_BAR_STORE_ROOT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    **kwargs,
+) -> Dict[str, Any]:
+    """Synchronous entry point: refreshes `tickers` (default: every universe ticker) into the bar store."""
+    tickers = universe_tickers() if tickers is None else tickers
+    started = time.perf_counter()
+    report = asyncio.run(ingest_async(feed, tickers, root=root, concurrency=concurrency, **kwargs))
+    report["elapsed"] = round(time.perf_counter() - started, 2)
+    print(
+        f"[I/O] Ingested {len(tickers)} tickers in {report['elapsed']}s: {report['updated']} updated, "
+        f"{report['unchanged']} unchanged, {len(report['failed'])} failed ({report['bars']} new bars)"
+    )
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the local bar store for every universe ticker.")
+    parser.add_argument("--url", help="Base URL of an HTTP bar feed (default: the local file feed)")
+    parser.add_argument("--build-fake-feed", action="store_true", help="Write synthetic CSVs for the local feed first")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    args = parser.parse_args()
+
+    tickers = universe_tickers()
+    if args.build_fake_feed:
+        build_fake_feed(tickers)
+    feed = HttpBarFeed(args.url, pool_size=args.concurrency) if args.url else LocalFileBarFeed()
+    run_ingestion(feed, tickers, concurrency=args.concurrency)
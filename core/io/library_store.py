@@ -0,0 +1,345 @@
+# foundry_dash/core/io/library_store.py
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+import numpy as np
+import pandas as pd
+
+# Performance Library on disk: typed columns, partitioned by strategy.
+#
+#   data/performance_library/
+#     manifest.json                  {strategy: {"dir", "rows", "runs"}} - read for counts without loading data
+#     <quoted strategy>@<version>/
+#       categories.json              {"universe": [...], "ticker": [...]} - codes used by the columns below
+#       summary/<column>.npy         int32 universe/ticker codes, float32 metrics, int32 counts,
+#                                    datetime64[D] start/end dates, S40 fingerprints
+#       curves/dates.npy             datetime64[D] date axis shared by the partition's curves
+#       curves/equity.npy            float32 (bars, runs): one equity curve per ticker, NaN outside its history
+#       curves/tickers.json          ticker of each equity column
+#       trades/<column>.npy          int32 ticker codes (into curves/tickers.json), datetime64[D] entry/exit,
+#                                    float32 returns
+#       index/<metric>.npy           int32 row order by the metric, best first (NaN last)
+#
+# A run (strategy, ticker) is stored once however many universes list the ticker.
+# Readers memory-map the .npy files, so loading a few columns, one strategy's
+# partition or a few tickers' curves only pages in those bytes. A rewritten
+# partition goes into a new version directory and is only published by the
+# manifest, which names each strategy's current directory and is replaced with
+# one os.replace: readers see either the whole old library or the whole new one.
+# Directories of the previous manifest are kept for readers still holding it;
+# older ones are removed. A save only rewrites the partitions whose rows
+# changed, so the metric indexes are maintained incrementally: a
+# top-N query reads one index and the universe codes per partition, then just
+# the N candidate rows, instead of loading and sorting the library.
+
+MANIFEST_FILE = "manifest.json"
+FLOAT_COLUMNS = ["total_return", "cagr", "sharpe", "max_drawdown", "win_rate", "exposure"]
+INT_COLUMNS = ["trades", "bars"]
+DATE_COLUMNS = ["start_date", "end_date"]
+CODE_COLUMNS = ["universe", "ticker"]
+SUMMARY_COLUMNS = CODE_COLUMNS + FLOAT_COLUMNS + INT_COLUMNS + DATE_COLUMNS + ["fingerprint"]
+# Column order of a loaded table (the engine's LIBRARY_COLUMNS).
+TABLE_COLUMNS = [
+    "universe", "strategy", "ticker",
+    "total_return", "cagr", "sharpe", "max_drawdown", "win_rate", "trades", "exposure",
+    "bars", "start_date", "end_date", "fingerprint",
+]
+TRADE_COLUMNS = ["ticker", "entry_date", "exit_date", "return"]
+# Metrics with a precomputed row order (descending: the best run first, including for drawdown).
+INDEXED_METRICS = ["sharpe", "cagr", "total_return", "max_drawdown", "win_rate"]
+
+
+def _partition_name(strategy: str) -> str:
+    """A new version directory name for a strategy's partition (quoting leaves no '@' in the strategy part)."""
+    return f"{quote(strategy, safe='')}@{time.time_ns()}-{os.getpid()}"
+
+
+def read_manifest(root: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(root / MANIFEST_FILE, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def library_version(root: Path) -> Tuple:
+    """Changes whenever a save completes (the manifest is replaced last)."""
+    try:
+        stat = (root / MANIFEST_FILE).stat()
+        return stat.st_mtime_ns, stat.st_size
+    except FileNotFoundError:
+        return ()
+
+
+def library_run_count(root: Path) -> int:
+    """Number of stored (strategy, ticker) backtests, from the manifest alone."""
+    return sum(entry.get("runs", 0) for entry in read_manifest(root).values())
+
+
+def library_row_count(root: Path) -> int:
+    """Number of library rows (one per universe listing a run), from the manifest alone."""
+    return sum(entry.get("rows", 0) for entry in read_manifest(root).values())
+
+
+def list_library_strategies(root: Path) -> List[str]:
+    return sorted(read_manifest(root))
+
+
+# --- Writing ---
+def _row_keys(rows: pd.DataFrame) -> set:
+    return set(zip(rows["universe"].astype(str), rows["ticker"].astype(str), rows["fingerprint"].astype(str)))
+
+
+def _partition_unchanged(root: Path, strategy: str, rows: pd.DataFrame) -> bool:
+    """True when the stored partition holds exactly these runs (equal fingerprints mean equal results)."""
+    stored = load_library_store(root, [strategy], ["universe", "ticker", "fingerprint"])
+    return len(stored) == len(rows) and _row_keys(stored) == _row_keys(rows)
+
+
+def _codes(values: pd.Series) -> Tuple[np.ndarray, List[str]]:
+    categorical = pd.Categorical(values.astype(str))
+    return categorical.codes.astype(np.int32), [str(c) for c in categorical.categories]
+
+
+def _write_partition(
+    folder: Path,
+    rows: pd.DataFrame,
+    equity: Optional[pd.DataFrame],
+    trades: Optional[pd.DataFrame],
+):
+    (folder / "summary").mkdir(parents=True)
+    categories = {}
+    for column in CODE_COLUMNS:
+        codes, categories[column] = _codes(rows[column])
+        np.save(folder / "summary" / f"{column}.npy", codes)
+    for column in FLOAT_COLUMNS:
+        np.save(folder / "summary" / f"{column}.npy", rows[column].to_numpy(dtype=np.float32))
+    for column in INT_COLUMNS:
+        np.save(folder / "summary" / f"{column}.npy", rows[column].to_numpy(dtype=np.int32))
+    for column in DATE_COLUMNS:
+        np.save(folder / "summary" / f"{column}.npy", pd.to_datetime(rows[column]).to_numpy(dtype="datetime64[D]"))
+    np.save(folder / "summary" / "fingerprint.npy", rows["fingerprint"].astype(str).to_numpy(dtype="S40"))
+    with open(folder / "categories.json", "w") as f:
+        json.dump(categories, f)
+
+    (folder / "index").mkdir()
+    for metric in INDEXED_METRICS:
+        values = rows[metric].to_numpy(dtype=np.float32)
+        np.save(folder / "index" / f"{metric}.npy", np.argsort(-values, kind="stable").astype(np.int32))  # NaN sorts last
+
+    if equity is not None and not equity.empty:
+        (folder / "curves").mkdir()
+        np.save(folder / "curves" / "dates.npy", equity.index.to_numpy(dtype="datetime64[D]"))
+        np.save(folder / "curves" / "equity.npy", equity.to_numpy(dtype=np.float32))
+        with open(folder / "curves" / "tickers.json", "w") as f:
+            json.dump([str(t) for t in equity.columns], f)
+
+        if trades is not None and not trades.empty:
+            (folder / "trades").mkdir()
+            code_of = {ticker: i for i, ticker in enumerate(equity.columns)}
+            tickers = trades["ticker"].astype(str)
+            trades, tickers = trades[tickers.isin(code_of)], tickers[tickers.isin(code_of)]
+            np.save(folder / "trades" / "ticker.npy", tickers.map(code_of).to_numpy(dtype=np.int32))
+            for column in ("entry_date", "exit_date"):
+                np.save(folder / "trades" / f"{column}.npy", pd.to_datetime(trades[column]).to_numpy(dtype="datetime64[D]"))
+            np.save(folder / "trades" / "return.npy", trades["return"].to_numpy(dtype=np.float32))
+
+
+def save_library_store(
+    root: Path,
+    library: pd.DataFrame,
+    curves: Optional[Dict[str, Dict[str, pd.DataFrame]]] = None,
+):
+    """Writes the library table, plus curves/trades, partition by partition.
+
+    `curves` maps strategy -> {"equity": date x ticker frame, "trades": trade rows} for the runs
+    computed in this build; runs kept from the previous library keep their stored curves.
+    """
+    curves = curves or {}
+    root.mkdir(parents=True, exist_ok=True)
+    previous = read_manifest(root)
+    manifest = {}
+
+    for strategy, rows in library.groupby("strategy", sort=True, observed=True):
+        tickers = sorted(rows["ticker"].astype(str).unique())
+        if strategy not in curves and strategy in previous and _partition_unchanged(root, strategy, rows):
+            manifest[strategy] = previous[strategy]
+            continue
+        fresh = curves.get(strategy, {})
+        equity, trades = fresh.get("equity"), fresh.get("trades")
+
+        # Carry over stored curves for runs this build did not recompute.
+        fresh_tickers = set(equity.columns) if equity is not None else set()
+        kept = [t for t in tickers if t not in fresh_tickers]
+        if kept and strategy in previous:
+            old_equity = load_equity_curves(root, strategy, kept)
+            old_trades = load_trades(root, strategy, kept)
+            if not old_equity.empty:
+                equity = old_equity if equity is None else pd.concat([old_equity, equity], axis=1).sort_index()
+            if not old_trades.empty:
+                trades = old_trades if trades is None else pd.concat([old_trades, trades], ignore_index=True)
+        if equity is not None:
+            equity = equity.loc[:, [t for t in equity.columns if t in set(tickers)]]
+
+        name = _partition_name(strategy)
+        _write_partition(root / name, rows, equity, trades)
+        manifest[strategy] = {"dir": name, "rows": len(rows), "runs": len(tickers)}
+
+    # The single atomic step: every new partition becomes visible at once.
+    tmp_manifest = root / f"{MANIFEST_FILE}.tmp-{os.getpid()}"
+    with open(tmp_manifest, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_manifest, root / MANIFEST_FILE)
+
+    # Versions referenced by neither manifest (replaced two saves ago, dropped strategies, failed saves).
+    keep = {entry["dir"] for entry in manifest.values()} | {entry["dir"] for entry in previous.values()}
+    for folder in root.iterdir():
+        if folder.is_dir() and "@" in folder.name and folder.name not in keep:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+# --- Reading ---
+def _partition_dir(root: Path, strategy: str) -> Optional[Path]:
+    entry = read_manifest(root).get(strategy)
+    return root / entry["dir"] if entry else None
+
+
+def _read_rows(folder: Path, rows: Optional[np.ndarray], columns: List[str] = SUMMARY_COLUMNS) -> pd.DataFrame:
+    """Summary columns of one partition, for the given row positions (all rows if None)."""
+    with open(folder / "categories.json", "r") as f:
+        categories = json.load(f)
+    data = {}
+    for column in columns:
+        values = np.load(folder / "summary" / f"{column}.npy", mmap_mode="r")
+        values = np.asarray(values if rows is None else values[rows])
+        if column in CODE_COLUMNS:
+            data[column] = pd.Categorical.from_codes(values, categories[column])
+        elif column in DATE_COLUMNS:
+            data[column] = values.astype("datetime64[ns]")
+        elif column == "fingerprint":
+            data[column] = np.char.decode(values, "ascii")
+        else:
+            data[column] = values
+    return pd.DataFrame(data)
+
+
+def load_library_store(
+    root: Path,
+    strategies: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Library rows for the given strategies (all by default), reading only the requested columns.
+
+    universe/strategy/ticker come back as categoricals, metrics as float32.
+    """
+    manifest = read_manifest(root)
+    wanted = [c for c in SUMMARY_COLUMNS if columns is None or c in columns]
+    frames = []
+    for strategy in sorted(manifest if strategies is None else set(strategies) & set(manifest)):
+        frame = _read_rows(root / manifest[strategy]["dir"], None, wanted)
+        frame.insert(1 if "universe" in frame.columns else 0, "strategy", strategy)
+        frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame()
+    library = pd.concat(frames, ignore_index=True)
+    for column in ("universe", "strategy", "ticker"):
+        if column in library.columns:
+            library[column] = library[column].astype(str).astype("category")
+    return library[[c for c in TABLE_COLUMNS if c in library.columns]]
+
+
+def query_top_runs(
+    root: Path,
+    metric: str,
+    n: int = 50,
+    universes: Optional[List[str]] = None,
+    strategies: Optional[List[str]] = None,
+    ascending: bool = False,
+) -> pd.DataFrame:
+    """Top `n` library rows by an indexed metric, optionally within some universes and strategies.
+
+    Each partition contributes its first `n` matches from the stored order, so only the index,
+    the universe codes and the candidate rows are read; the candidates are then merged.
+    """
+    if metric not in INDEXED_METRICS:
+        raise KeyError(f"Not an indexed metric: {metric}")
+    manifest = read_manifest(root)
+    frames = []
+    for strategy in sorted(manifest if strategies is None else set(strategies) & set(manifest)):
+        folder = root / manifest[strategy]["dir"]
+        values = np.load(folder / "summary" / f"{metric}.npy", mmap_mode="r")
+        order = np.load(folder / "index" / f"{metric}.npy", mmap_mode="r")
+        order = np.asarray(order[::-1] if ascending else order)
+        order = order[np.isfinite(values[order])]
+        if universes is not None:
+            with open(folder / "categories.json", "r") as f:
+                categories = json.load(f)["universe"]
+            wanted = [code for code, name in enumerate(categories) if name in set(universes)]
+            codes = np.load(folder / "summary" / "universe.npy", mmap_mode="r")
+            order = order[np.isin(codes[order], wanted)]
+        picked = np.sort(order[:n])
+        if not len(picked):
+            continue
+        frame = _read_rows(folder, picked)
+        frame.insert(1, "strategy", strategy)
+        frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+    top = pd.concat(frames, ignore_index=True).sort_values(metric, ascending=ascending, kind="stable").head(n)
+    for column in ("universe", "strategy", "ticker"):
+        top[column] = top[column].astype(str).astype("category")
+    return top[TABLE_COLUMNS].reset_index(drop=True)
+
+
+def stored_curve_tickers(root: Path, strategy: str) -> List[str]:
+    """Tickers whose equity curve and trades are stored for a strategy."""
+    folder = _partition_dir(root, strategy)
+    try:
+        with open(folder / "curves" / "tickers.json", "r") as f:
+            return json.load(f)
+    except (TypeError, FileNotFoundError):
+        return []
+
+
+def load_equity_curves(root: Path, strategy: str, tickers: Optional[List[str]] = None) -> pd.DataFrame:
+    """Date x ticker float32 equity curves of one strategy; only the requested tickers' columns are copied."""
+    folder = _partition_dir(root, strategy)
+    if folder is None or not (folder / "curves" / "equity.npy").exists():
+        return pd.DataFrame()
+    with open(folder / "curves" / "tickers.json", "r") as f:
+        stored = json.load(f)
+    columns = list(range(len(stored))) if tickers is None else [i for i, t in enumerate(stored) if t in set(tickers)]
+    equity = np.load(folder / "curves" / "equity.npy", mmap_mode="r")
+    dates = np.load(folder / "curves" / "dates.npy")
+    return pd.DataFrame(
+        np.asarray(equity[:, columns]),
+        index=pd.DatetimeIndex(dates.astype("datetime64[ns]"), name="date"),
+        columns=[stored[i] for i in columns],
+    )
+
+
+def load_trades(root: Path, strategy: str, tickers: Optional[List[str]] = None) -> pd.DataFrame:
+    """Trade rows (ticker, entry_date, exit_date, return) of one strategy, optionally for some tickers only."""
+    folder = _partition_dir(root, strategy)
+    if folder is None or not (folder / "trades" / "ticker.npy").exists():
+        return pd.DataFrame(columns=TRADE_COLUMNS)
+    with open(folder / "curves" / "tickers.json", "r") as f:
+        stored = json.load(f)
+    codes = np.load(folder / "trades" / "ticker.npy", mmap_mode="r")
+    rows = np.arange(len(codes))
+    if tickers is not None:
+        wanted = [i for i, t in enumerate(stored) if t in set(tickers)]
+        rows = np.flatnonzero(np.isin(codes, wanted))
+    return pd.DataFrame({
+        "ticker": pd.Categorical.from_codes(np.asarray(codes[rows]), stored),
+        "entry_date": np.asarray(np.load(folder / "trades" / "entry_date.npy", mmap_mode="r")[rows]).astype("datetime64[ns]"),
+        "exit_date": np.asarray(np.load(folder / "trades" / "exit_date.npy", mmap_mode="r")[rows]).astype("datetime64[ns]"),
+        "return": np.asarray(np.load(folder / "trades" / "return.npy", mmap_mode="r")[rows]),
+    })
@@ -0,0 +1,99 @@
+# foundry_dash/core/io/market_data.py
+
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from core.io.bar_store import read_bars, read_dates, has_ticker
+
+# --- Placeholder price source (Used for tickers that are not in the bar store yet) ---
+# Histories start on a fixed date so a new trading day only appends a bar and
+# never rewrites the past; each field uses its own seeded stream for the same reason.
+SYNTHETIC_START_DATE = "2020-01-01"
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+def _ticker_seed(ticker: str) -> int:
+    return zlib.crc32(ticker.encode("utf-8"))
+
+
+@lru_cache(maxsize=8)
+def _trading_dates(end_date: pd.Timestamp) -> pd.DatetimeIndex:
+    return pd.bdate_range(SYNTHETIC_START_DATE, end_date, name="date")
+
+
+def get_synthetic_bars(ticker: str, end: Optional[str] = None) -> pd.DataFrame:
+    """Mocks a deterministic daily OHLCV history for a ticker."""
+    end_date = pd.Timestamp(end) if end else pd.Timestamp.today().normalize()
+    dates = _trading_dates(end_date)
+    n_bars = len(dates)
+    seed = _ticker_seed(ticker)
+
+    params_rng = np.random.default_rng([seed, 0])
+    drift = params_rng.uniform(-0.0002, 0.0008)
+    vol = params_rng.uniform(0.01, 0.03)
+    start_price = params_rng.uniform(100, 3000)
+
+    log_returns = np.random.default_rng([seed, 1]).normal(drift, vol, n_bars)
+    close = start_price * np.exp(np.cumsum(log_returns))
+    gap = np.random.default_rng([seed, 2]).normal(0.0, vol / 3, n_bars)
+    open_ = np.concatenate(([start_price], close[:-1])) * np.exp(gap)
+    span = np.abs(np.random.default_rng([seed, 3]).normal(0.0, vol / 2, n_bars))
+    high = np.maximum(open_, close) * np.exp(span)
+    low = np.minimum(open_, close) * np.exp(-span)
+    volume = np.random.default_rng([seed, 4]).lognormal(13.0, 0.4, n_bars).round()
+
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=dates,
+    )
+
+
+def load_bars(
+    ticker: str,
+    columns: Optional[List[str]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    last_n: Optional[int] = None,
+) -> pd.DataFrame:
+    """Single read path for bars: memory-mapped from the bar store, or the placeholder history if not ingested."""
+    if has_ticker(ticker):
+        return read_bars(ticker, columns, start, end, last_n)
+
+    bars = get_synthetic_bars(ticker).loc[start:end, columns or OHLCV_COLUMNS]
+    return bars.iloc[-last_n:] if last_n else bars
+
+
+def load_bar_dates(ticker: str) -> np.ndarray:
+    """A ticker's bar dates (datetime64[D]): memory-mapped from the bar store, or the placeholder calendar."""
+    if has_ticker(ticker):
+        return read_dates(ticker)
+    return _trading_dates(pd.Timestamp.today().normalize()).to_numpy(dtype="datetime64[D]")
+
+
+def load_field_panels(
+    tickers: List[str],
+    fields: List[str],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Returns {field: date x ticker frame} for several fields, reading each ticker's bars once."""
+    if not tickers:
+        return {field: pd.DataFrame() for field in fields}
+    bars = {ticker: load_bars(ticker, fields, start, end) for ticker in dict.fromkeys(tickers)}
+    return {
+        field: pd.concat({ticker: frame[field] for ticker, frame in bars.items()}, axis=1).sort_index()
+        for field in fields
+    }
+
+
+def load_price_panel(
+    tickers: List[str],
+    field: str = "close",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> pd.DataFrame:
+    """Returns one OHLCV field for many tickers as a date x ticker frame (NaN where a ticker has no bar)."""
+    return load_field_panels(tickers, [field], start, end)[field]
@@ -0,0 +1,31 @@
+# foundry_dash/core/io/shared_cache.py
+
+from pathlib import Path
+import diskcache
+
+# The one diskcache instance shared by the Dash background callback manager and
+# the app's data caches. Living in its own module lets core/ and callbacks/
+# import it without importing app.py (which would re-run the app setup).
+CACHE_DIR = Path("./cache/dash_cache")
+cache = diskcache.Cache(CACHE_DIR)
+
+# --- Versioned invalidation across worker processes ---
+# Each gunicorn worker keeps its own in-process tiers in front of this cache.
+# A writer bumps a namespace's generation here (an atomic increment in the
+# shared SQLite file); readers fold the generation into their keys and drop
+# their local tier when it moves, so every worker stops serving stale rows.
+BARS_GENERATION = "bars"
+
+
+def generation_key(namespace: str) -> str:
+    return f"generation:{namespace}"
+
+
+def cache_generation(namespace: str, store: diskcache.Cache = cache) -> int:
+    """Current generation of a namespace (0 until it is first bumped)."""
+    return store.get(generation_key(namespace), default=0)
+
+
+def bump_cache_generation(namespace: str, store: diskcache.Cache = cache) -> int:
+    """Invalidates everything cached under the namespace's current generation, in every process."""
+    return store.incr(generation_key(namespace), default=0)
@@ -0,0 +1,39 @@
+# foundry_dash/core/io/strategy_store.py
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict
+import yaml
+
+# Saved user strategies, keyed by name. Each entry records its type ("python" for
+# Coder's Pad strategies, "rules" for Visual Rule Builder expression graphs), the
+# definition and a content hash used for caching compiled code and for the
+# engine's incremental fingerprints.
+
+DEFAULT_STRATEGIES_PATH = Path("./data/strategies.yaml")
+
+
+def load_strategies(path: Path = DEFAULT_STRATEGIES_PATH) -> Dict[str, Dict[str, Any]]:
+    """Loads saved user strategies (empty dict if none have been saved)."""
+    if not path.exists():
+        return {}
+    try:
+        with open(path, 'r') as f:
+            data = yaml.safe_load(f)
+            return data if isinstance(data, dict) else {}
+    except Exception as e:
+        print(f"Error loading strategies from {path}: {e}")
+        return {}
+
+
+def save_strategy(name: str, entry: Dict[str, Any], path: Path = DEFAULT_STRATEGIES_PATH):
+    """Adds or replaces one saved strategy (written to a temp file, then atomically renamed)."""
+    strategies = load_strategies(path)
+    strategies[name] = dict(entry, saved_at=time.strftime('%Y-%m-%d %H:%M:%S'))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'w') as f:
+        yaml.safe_dump(strategies, f, default_flow_style=False, sort_keys=True)
+    os.replace(tmp_path, path)
+    print(f"[I/O] Strategy '{name}' saved at {path}")
@@ -0,0 +1,219 @@
+# foundry_dash/core/io/universe_store.py
+
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+import yaml
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process dev server, in-process lock only
+    fcntl = None
+
+# Universes persist as a YAML snapshot (data/universes.yaml) plus an
+# append-only change log next to it (universes.changes.jsonl). A save appends
+# one JSON line per change (add/remove members, create/delete a universe), so
+# it costs O(change) instead of rewriting every universe. Once the log is long
+# enough it is folded into a new snapshot, written to a temp file and swapped in
+# with an atomic rename, so a crash at any point leaves either the old or the
+# new snapshot intact.
+#
+# Replaying the log is idempotent (set-style ops), which is what makes
+# compaction crash-safe: if we die after the snapshot rename but before the
+# log is cleared, replaying the old log over the new snapshot is a no-op.
+
+COMPACT_AFTER_CHANGES = 500
+COMPACT_AFTER_BYTES = 1_000_000
+
+Change = Dict[str, Any]
+
+
+def apply_change(universes: Dict[str, List[str]], change: Change):
+    """Applies one logged change in place."""
+    op, name = change["op"], change["universe"]
+    if op == "create":
+        universes.setdefault(name, [])
+    elif op == "delete":
+        universes.pop(name, None)
+    elif op == "add":
+        members = universes.setdefault(name, [])
+        present = set(members)
+        members.extend(t for t in change["tickers"] if t not in present)
+    elif op == "remove":
+        removed = set(change["tickers"])
+        universes[name] = [t for t in universes.get(name, []) if t not in removed]
+
+
+def diff_universes(old: Dict[str, List[str]], new: Dict[str, List[str]]) -> List[Change]:
+    """Minimal change list turning `old` into `new`."""
+    changes: List[Change] = []
+    for name in old:
+        if name not in new:
+            changes.append({"op": "delete", "universe": name})
+    for name, stocks in new.items():
+        stocks = stocks or []
+        if name not in old:
+            changes.append({"op": "create", "universe": name})
+        before = set(old.get(name) or [])
+        added = [t for t in stocks if t not in before]
+        removed = sorted(before - set(stocks))
+        if added:
+            changes.append({"op": "add", "universe": name, "tickers": added})
+        if removed:
+            changes.append({"op": "remove", "universe": name, "tickers": removed})
+    return changes
+
+
+class UniverseStore:
+    """Snapshot + change-log persistence for one universes file, with an in-memory copy of the state."""
+
+    def __init__(self, snapshot_path: Path, compact_after_changes: int = COMPACT_AFTER_CHANGES):
+        self.snapshot_path = snapshot_path
+        self.log_path = snapshot_path.with_name(snapshot_path.stem + ".changes.jsonl")
+        self.lock_path = snapshot_path.with_name(snapshot_path.stem + ".lock")
+        self.compact_after_changes = compact_after_changes
+        self._lock = Lock()
+        self._state: Dict[str, List[str]] = {}
+        self._snapshot_stamp = None
+        self._log_offset = 0
+        self._log_changes = 0
+
+    # --- Cross-process locking (several server processes may share the files) ---
+    def _file_lock(self):
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(self.lock_path, "a")
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        return handle
+
+    def _stamp(self, path: Path):
+        try:
+            stat = path.stat()
+            return stat.st_mtime_ns, stat.st_size, stat.st_ino
+        except FileNotFoundError:
+            return None
+
+    def _refresh(self):
+        """Brings the in-memory state up to date, replaying only log lines appended since the last read."""
+        snapshot_stamp = self._stamp(self.snapshot_path)
+        if snapshot_stamp != self._snapshot_stamp:
+            data = None
+            if snapshot_stamp is not None:
+                with open(self.snapshot_path, "r") as f:
+                    data = yaml.safe_load(f)
+            self._state = {k: list(v or []) for k, v in data.items()} if isinstance(data, dict) else {}
+            self._snapshot_stamp = snapshot_stamp
+            self._log_offset = 0
+            self._log_changes = 0
+
+        if not self.log_path.exists():
+            self._log_offset = 0
+            return
+        if self.log_path.stat().st_size < self._log_offset:
+            # The log was cleared by a compaction in another process: start over from its snapshot.
+            self._snapshot_stamp = None
+            return self._refresh()
+        with open(self.log_path, "rb") as f:
+            f.seek(self._log_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn final line from a crashed writer: ignored until completed
+                self._log_offset += len(line)
+                try:
+                    apply_change(self._state, json.loads(line))
+                    self._log_changes += 1
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+    def version(self) -> Tuple:
+        """Changes whenever the persisted universes change (any process)."""
+        return self._stamp(self.snapshot_path), self._stamp(self.log_path)
+
+    def revision(self) -> str:
+        """Token naming the current persisted state; equal across processes for the same state."""
+        with self._lock:
+            self._refresh()
+            snapshot_ns = self._snapshot_stamp[0] if self._snapshot_stamp else 0
+            return f"{snapshot_ns}.{self._log_offset}"
+
+    def names(self) -> List[str]:
+        with self._lock:
+            self._refresh()
+            return sorted(self._state)
+
+    def members(self, name: str) -> List[str]:
+        with self._lock:
+            self._refresh()
+            return list(self._state.get(name) or [])
+
+    def load(self) -> Dict[str, List[str]]:
+        with self._lock:
+            self._refresh()
+            return {name: list(stocks) for name, stocks in self._state.items()}
+
+    def append(self, changes: List[Change]) -> int:
+        """Durably appends changes (one write + fsync) and compacts when the log is long."""
+        if not changes:
+            return 0
+        payload = "".join(json.dumps(change, separators=(",", ":")) + "\n" for change in changes).encode("utf-8")
+        with self._lock, self._file_lock():
+            self._refresh()
+            with open(self.log_path, "ab") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            self._refresh()
+            if self._log_changes >= self.compact_after_changes or self._log_offset >= COMPACT_AFTER_BYTES:
+                self._compact_locked()
+        return len(changes)
+
+    def save(self, universes: Dict[str, List[str]]) -> int:
+        """Persists the difference between the stored state and `universes`; returns the number of changes."""
+        with self._lock:
+            self._refresh()
+            changes = diff_universes(self._state, universes)
+        return self.append(changes)
+
+    def replace_members(self, name: str, stocks: List[str]) -> int:
+        """Sets one universe's members (creating it if needed), diffing only that universe."""
+        with self._lock:
+            self._refresh()
+            old = {name: self._state[name]} if name in self._state else {}
+            changes = diff_universes(old, {name: stocks})
+        return self.append(changes)
+
+    def compact(self):
+        with self._lock, self._file_lock():
+            self._refresh()
+            self._compact_locked()
+
+    def _compact_locked(self):
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            yaml.safe_dump(self._state, f, default_flow_style=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # Safe to clear only after the snapshot rename: until then the log is still needed.
+        with open(self.log_path, "wb") as f:
+            os.fsync(f.fileno())
+        self._snapshot_stamp = self._stamp(self.snapshot_path)
+        self._log_offset = 0
+        self._log_changes = 0
+        print(f"[I/O] Universe change log compacted into {self.snapshot_path}")
+
+
+_stores: Dict[Path, UniverseStore] = {}
+_stores_lock = Lock()
+
+
+def get_universe_store(path: Path) -> UniverseStore:
+    """One store per universes file per process, so its in-memory state is shared by all callers."""
+    key = Path(os.path.abspath(path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = UniverseStore(key)
+        return store
@@ -0,0 +1,566 @@
+# foundry_dash/core/logic/backtest_engine.py
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import numpy as np
+import pandas as pd
+
+from core.io.market_data import get_synthetic_bars, load_field_panels, load_price_panel
+from core.io.strategy_store import load_strategies
+from core.logic.indicators import indicator_cache, wilder_rsi
+from core.logic.parallel import chunk_list, default_worker_count, map_shards
+from core.logic.rule_graph import graph_fields, graph_hash
+from core.logic.strategy_sandbox import StrategyExecutionError, python_strategy_positions, source_hash
+from core.logic.telemetry import record_engine_cells
+
+# Every function in this module works on 2-D arrays shaped (bars, tickers):
+# one strategy is evaluated for a whole universe as column operations, and the
+# only Python-level loop is over the (few) selected strategies.
+
+TRADING_DAYS_PER_YEAR = 252
+DEFAULT_COST_BPS = 10.0
+# Bump when simulation/metric semantics change so `update` runs recompute every cell.
+ENGINE_VERSION = 1
+# Below this many tickers per shard, process start-up and pickling outweigh the parallel gain.
+MIN_SHARD_SIZE = 25
+
+LIBRARY_COLUMNS = [
+    "universe", "strategy", "ticker",
+    "total_return", "cagr", "sharpe", "max_drawdown", "win_rate", "trades", "exposure",
+    "bars", "start_date", "end_date", "fingerprint",
+]
+TRADE_COLUMNS = ["ticker", "entry_date", "exit_date", "return"]
+
+
+# --- Vectorized Building Blocks ---
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean along axis 0; NaN until `window` valid bars are available."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape, np.nan)
+    if window <= 0 or window > values.shape[0]:
+        return out
+
+    valid = ~np.isnan(values)
+    pad = np.zeros((1,) + values.shape[1:])
+    csum = np.concatenate([pad, np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    ccount = np.concatenate([pad, np.cumsum(valid, axis=0)])
+
+    window_sum = csum[window:] - csum[:-window]
+    window_count = ccount[window:] - ccount[:-window]
+    out[window - 1:] = np.where(window_count == window, window_sum / window, np.nan)
+    return out
+
+
+def rolling_extreme(values: np.ndarray, window: int, func: Callable = np.max) -> np.ndarray:
+    """Trailing max/min along axis 0 using a strided window view (no copies of the input)."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape, np.nan)
+    if window <= 0 or window > values.shape[0]:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+    out[window - 1:] = func(windows, axis=-1)
+    return out
+
+
+def shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Shifts along axis 0, filling the vacated rows with NaN."""
+    out = np.full(values.shape, np.nan)
+    if periods < values.shape[0]:
+        out[periods:] = values[:-periods] if periods else values
+    return out
+
+
+def forward_fill(values: np.ndarray, fill_value: float = 0.0) -> np.ndarray:
+    """Carries the last non-NaN value down each column (a vectorized state machine)."""
+    mask = ~np.isnan(values)
+    row_idx = np.where(mask, np.arange(values.shape[0])[:, None], 0)
+    np.maximum.accumulate(row_idx, axis=0, out=row_idx)
+    filled = np.take_along_axis(values, row_idx, axis=0)
+    return np.where(np.isnan(filled), fill_value, filled)
+
+
+# --- Strategy Presets (close matrix in, target position matrix of 0/1 out) ---
+def sma_crossover_positions(close: np.ndarray, fast: int, slow: int) -> np.ndarray:
+    return (rolling_mean(close, fast) > rolling_mean(close, slow)).astype(np.float64)
+
+
+def trend_filter_positions(close: np.ndarray, window: int) -> np.ndarray:
+    return (close > rolling_mean(close, window)).astype(np.float64)
+
+
+def breakout_positions(close: np.ndarray, entry: int, exit: int) -> np.ndarray:
+    """Enters on a close above the prior `entry`-bar high, exits below the prior `exit`-bar low."""
+    prior_high = shift(rolling_extreme(close, entry, np.max))
+    prior_low = shift(rolling_extreme(close, exit, np.min))
+    events = np.full(close.shape, np.nan)
+    events[close < prior_low] = 0.0
+    events[close > prior_high] = 1.0
+    return forward_fill(events)
+
+
+def roc_momentum_positions(close: np.ndarray, lookback: int) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (close / shift(close, lookback) - 1.0 > 0).astype(np.float64)
+
+
+SIGNAL_FUNCTIONS: Dict[str, Callable[..., np.ndarray]] = {
+    "sma_crossover": sma_crossover_positions,
+    "trend_filter": trend_filter_positions,
+    "breakout": breakout_positions,
+    "roc_momentum": roc_momentum_positions,
+}
+
+STRATEGY_PRESETS: Dict[str, Dict[str, Any]] = {
+    "SMA Crossover 20/50": {"signal": "sma_crossover", "params": {"fast": 20, "slow": 50}},
+    "SMA Crossover 50/200": {"signal": "sma_crossover", "params": {"fast": 50, "slow": 200}},
+    "Trend Filter 200": {"signal": "trend_filter", "params": {"window": 200}},
+    "Breakout 55/20": {"signal": "breakout", "params": {"entry": 55, "exit": 20}},
+    "ROC Momentum 63": {"signal": "roc_momentum", "params": {"lookback": 63}},
+}
+
+
+# --- Rule-Graph Strategies (Visual Rule Builder DAGs, see core/logic/rule_graph.py) ---
+def _ewm(values: np.ndarray, alpha: float) -> np.ndarray:
+    return pd.DataFrame(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def _roc(values: np.ndarray, window: int) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (values / shift(values, window) - 1.0) * 100
+
+
+# node op -> function(values of the input node, literal parameter). "highest"/"lowest" are
+# the PRIOR n-bar extremes (as in the breakout preset), so "close > highest(55)" can be true.
+WINDOWED_NODE_FUNCTIONS: Dict[str, Callable[[np.ndarray, int], np.ndarray]] = {
+    "sma": rolling_mean,
+    "ema": lambda values, window: _ewm(values, 2.0 / (window + 1)),
+    "rsi": wilder_rsi,
+    "highest": lambda values, window: shift(rolling_extreme(values, window, np.max)),
+    "lowest": lambda values, window: shift(rolling_extreme(values, window, np.min)),
+    "roc": _roc,
+    "shift": shift,
+}
+COMPARISON_NODE_FUNCTIONS: Dict[str, Callable[[Any, Any], np.ndarray]] = {
+    "gt": np.greater, "ge": np.greater_equal, "lt": np.less, "le": np.less_equal,
+}
+# Windowed nodes over a raw price field that the shared indicator cache can serve.
+CACHED_NODE_OPS = {"sma", "ema", "rsi"}
+
+# (op, field, window) -> (bars x tickers) matrix, or None to compute the node from the field matrix.
+IndicatorLookup = Callable[[str, str, int], Optional[np.ndarray]]
+
+
+def cached_indicator_lookup(close_panel: pd.DataFrame) -> IndicatorLookup:
+    """Serves sma/ema/rsi-of-a-field nodes from the indicator cache, aligned to the panel's dates."""
+    def lookup(op: str, field: str, window: int) -> Optional[np.ndarray]:
+        if op not in CACHED_NODE_OPS or (op == "rsi" and field != "close") or close_panel.empty:
+            return None
+        params = {"window": window} if field == "close" else {"window": window, "source": field}
+        return np.column_stack([
+            indicator_cache.get(ticker, op, params).reindex(close_panel.index).to_numpy(dtype=np.float64)
+            for ticker in close_panel.columns
+        ])
+    return lookup
+
+
+def evaluate_rule_graph(graph: Dict[str, Any], fields: Dict[str, np.ndarray], lookup: Optional[IndicatorLookup] = None) -> np.ndarray:
+    """Evaluates a rule DAG over (bars x tickers) field matrices and returns the position matrix.
+
+    Nodes are stored in topological order, so one forward pass computes every node exactly
+    once; shared subexpressions are therefore never recomputed. With a `lookup`, windowed
+    nodes that read a price field directly come from the indicator cache instead.
+    """
+    nodes = graph["nodes"]
+    values: List[Any] = []
+    with np.errstate(invalid="ignore"):
+        for op, *args in nodes:
+            if op == "field":
+                values.append(fields[args[0]])
+            elif op == "const":
+                values.append(float(args[0]))
+            elif op in WINDOWED_NODE_FUNCTIONS:
+                cached = None
+                if lookup is not None and nodes[args[0]][0] == "field":
+                    cached = lookup(op, nodes[args[0]][1], int(args[1]))
+                values.append(cached if cached is not None else WINDOWED_NODE_FUNCTIONS[op](values[args[0]], int(args[1])))
+            elif op in COMPARISON_NODE_FUNCTIONS:
+                values.append(COMPARISON_NODE_FUNCTIONS[op](values[args[0]], values[args[1]]))
+            elif op == "and":
+                values.append(np.logical_and.reduce([values[arg] for arg in args]))
+            elif op == "not":
+                values.append(np.logical_not(values[args[0]]))
+            else:
+                raise ValueError(f"Unknown rule graph node: {op!r}")
+
+    shape = fields["close"].shape
+    entry = np.broadcast_to(values[graph["entry"]], shape)
+    if graph.get("exit") is None:
+        return entry.astype(np.float64)
+    # Hold from an entry bar until an exit bar (entry wins when both fire on the same bar).
+    events = np.full(shape, np.nan)
+    events[np.broadcast_to(values[graph["exit"]], shape)] = 0.0
+    events[entry] = 1.0
+    return forward_fill(events)
+
+
+def rule_graph_positions(graph: Dict[str, Any], close_panel: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+    """Position matrix for a rule-graph strategy; extra price fields are loaded only if the graph reads them."""
+    fields = {"close": close}
+    extra = [field for field in graph_fields(graph) if field != "close"]
+    if extra:
+        start, end = close_panel.index[0].strftime("%Y-%m-%d"), close_panel.index[-1].strftime("%Y-%m-%d")
+        panels = load_field_panels(list(close_panel.columns), extra, start, end)
+        for field, panel in panels.items():
+            fields[field] = panel.reindex(index=close_panel.index, columns=close_panel.columns).to_numpy(dtype=np.float64)
+    return evaluate_rule_graph(graph, fields, cached_indicator_lookup(close_panel))
+
+
+def dry_run_rule_graph(graph: Dict[str, Any]) -> Optional[str]:
+    """Evaluates a compiled graph on sample bars; returns None on success or an error message.
+
+    Graphs are plain array ops, so this runs in-process (unlike the Coder's Pad dry run).
+    """
+    bars = get_synthetic_bars("DRY-RUN")
+    fields = {field: bars[[field]].to_numpy(dtype=np.float64) for field in graph_fields(graph)}
+    fields.setdefault("close", bars[["close"]].to_numpy(dtype=np.float64))
+    try:
+        positions = evaluate_rule_graph(graph, fields)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    if positions.shape != fields["close"].shape:
+        return f"Rules produced a {positions.shape} signal array for {fields['close'].shape} bars"
+    return None
+
+
+# --- Strategy Resolution (presets plus saved Coder's Pad and Rule Builder strategies) ---
+def list_strategy_names() -> List[str]:
+    """Every strategy the engine can run: built-in presets first, then saved user strategies."""
+    return list(STRATEGY_PRESETS) + sorted(n for n in load_strategies() if n not in STRATEGY_PRESETS)
+
+
+def resolve_strategy_specs(strategy_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Maps names to self-contained specs, resolved once in the parent and shipped to workers."""
+    saved = load_strategies()
+    specs = {}
+    for name in strategy_names:
+        if name in STRATEGY_PRESETS:
+            specs[name] = dict(STRATEGY_PRESETS[name], type="preset")
+        elif name in saved and saved[name].get("type") == "python":
+            source = saved[name]["source"]
+            specs[name] = {"type": "python", "source": source, "hash": source_hash(source)}
+        elif name in saved and saved[name].get("type") == "rules":
+            graph = saved[name]["graph"]
+            specs[name] = {"type": "rules", "graph": graph, "hash": graph_hash(graph)}
+        else:
+            raise KeyError(f"Unknown strategy: {name}")
+    return specs
+
+
+def build_positions(spec: Dict[str, Any], close_panel: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+    """Resolves a strategy spec to its position matrix for the given close panel."""
+    if spec["type"] == "python":
+        return python_strategy_positions(spec["source"], close_panel)
+    if spec["type"] == "rules":
+        # A broken graph must only drop its own cells, like a failing Coder's Pad strategy.
+        try:
+            return rule_graph_positions(spec["graph"], close_panel, close)
+        except Exception as e:
+            raise StrategyExecutionError(f"Rule graph failed: {type(e).__name__}: {e}")
+    return SIGNAL_FUNCTIONS[spec["signal"]](close, **spec["params"])
+
+
+# --- Simulation and Metrics ---
+def simulate_positions(close: np.ndarray, positions: np.ndarray, cost_bps: float = DEFAULT_COST_BPS) -> Dict[str, np.ndarray]:
+    """Turns target positions into per-bar strategy returns and equity curves (fills on the next bar)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bar_returns = np.zeros(close.shape)
+        bar_returns[1:] = close[1:] / close[:-1] - 1.0
+    bar_returns = np.nan_to_num(bar_returns, nan=0.0, posinf=0.0, neginf=0.0)
+
+    held = np.zeros(close.shape)
+    held[1:] = positions[:-1]
+    turnover = np.abs(np.diff(held, axis=0, prepend=0.0))
+
+    strategy_returns = held * bar_returns - turnover * (cost_bps / 10_000.0)
+    equity = np.cumprod(1.0 + strategy_returns, axis=0)
+    return {"returns": strategy_returns, "equity": equity, "held": held}
+
+
+def compute_metrics(close: np.ndarray, returns: np.ndarray, equity: np.ndarray, held: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-column summary statistics, computed without looping over tickers or trades."""
+    n_rows, n_cols = close.shape
+    valid = ~np.isnan(close)
+    bars = valid.sum(axis=0)
+    years = bars / TRADING_DAYS_PER_YEAR
+    final = equity[-1] if n_rows else np.ones(n_cols)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cagr = np.where(years > 0, np.maximum(final, 0.0) ** (1.0 / years) - 1.0, np.nan)
+        masked = np.where(valid, returns, np.nan)
+        mean = np.nanmean(masked, axis=0)
+        std = np.nanstd(masked, axis=0, ddof=1)
+        sharpe = np.where(std > 0, mean / std * np.sqrt(TRADING_DAYS_PER_YEAR), 0.0)
+        drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1.0
+
+    # Trades: label every in-position bar with its trade number, then sum log
+    # returns per (ticker, trade) in a single bincount.
+    entries = np.diff(held, axis=0, prepend=0.0) > 0
+    trades = entries.sum(axis=0)
+    trade_id = np.cumsum(entries, axis=0) * (held > 0)
+    win_rate = np.zeros(n_cols)
+    max_trades = int(trades.max()) if n_cols else 0
+    if max_trades:
+        in_trade = trade_id > 0
+        col_idx = np.broadcast_to(np.arange(n_cols), close.shape)[in_trade]
+        keys = col_idx * (max_trades + 1) + trade_id[in_trade]
+        trade_log = np.bincount(
+            keys, weights=np.log1p(returns[in_trade]), minlength=n_cols * (max_trades + 1)
+        ).reshape(n_cols, max_trades + 1)
+        numbered = np.arange(max_trades + 1)[None, :]
+        exists = (numbered >= 1) & (numbered <= trades[:, None])
+        wins = ((trade_log > 0) & exists).sum(axis=1)
+        win_rate = np.divide(wins, trades, out=np.zeros(n_cols), where=trades > 0)
+
+    return {
+        "total_return": final - 1.0,
+        "cagr": cagr,
+        "sharpe": sharpe,
+        "max_drawdown": drawdown.min(axis=0) if n_rows else np.zeros(n_cols),
+        "win_rate": win_rate,
+        "trades": trades,
+        "exposure": np.divide(held.sum(axis=0), bars, out=np.zeros(n_cols), where=bars > 0),
+        "bars": bars,
+    }
+
+
+def extract_trades(dates: pd.Index, tickers: np.ndarray, returns: np.ndarray, held: np.ndarray) -> pd.DataFrame:
+    """One row per completed or open trade (ticker, entry/exit date, compounded return), in exit-date order.
+
+    Same labelling as compute_metrics: each in-position bar gets its (ticker, trade number),
+    and per-trade log returns are summed in one bincount.
+    """
+    n_rows, n_cols = held.shape
+    entries = np.diff(held, axis=0, prepend=0.0) > 0
+    trade_id = np.cumsum(entries, axis=0) * (held > 0)
+    in_trade = trade_id > 0
+    if not in_trade.any():
+        return pd.DataFrame(columns=TRADE_COLUMNS)
+
+    max_trades = int(trade_id.max())
+    col_idx = np.broadcast_to(np.arange(n_cols), held.shape)[in_trade]
+    row_idx = np.broadcast_to(np.arange(n_rows)[:, None], held.shape)[in_trade]
+    keys = col_idx * (max_trades + 1) + trade_id[in_trade]
+    size = n_cols * (max_trades + 1)
+    log_growth = np.bincount(keys, weights=np.log1p(returns[in_trade]), minlength=size)
+    entry_row = np.full(size, n_rows)
+    np.minimum.at(entry_row, keys, row_idx)
+    exit_row = np.zeros(size, dtype=np.int64)
+    np.maximum.at(exit_row, keys, row_idx)
+
+    exists = np.flatnonzero(np.bincount(keys, minlength=size) > 0)
+    exists = exists[np.argsort(exit_row[exists], kind="stable")]
+    return pd.DataFrame({
+        "ticker": np.asarray(tickers)[exists // (max_trades + 1)],
+        "entry_date": dates[entry_row[exists]],
+        "exit_date": dates[exit_row[exists]],
+        "return": np.expm1(log_growth[exists]),
+    })
+
+
+def run_strategy_batch(
+    close_panel: pd.DataFrame,
+    specs: Dict[str, Dict[str, Any]],
+    cost_bps: float = DEFAULT_COST_BPS,
+    curves: Optional[Dict[str, Dict[str, pd.DataFrame]]] = None,
+) -> pd.DataFrame:
+    """Backtests every strategy spec against every column of a date x ticker close panel.
+
+    If `curves` is given, it also receives {strategy: {"equity": float32 date x ticker frame (NaN
+    outside each ticker's history), "trades": extract_trades rows}} for the Performance Library.
+    """
+    close = close_panel.to_numpy(dtype=np.float64)
+    valid = close_panel.notna()
+    start_dates = valid.idxmax().to_numpy()
+    end_dates = valid.iloc[::-1].idxmax().to_numpy()
+
+    frames = []
+    for name, spec in specs.items():
+        positions = build_positions(spec, close_panel, close)
+        simulated = simulate_positions(close, positions, cost_bps)
+        metrics = compute_metrics(close, **simulated)
+        if curves is not None:
+            curves[name] = {
+                "equity": pd.DataFrame(
+                    np.where(valid.to_numpy(), simulated["equity"], np.nan).astype(np.float32),
+                    index=close_panel.index, columns=close_panel.columns,
+                ),
+                "trades": extract_trades(close_panel.index, close_panel.columns.to_numpy(), simulated["returns"], simulated["held"]),
+            }
+        frame = pd.DataFrame(metrics)
+        frame.insert(0, "ticker", close_panel.columns.to_numpy())
+        frame.insert(0, "strategy", name)
+        frame["start_date"] = start_dates
+        frame["end_date"] = end_dates
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+# --- Incremental Build Support ---
+def strategy_fingerprint(spec: Dict[str, Any], cost_bps: float = DEFAULT_COST_BPS) -> str:
+    """Hashes everything that defines a strategy's results, so edited strategies are detected."""
+    definition = {k: v for k, v in spec.items() if k != "source"}  # python specs carry the source hash
+    payload = json.dumps(
+        {"engine": ENGINE_VERSION, "cost_bps": cost_bps, "strategy": definition},
+        sort_keys=True,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def cell_fingerprints(close_panel: pd.DataFrame, specs: Dict[str, Dict[str, Any]], cost_bps: float = DEFAULT_COST_BPS) -> pd.DataFrame:
+    """One fingerprint per (strategy, ticker) cell, covering the strategy and the ticker's close history.
+
+    The data key digests every (date, close) of the ticker, so an edited historical bar
+    invalidates its cells just like an appended one.
+    """
+    close = close_panel.to_numpy(dtype=np.float64)
+    dates = close_panel.index.to_numpy(dtype="datetime64[D]")
+    data_keys = []
+    for col, ticker in enumerate(close_panel.columns.astype(str)):
+        valid = ~np.isnan(close[:, col])
+        digest = hashlib.sha1(dates[valid].tobytes())
+        digest.update(np.ascontiguousarray(close[valid, col]).tobytes())
+        data_keys.append(f"{ticker}|{digest.hexdigest()}")
+
+    frames = []
+    for name, spec in specs.items():
+        strategy_key = strategy_fingerprint(spec, cost_bps)
+        frames.append(pd.DataFrame({
+            "strategy": name,
+            "ticker": close_panel.columns.to_numpy(),
+            "fingerprint": [hashlib.sha1(f"{strategy_key}|{key}".encode("utf-8")).hexdigest() for key in data_keys],
+        }))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["strategy", "ticker", "fingerprint"])
+
+
+def _concat_rows(frames: List[pd.DataFrame], columns: List[str]) -> pd.DataFrame:
+    """Concatenates result frames, skipping empty ones so they do not degrade column dtypes to object."""
+    frames = [frame for frame in frames if not frame.empty]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+
+
+def run_build_shard(
+    tickers: List[str],
+    specs: Dict[str, Dict[str, Any]],
+    known_fingerprints: Set[str],
+    cost_bps: float = DEFAULT_COST_BPS,
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, str], Dict[str, Dict[str, pd.DataFrame]]]:
+    """Worker entry point: loads one ticker shard and backtests the cells whose fingerprint is not known.
+
+    Returns (fresh result rows, fingerprints of every completed cell, {strategy: error}, equity
+    curves and trades of the fresh cells). A failing user strategy only drops its own cells; the
+    other strategies in the shard still complete.
+    """
+    close_panel = load_price_panel(tickers)
+    cells = cell_fingerprints(close_panel, specs, cost_bps)
+    stale = cells[~cells["fingerprint"].isin(known_fingerprints)]
+
+    fresh_frames, errors, curves = [], {}, {}
+    for name, group in stale.groupby("strategy", sort=False):
+        try:
+            fresh = run_strategy_batch(close_panel[group["ticker"].to_numpy()], {name: specs[name]}, cost_bps, curves)
+        except StrategyExecutionError as e:
+            errors[name] = str(e)
+            continue
+        fresh_frames.append(fresh.merge(group, on=["strategy", "ticker"]))
+    cells = cells[~cells["strategy"].isin(list(errors))]
+    return _concat_rows(fresh_frames, LIBRARY_COLUMNS[1:]), cells, errors, curves
+
+
+def _merge_curves(
+    shard_curves: List[Dict[str, Dict[str, pd.DataFrame]]],
+) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """Joins the shards' per-strategy equity frames (side by side) and trade lists (stacked)."""
+    merged = {}
+    for name in {name for curves in shard_curves for name in curves}:
+        parts = [curves[name] for curves in shard_curves if name in curves]
+        merged[name] = {
+            "equity": pd.concat([part["equity"] for part in parts], axis=1).sort_index(),
+            "trades": _concat_rows([part["trades"] for part in parts], TRADE_COLUMNS),
+        }
+    return merged
+
+
+def run_library_build(
+    universes: Dict[str, List[str]],
+    universe_names: List[str],
+    strategy_names: List[str],
+    mode: str = "full",
+    existing: Optional[pd.DataFrame] = None,
+    cost_bps: float = DEFAULT_COST_BPS,
+    max_workers: Optional[int] = None,
+    on_progress: Optional[Callable[[int, int, str], None]] = None,
+) -> Tuple[pd.DataFrame, Dict[str, int], Dict[str, Dict[str, pd.DataFrame]]]:
+    """Runs the strategy x universe batch and returns the library, computed/skipped/failed counts
+    and the equity curves and trades of the computed cells (see run_strategy_batch).
+
+    `full` recomputes every selected cell and replaces the library. `update` skips cells whose
+    fingerprint matches the existing library and merges the results into it. Tickers are sharded
+    across a process pool; `on_progress(done, total, message)` is called as each shard finishes.
+    """
+    membership = pd.DataFrame(
+        [(name, ticker) for name in universe_names for ticker in universes.get(name, [])],
+        columns=["universe", "ticker"],
+    ).drop_duplicates()
+    if membership.empty or not strategy_names:
+        library = existing if mode == "update" and existing is not None else pd.DataFrame(columns=LIBRARY_COLUMNS)
+        return library, {"computed": 0, "skipped": 0, "failed": 0}, {}
+
+    specs = resolve_strategy_specs(strategy_names)
+    incremental = mode == "update" and existing is not None and "fingerprint" in existing.columns
+    known = existing[["ticker", "fingerprint"]] if incremental else pd.DataFrame(columns=["ticker", "fingerprint"])
+
+    # Each ticker is simulated once, even if it belongs to several universes. Several
+    # shards per worker keep the pool busy when some shards finish early.
+    tickers = sorted(membership["ticker"].unique())
+    workers = max_workers or default_worker_count()
+    shards = chunk_list(tickers, max(1, min(workers * 4, len(tickers) // MIN_SHARD_SIZE)))
+    shard_args = [
+        (shard, specs, set(known.loc[known["ticker"].isin(shard), "fingerprint"]), cost_bps)
+        for shard in shards
+    ]
+
+    fresh_frames, cell_frames, curve_parts, failed = [], [], [], 0
+    for done, (index, (fresh, cells, errors, curves)) in enumerate(map_shards(run_build_shard, shard_args, workers), start=1):
+        fresh_frames.append(fresh)
+        cell_frames.append(cells)
+        curve_parts.append(curves)
+        failed += len(errors) * len(shards[index])
+        record_engine_cells(len(fresh))
+        if on_progress:
+            message = f"shard {index + 1}: {len(shards[index])} tickers, {len(fresh)}/{len(cells)} cells computed"
+            message += "".join(f" | ⚠️ {name} failed: {error}" for name, error in errors.items())
+            on_progress(done, len(shards), message)
+
+    fresh = _concat_rows(fresh_frames, LIBRARY_COLUMNS[1:])
+    cells = pd.concat(cell_frames, ignore_index=True)
+    cached = pd.DataFrame(columns=LIBRARY_COLUMNS[1:])
+    if incremental:
+        cached = (
+            existing[existing["fingerprint"].isin(cells["fingerprint"])]
+            .drop(columns=["universe"])
+            .drop_duplicates(subset=["strategy", "ticker"])
+        )
+
+    results = _concat_rows([cached, fresh], LIBRARY_COLUMNS[1:])
+    batch = membership.merge(results, on="ticker")[LIBRARY_COLUMNS]
+    stats = {"computed": len(fresh), "skipped": len(cells) - len(fresh), "failed": failed}
+    curves = _merge_curves(curve_parts)
+    if not incremental:
+        return batch, stats, curves
+
+    # Append: keep every existing row this run did not touch.
+    batch_keys = pd.MultiIndex.from_frame(batch[["universe", "strategy", "ticker"]])
+    existing_keys = pd.MultiIndex.from_frame(existing[["universe", "strategy", "ticker"]])
+    kept = existing[~existing_keys.isin(batch_keys)]
+    return pd.concat([kept, batch], ignore_index=True)[LIBRARY_COLUMNS], stats, curves
@@ -0,0 +1,58 @@
+# foundry_dash/core/logic/dashboard_snapshot.py
+
+import time
+from typing import Any, Dict
+
+from core.io.shared_cache import cache
+from core.logic.quick_stats import get_quick_stats, stats_version
+
+# The Home page's live data: quick-stat counts plus a feed of recent activity,
+# kept as ONE small dict in the shared diskcache. Writers (engine jobs, screener
+# scans, universe and strategy saves) append to the feed from any process. The
+# snapshot also records the versions of the files its counts came from; a read
+# only stats those files, and the counts are redone (inside the same cache
+# transaction as the write) when a version has moved, so changes made outside
+# the instrumented callbacks still show up. The Home page polls it on an
+# interval, so a refresh never reads the library, universes or strategies data.
+
+SNAPSHOT_KEY = "dashboard:snapshot"
+ACTIVITY_LIMIT = 8
+
+
+def _refresh_stats(snapshot: Dict[str, Any], version: tuple) -> Dict[str, Any]:
+    """Recounts the stats if the source files moved since the snapshot was taken (call inside a transaction)."""
+    if snapshot.get('version') != version:
+        snapshot['stats'] = dict(get_quick_stats())
+        snapshot['version'] = version
+        snapshot['updated_at'] = time.time()
+    return snapshot
+
+
+def get_dashboard_snapshot() -> Dict[str, Any]:
+    """{"stats": {...}, "activity": [{"at", "kind", "message"}, newest first], "updated_at", "version"}."""
+    version = stats_version()
+    snapshot = cache.get(SNAPSHOT_KEY)
+    if snapshot is not None and snapshot.get('version') == version:
+        return snapshot
+    with cache.transact():
+        snapshot = cache.get(SNAPSHOT_KEY) or {'activity': []}
+        snapshot = _refresh_stats(snapshot, version)
+        cache.set(SNAPSHOT_KEY, snapshot)
+    return snapshot
+
+
+def record_activity(kind: str, message: str):
+    """Adds an activity entry (and recounts stats whose sources changed); safe to call from any process.
+
+    Never raises: the action being reported has already happened.
+    """
+    try:
+        with cache.transact():
+            snapshot = cache.get(SNAPSHOT_KEY) or {'activity': []}
+            snapshot = _refresh_stats(snapshot, stats_version())
+            now = time.time()
+            snapshot['activity'] = [{'at': now, 'kind': kind, 'message': message}] + snapshot['activity'][:ACTIVITY_LIMIT - 1]
+            snapshot['updated_at'] = now
+            cache.set(SNAPSHOT_KEY, snapshot)
+    except Exception as e:
+        print(f"[ACTIVITY] Could not record '{message}': {e}")
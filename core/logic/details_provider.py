@@ -0,0 +1,135 @@
+# foundry_dash/core/logic/details_provider.py
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import diskcache
+
+from core.io.shared_cache import bump_cache_generation, cache_generation
+
+# Two-tier per-ticker cache for the universe viewer rows:
+#   1. an in-process LRU (OrderedDict) with a TTL per entry, and
+#   2. the shared diskcache, so other workers and background jobs reuse results.
+# A row is only recomputed when both tiers miss or have expired.
+#
+# With several workers, the shared keys carry the generations of this cache and
+# of the data it depends on (e.g. the bar store). At most once per
+# `generation_check_seconds`, a worker re-reads them and drops its local tier if
+# any moved, so an invalidation or an ingestion run in one process reaches all.
+
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_GENERATION_CHECK_SECONDS = 1.0
+
+
+class StockDetailsProvider:
+    """Serves per-ticker detail rows (price, change %, RS ranking, signal) from a TTL + LRU cache."""
+
+    def __init__(
+        self,
+        loader: Callable[[str], Dict[str, Any]],
+        cache: Optional[diskcache.Cache] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        namespace: str = "stock-details",
+        depends_on: Sequence[str] = (),
+        generation_check_seconds: float = DEFAULT_GENERATION_CHECK_SECONDS,
+    ):
+        self._loader = loader
+        self._cache = cache
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._namespace = namespace
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self._generation_namespaces = (namespace, *depends_on)
+        self._generation_check_seconds = generation_check_seconds
+        self._generation: Tuple[int, ...] = ()
+        self._generation_checked_at = float("-inf")
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, ticker: str) -> str:
+        generation = ".".join(map(str, self._generation))
+        return f"{self._namespace}:{generation}:{ticker}"
+
+    def _sync_generation(self, now: float):
+        """Drops the local tier when another process has bumped one of our generations."""
+        if self._cache is None or now - self._generation_checked_at < self._generation_check_seconds:
+            return
+        generation = tuple(cache_generation(n, self._cache) for n in self._generation_namespaces)
+        with self._lock:
+            if generation != self._generation:
+                self._local.clear()
+                self._generation = generation
+            self._generation_checked_at = now
+
+    def _get_local(self, ticker: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._local.get(ticker)
+            if entry is None:
+                return None
+            expires_at, row = entry
+            if expires_at < now:
+                del self._local[ticker]
+                return None
+            self._local.move_to_end(ticker)
+            return row
+
+    def _put_local(self, ticker: str, row: Dict[str, Any], expires_at: float):
+        with self._lock:
+            self._local[ticker] = (expires_at, row)
+            self._local.move_to_end(ticker)
+            while len(self._local) > self._max_entries:
+                self._local.popitem(last=False)
+
+    def get(self, ticker: str) -> Dict[str, Any]:
+        """Returns the detail row for one ticker, computing it only on a miss in both tiers."""
+        now = time.time()
+        self._sync_generation(now)
+        row = self._get_local(ticker, now)
+        if row is not None:
+            self.hits += 1
+            return row
+
+        if self._cache is not None:
+            row, expires_at = self._cache.get(self._key(ticker), default=None, expire_time=True)
+            if row is not None:
+                self.hits += 1
+                self._put_local(ticker, row, expires_at or now + self._ttl)
+                return row
+
+        self.misses += 1
+        row = self._loader(ticker)
+        if self._cache is not None:
+            self._cache.set(self._key(ticker), row, expire=self._ttl)
+        self._put_local(ticker, row, now + self._ttl)
+        return row
+
+    def get_many(self, tickers: List[str]) -> List[Dict[str, Any]]:
+        return [self.get(ticker) for ticker in tickers]
+
+    def invalidate(self, tickers: Optional[List[str]] = None):
+        """Drops cached rows for the given tickers; with None, bumps the generation so every worker drops all rows."""
+        with self._lock:
+            if tickers is None:
+                self._local.clear()
+                self._generation_checked_at = float("-inf")
+                if self._cache is not None:
+                    bump_cache_generation(self._namespace, self._cache)
+                return
+            for ticker in tickers:
+                self._local.pop(ticker, None)
+        if self._cache is not None:
+            for ticker in tickers:
+                self._cache.delete(self._key(ticker))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "local_entries": len(self._local),
+        }
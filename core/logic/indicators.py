@@ -0,0 +1,239 @@
+# foundry_dash/core/logic/indicators.py
+
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import diskcache
+
+from core.io.market_data import load_bar_dates, load_bars
+from core.io.shared_cache import BARS_GENERATION, cache, cache_generation
+
+# Per-ticker indicator series shared by the screener, the viewer's Signal column
+# and rule-graph strategies. Each series is cached under (ticker, indicator,
+# params, last-bar date, bar store generation). A lookup first checks the
+# memory-mapped date column (its length and last entry), so a hit reads no bar
+# history at all. When new bars arrive, the series' previous entry is extended
+# using only the new bars plus a small carried state, instead of recomputed.
+
+INDICATOR_CACHE_PREFIX = "indicator"
+INDICATOR_CACHE_TTL_SECONDS = 7 * 24 * 3600
+LOCAL_MAX_ENTRIES = 4096
+
+State = Dict[str, Any]
+
+
+# --- Full computations (return the series plus the state needed to extend it) ---
+def _sma_full(inputs: Dict[str, np.ndarray], window: int, source: str = "close") -> Tuple[np.ndarray, State]:
+    values = inputs[source]
+    out = pd.Series(values).rolling(window).mean().to_numpy()
+    return out, {"tail": values[-(window - 1):] if window > 1 else values[:0]}
+
+
+def _sma_extend(inputs: Dict[str, np.ndarray], state: State, window: int, source: str = "close") -> Tuple[np.ndarray, State]:
+    values = np.concatenate([state["tail"], inputs[source]])
+    out = pd.Series(values).rolling(window).mean().to_numpy()[len(state["tail"]):]
+    return out, {"tail": values[-(window - 1):] if window > 1 else values[:0]}
+
+
+def _recursive_extend(values: np.ndarray, previous: float, alpha: float) -> np.ndarray:
+    """y[t] = alpha * x[t] + (1 - alpha) * y[t-1], continued from `previous` (new bars only, so short)."""
+    out = np.empty(len(values))
+    for i, value in enumerate(values):
+        previous = alpha * value + (1.0 - alpha) * previous
+        out[i] = previous
+    return out
+
+
+def _ema_full(inputs: Dict[str, np.ndarray], window: int, source: str = "close") -> Tuple[np.ndarray, State]:
+    out = pd.Series(inputs[source]).ewm(span=window, adjust=False).mean().to_numpy()
+    return out, {"last": float(out[-1])}
+
+
+def _ema_extend(inputs: Dict[str, np.ndarray], state: State, window: int, source: str = "close") -> Tuple[np.ndarray, State]:
+    out = _recursive_extend(inputs[source], state["last"], 2.0 / (window + 1))
+    return out, {"last": float(out[-1])}
+
+
+def _wilder_averages(close: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilder-smoothed average gain and loss along axis 0 (1-D series or a bars x tickers matrix)."""
+    delta = np.diff(close, axis=0, prepend=close[:1])
+    gains = pd.DataFrame(np.clip(delta, 0, None)).ewm(alpha=1.0 / window, adjust=False).mean()
+    losses = pd.DataFrame(np.clip(-delta, 0, None)).ewm(alpha=1.0 / window, adjust=False).mean()
+    return gains.to_numpy().reshape(close.shape), losses.to_numpy().reshape(close.shape)
+
+
+def wilder_rsi(close: np.ndarray, window: int) -> np.ndarray:
+    """Wilder RSI along axis 0; NaN for the first `window` bars. The one RSI definition in the app."""
+    out = _rsi_from_averages(*_wilder_averages(np.asarray(close, dtype=np.float64), window))
+    out[:window] = np.nan
+    return out
+
+
+def _rsi_full(inputs: Dict[str, np.ndarray], window: int) -> Tuple[np.ndarray, State]:
+    close = inputs["close"]
+    avg_gain, avg_loss = _wilder_averages(close, window)
+    out = _rsi_from_averages(avg_gain, avg_loss)
+    out[:window] = np.nan
+    return out, {"avg_gain": float(avg_gain[-1]), "avg_loss": float(avg_loss[-1]), "last_close": float(close[-1])}
+
+
+def _rsi_extend(inputs: Dict[str, np.ndarray], state: State, window: int) -> Tuple[np.ndarray, State]:
+    close = inputs["close"]
+    delta = np.diff(close, prepend=state["last_close"])
+    avg_gain = _recursive_extend(np.clip(delta, 0, None), state["avg_gain"], 1.0 / window)
+    avg_loss = _recursive_extend(np.clip(-delta, 0, None), state["avg_loss"], 1.0 / window)
+    out = _rsi_from_averages(avg_gain, avg_loss)
+    return out, {"avg_gain": float(avg_gain[-1]), "avg_loss": float(avg_loss[-1]), "last_close": float(close[-1])}
+
+
+def _rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+    return np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + rs))
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray, prev_close: float) -> np.ndarray:
+    prior = np.concatenate([[prev_close], close[:-1]])
+    return np.maximum(high - low, np.maximum(np.abs(high - prior), np.abs(low - prior)))
+
+
+def _atr_full(inputs: Dict[str, np.ndarray], window: int) -> Tuple[np.ndarray, State]:
+    close = inputs["close"]
+    true_range = _true_range(inputs["high"], inputs["low"], close, close[0])
+    out = pd.Series(true_range).ewm(alpha=1.0 / window, adjust=False).mean().to_numpy()
+    return out, {"last": float(out[-1]), "last_close": float(close[-1])}
+
+
+def _atr_extend(inputs: Dict[str, np.ndarray], state: State, window: int) -> Tuple[np.ndarray, State]:
+    close = inputs["close"]
+    true_range = _true_range(inputs["high"], inputs["low"], close, state["last_close"])
+    out = _recursive_extend(true_range, state["last"], 1.0 / window)
+    return out, {"last": float(out[-1]), "last_close": float(close[-1])}
+
+
+INDICATORS: Dict[str, Dict[str, Callable]] = {
+    "sma": {"full": _sma_full, "extend": _sma_extend},
+    "ema": {"full": _ema_full, "extend": _ema_extend},
+    "rsi": {"full": _rsi_full, "extend": _rsi_extend},
+    "atr": {"full": _atr_full, "extend": _atr_extend},
+}
+
+
+def indicator_inputs(name: str, params: Dict[str, Any]) -> List[str]:
+    """Bar columns an indicator reads."""
+    if name == "atr":
+        return ["high", "low", "close"]
+    return [params.get("source", "close")]
+
+
+class IndicatorCache:
+    """Computes each (ticker, indicator, params) series once per bar history and extends it incrementally."""
+
+    def __init__(self, cache: Optional[diskcache.Cache] = None, ttl_seconds: float = INDICATOR_CACHE_TTL_SECONDS):
+        self._cache = cache
+        self._ttl = ttl_seconds
+        self._local: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.extensions = 0
+        self.misses = 0
+
+    @staticmethod
+    def _series_key(ticker: str, name: str, params: Dict[str, Any]) -> str:
+        return f"{INDICATOR_CACHE_PREFIX}:{ticker}:{name}:{json.dumps(params, sort_keys=True)}"
+
+    def _generation(self) -> int:
+        return cache_generation(BARS_GENERATION, self._cache) if self._cache is not None else 0
+
+    def _load(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                self._local.move_to_end(key)
+                return entry
+        return self._cache.get(key) if self._cache is not None else None
+
+    def _store(self, key: str, entry: Any):
+        with self._lock:
+            self._local[key] = entry
+            self._local.move_to_end(key)
+            while len(self._local) > LOCAL_MAX_ENTRIES:
+                self._local.popitem(last=False)
+        if self._cache is not None:
+            self._cache.set(key, entry, expire=self._ttl)
+
+    def _extend(self, ticker: str, name: str, params: Dict[str, Any], previous: dict, length: int) -> Optional[Tuple[np.ndarray, State, np.ndarray]]:
+        """(values, state, last input row) extended past a previous entry, reading only the new bars (None if history changed)."""
+        columns = indicator_inputs(name, params)
+        tail = load_bars(ticker, columns, last_n=length - previous["length"] + 1)
+        if len(tail) != length - previous["length"] + 1:
+            return None
+        # The previous last bar is re-read as an anchor: the extension is only valid
+        # if the bar it continues from is still the same bar with the same values.
+        if tail.index[0].strftime("%Y-%m-%d") != previous["last_bar"] \
+                or not np.array_equal(tail.iloc[0].to_numpy(dtype=np.float64), previous["anchor"], equal_nan=True):
+            return None
+        inputs = {column: tail[column].to_numpy(dtype=np.float64)[1:] for column in columns}
+        extension, state = INDICATORS[name]["extend"](inputs, previous["state"], **params)
+        self.extensions += 1
+        return np.concatenate([previous["values"], extension]), state, tail.iloc[-1].to_numpy(dtype=np.float64)
+
+    def series(self, ticker: str, name: str, params: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """(bar dates, indicator values) over the ticker's full bar history."""
+        dates = load_bar_dates(ticker)
+        if not len(dates):
+            return dates, np.empty(0)
+        length, last_bar = len(dates), str(dates[-1])
+        series_key = self._series_key(ticker, name, params)
+        entry_key = f"{series_key}:{last_bar}:{self._generation()}"
+
+        # Exact hit: same (ticker, indicator, params, last-bar date, generation).
+        entry = self._load(entry_key)
+        if entry is not None and entry["length"] == length:
+            self.hits += 1
+            return dates, entry["values"]
+
+        # New bars appended after the series' previous entry: extend with the new bars only.
+        previous_key = self._load(series_key)
+        previous = self._load(previous_key) if previous_key is not None else None
+        extended = None
+        if previous is not None and previous["length"] < length \
+                and str(dates[previous["length"] - 1]) == previous["last_bar"]:
+            extended = self._extend(ticker, name, params, previous, length)
+        if extended is not None:
+            values, state, anchor = extended
+        else:
+            bars = load_bars(ticker, indicator_inputs(name, params))
+            inputs = {column: bars[column].to_numpy(dtype=np.float64) for column in bars.columns}
+            values, state = INDICATORS[name]["full"](inputs, **params)
+            anchor = bars.iloc[-1].to_numpy(dtype=np.float64)
+            # A write may have landed since the date column was read: key the entry by what was computed.
+            dates = bars.index.to_numpy(dtype="datetime64[D]")
+            length, last_bar = len(dates), str(dates[-1])
+            entry_key = f"{series_key}:{last_bar}:{self._generation()}"
+            self.misses += 1
+
+        self._store(entry_key, {"last_bar": last_bar, "length": length, "values": values, "state": state, "anchor": anchor})
+        self._store(series_key, entry_key)
+        return dates, values
+
+    def get(self, ticker: str, name: str, params: Dict[str, Any]) -> pd.Series:
+        """Returns the indicator series for the ticker's full bar history."""
+        dates, values = self.series(ticker, name, params)
+        return pd.Series(values, index=pd.DatetimeIndex(np.asarray(dates).astype("datetime64[ns]"), name="date"))
+
+    def latest(self, ticker: str, name: str, params: Dict[str, Any], n: int = 1, as_of: Optional[str] = None) -> np.ndarray:
+        """The last n values of an indicator, optionally as of a date (what screens and the Signal column need)."""
+        dates, values = self.series(ticker, name, params)
+        end = len(values) if as_of is None else int(np.searchsorted(dates, np.datetime64(as_of, "D"), side="right"))
+        return values[max(end - n, 0):end]
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "extensions": self.extensions, "misses": self.misses}
+
+
+# Shared instance: every consumer in this process reads and fills the same cache.
+indicator_cache = IndicatorCache(cache)
@@ -0,0 +1,62 @@
+# foundry_dash/core/logic/instruments.py
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+# Canonical instrument IDs. The same stock arrives as NSE:TCS-EQ, BSE:TCS-EQ,
+# tcs or TCS; all of them are one instrument, "TCS". Universes, the known-ticker
+# master and everything keyed by ticker (bar store, library, screens) use the
+# canonical ID, so one stock is never ingested, backtested or screened twice.
+#
+# This module is pure (no I/O), so the persistence layer can normalize
+# universes on load without import cycles.
+
+# Exchange series suffixes. Only these are split off: symbols like BAJAJ-AUTO
+# or M&M-EQ contain hyphens of their own.
+KNOWN_SERIES = {"EQ", "BE", "BZ", "SM", "ST", "IL", "IV", "GB", "N1", "N2", "N3"}
+
+# Aliases parsing cannot infer (renamed listings): symbol -> canonical symbol.
+INSTRUMENT_ALIASES: Dict[str, str] = {
+    "MINDTREE": "LTIM",
+    "L&TFH": "LTF",
+}
+
+_EXCHANGE_PATTERN = re.compile(r"^([A-Z]{2,6}):(.+)$")
+
+
+class ParsedTicker(NamedTuple):
+    exchange: Optional[str]
+    symbol: str
+    series: Optional[str]
+
+
+def parse_ticker(raw: str) -> ParsedTicker:
+    """Splits "NSE:RELIANCE-EQ" into (NSE, RELIANCE, EQ); missing parts are None."""
+    text = (raw or "").strip().upper()
+    exchange = None
+    match = _EXCHANGE_PATTERN.match(text)
+    if match:
+        exchange, text = match.group(1), match.group(2)
+    series = None
+    head, sep, tail = text.rpartition("-")
+    if sep and head and tail in KNOWN_SERIES:
+        text, series = head, tail
+    return ParsedTicker(exchange, text, series)
+
+
+@lru_cache(maxsize=65536)
+def canonical_id(raw: str) -> str:
+    """Canonical instrument ID for any ticker form (memoized: universes repeat the same few thousand)."""
+    symbol = parse_ticker(raw).symbol
+    return INSTRUMENT_ALIASES.get(symbol, symbol)
+
+
+def canonicalize_tickers(tickers: Iterable[str]) -> List[str]:
+    """Maps tickers to canonical IDs, dropping blanks and duplicates (first occurrence keeps its place)."""
+    return list(dict.fromkeys(canonical_id(t) for t in tickers if t and str(t).strip()))
+
+
+def normalize_universes(universes: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Every universe's members as sorted, de-duplicated canonical IDs."""
+    return {name: sorted(canonicalize_tickers(stocks or [])) for name, stocks in universes.items()}
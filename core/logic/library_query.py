@@ -0,0 +1,180 @@
+# foundry_dash/core/logic/library_query.py
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from core.io.data_persistence import DEFAULT_LIBRARY_PATH, load_library
+from core.io.library_store import library_version, query_top_runs
+from core.io.shared_cache import BARS_GENERATION, cache_generation
+from core.logic.relative_strength import get_rs_rankings
+
+# Server-side query layer for the Research Library table. The library is loaded
+# once per file version; each (filter, sort) combination resolves to a row order
+# that is cached, so paging through results only slices that order. Only the
+# table's columns are read (fingerprints stay on disk), as categoricals and float32.
+# Single-metric sorts filter a per-version presorted row order instead of sorting,
+# and top-N lookups go to the metric indexes stored with each library partition.
+
+TABLE_COLUMNS = [
+    "universe", "strategy", "ticker",
+    "total_return", "cagr", "sharpe", "max_drawdown", "win_rate", "trades", "exposure",
+    "bars", "start_date", "end_date",
+]
+
+# Dash DataTable filter operators (word and symbol spellings), longest first so `>=` wins over `>`.
+FILTER_OPERATORS = [
+    ("ge ", ">="), (">= ", ">="), ("le ", "<="), ("<= ", "<="), ("ne ", "!="), ("!= ", "!="),
+    ("lt ", "<"), ("< ", "<"), ("gt ", ">"), ("> ", ">"), ("eq ", "="), ("= ", "="),
+    ("contains ", "contains"), ("datestartswith ", "datestartswith"),
+]
+
+
+def _library_version(path: Path) -> Tuple[Tuple, str]:
+    """Changes when the library is rewritten or new RS ranks apply (a new trading day or ingestion run)."""
+    return library_version(path), f"{pd.Timestamp.today():%Y-%m-%d}:{cache_generation(BARS_GENERATION)}"
+
+
+@lru_cache(maxsize=2)
+def _load_library_cached(path: Path, version: Tuple[Tuple, str]) -> pd.DataFrame:
+    library = load_library(path, columns=TABLE_COLUMNS)
+    for column in ("universe", "strategy", "ticker"):
+        if column in library.columns:
+            library[column] = library[column].astype("category")
+    if "ticker" in library.columns:
+        rankings = get_rs_rankings()
+        library["rs_rank"] = library["ticker"].map(lambda t: rankings.get(t)).astype("float64")
+    return library.reset_index(drop=True)
+
+
+def get_library_frame(path: Path = DEFAULT_LIBRARY_PATH) -> pd.DataFrame:
+    """Returns the library table, re-reading the file only when it has changed."""
+    return _load_library_cached(path, _library_version(path))
+
+
+def top_runs(
+    metric: str = "sharpe",
+    n: int = 50,
+    universes: Optional[List[str]] = None,
+    strategies: Optional[List[str]] = None,
+    ascending: bool = False,
+    path: Path = DEFAULT_LIBRARY_PATH,
+) -> pd.DataFrame:
+    """Best `n` library rows by an indexed metric (e.g. top 50 by Sharpe in one universe), with RS ranks."""
+    top = query_top_runs(path, metric, n, universes, strategies, ascending)
+    rankings = get_rs_rankings()
+    top.insert(top.columns.get_loc("ticker") + 1, "rs_rank", top["ticker"].map(lambda t: rankings.get(t)).astype("float64"))
+    return top
+
+
+def parse_filter_query(filter_query: Optional[str]) -> List[Tuple[str, str, Any]]:
+    """Splits a DataTable `filter_query` (e.g. `{sharpe} s> 1 && {ticker} contains TCS`) into clauses."""
+    clauses = []
+    for part in (filter_query or "").split(" && "):
+        part = part.strip()
+        if not part.startswith("{") or "}" not in part:
+            continue
+        column, rest = part[1:].split("}", 1)
+        rest = rest.strip()
+        # Dash prefixes operators with s/i (case-sensitive/insensitive); both behave the same here.
+        if rest[:1] in ("s", "i") and not rest.startswith("contains"):
+            rest = rest[1:]
+        for prefix, operator in FILTER_OPERATORS:
+            if rest.startswith(prefix):
+                clauses.append((column, operator, rest[len(prefix):].strip().strip("\"'`")))
+                break
+    return clauses
+
+
+def _clause_mask(frame: pd.DataFrame, column: str, operator: str, value: str) -> np.ndarray:
+    series = frame[column]
+    if operator == "contains":
+        return series.astype(str).str.contains(value, case=False, regex=False).to_numpy()
+    if operator == "datestartswith":
+        return series.astype(str).str.startswith(value).to_numpy()
+
+    if isinstance(series.dtype, pd.CategoricalDtype) and operator in ("=", "!="):
+        # Compare the integer codes instead of materializing a string per row.
+        categories = list(series.cat.categories)
+        code = categories.index(value) if value in categories else -2
+        matches = series.cat.codes.to_numpy() == code
+        return matches if operator == "=" else ~matches
+
+    if pd.api.types.is_numeric_dtype(series):
+        try:
+            value = float(value)
+        except ValueError:
+            return np.zeros(len(frame), dtype=bool)
+    elif pd.api.types.is_datetime64_any_dtype(series):
+        value = pd.Timestamp(value)
+    else:
+        series = series.astype(str)
+
+    comparisons = {
+        ">=": series >= value, "<=": series <= value, "<": series < value,
+        ">": series > value, "!=": series != value, "=": series == value,
+    }
+    return comparisons[operator].to_numpy()
+
+
+@lru_cache(maxsize=16)
+def _column_order(path: Path, version: Tuple[Tuple, str], column: str) -> np.ndarray:
+    """Every row position sorted by one column (ascending, NaN last), computed once per library version."""
+    values = _load_library_cached(path, version)[column]
+    return values.sort_values(kind="stable", na_position="last").index.to_numpy()
+
+
+@lru_cache(maxsize=32)
+def _ordered_rows(path: Path, version: Tuple[Tuple, str], filter_query: str, sort_key: Tuple[Tuple[str, bool], ...]) -> np.ndarray:
+    """Row positions matching the filter, in sort order (the expensive part of a query)."""
+    frame = _load_library_cached(path, version)
+    mask = np.ones(len(frame), dtype=bool)
+    for column, operator, value in parse_filter_query(filter_query):
+        if column in frame.columns:
+            mask &= _clause_mask(frame, column, operator, value)
+
+    rows = np.flatnonzero(mask)
+    if len(sort_key) == 1 and len(rows) and pd.api.types.is_numeric_dtype(frame[sort_key[0][0]]):
+        # Single metric sort (the common "top runs by Sharpe" case): filter the presorted order.
+        column, ascending = sort_key[0]
+        order = _column_order(path, version, column)
+        order = order[mask[order]]
+        if not ascending:
+            missing = frame[column].to_numpy()[order]
+            missing = np.isnan(missing.astype(np.float64))
+            order = np.concatenate([order[~missing][::-1], order[missing]])
+        rows = order
+    elif sort_key and len(rows):
+        subset = frame.iloc[rows]
+        order = subset.sort_values(
+            by=[column for column, _ in sort_key],
+            ascending=[ascending for _, ascending in sort_key],
+            kind="stable",
+            na_position="last",
+        ).index.to_numpy()
+        rows = order
+    return rows
+
+
+def query_library(
+    filter_query: Optional[str] = None,
+    sort_by: Optional[List[Dict[str, str]]] = None,
+    page_current: int = 0,
+    page_size: int = 15,
+    path: Path = DEFAULT_LIBRARY_PATH,
+) -> Tuple[pd.DataFrame, int]:
+    """Returns (one page of library rows, total matching rows) for the given DataTable query state."""
+    version = _library_version(path)
+    frame = _load_library_cached(path, version)
+    if frame.empty:
+        return frame, 0
+
+    sort_key = tuple(
+        (item["column_id"], item.get("direction", "asc") == "asc")
+        for item in (sort_by or []) if item.get("column_id") in frame.columns
+    )
+    rows = _ordered_rows(path, version, filter_query or "", sort_key)
+    start = (page_current or 0) * page_size
+    return frame.iloc[rows[start:start + page_size]], len(rows)
@@ -0,0 +1,154 @@
+# foundry_dash/core/logic/monte_carlo.py
+
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from core.io.data_persistence import DEFAULT_LIBRARY_PATH
+from core.io.library_store import load_library_store, load_trades, stored_curve_tickers
+from core.io.market_data import load_price_panel
+from core.logic.backtest_engine import (
+    DEFAULT_COST_BPS, build_positions, cell_fingerprints, extract_trades, resolve_strategy_specs, simulate_positions,
+)
+from core.logic.parallel import default_worker_count, map_shards
+
+# Monte Carlo stress tests over a strategy's trade list (Audit Lab).
+#
+#   bootstrap: each path draws len(trades) trades WITH replacement, so both the
+#              outcome and the ordering of the trades vary;
+#   shuffle:   each path is a permutation of the actual trades, so the final
+#              return is fixed and only the ordering (path risk, drawdown) varies.
+#
+# Paths are simulated as (paths, trades) matrices in chunks, and chunks are
+# spread over a process pool. A chunk returns only each path's final return,
+# max drawdown and its equity at a few checkpoints; the full paths are dropped
+# as soon as they are summarized, so memory is O(chunk x trades + paths x
+# checkpoints), never O(paths x trades).
+
+MC_METHODS = ["bootstrap", "shuffle"]
+DEFAULT_PATHS = 10_000
+MAX_PATHS = 200_000
+PERCENTILES = [5, 25, 50, 75, 95]
+EQUITY_CHECKPOINTS = 50
+# Paths per chunk are chosen so a chunk's (paths x trades) matrix holds about this many cells.
+CHUNK_CELLS = 4_000_000
+
+
+class MonteCarloError(ValueError):
+    """Raised when a stress test cannot run (unknown method, no trades, too many paths)."""
+
+
+def _stored_trades_fresh(strategy_name: str, spec: Dict[str, Any], close_panel: pd.DataFrame, cost_bps: float) -> bool:
+    tickers = set(close_panel.columns)
+    if cost_bps != DEFAULT_COST_BPS or not tickers <= set(stored_curve_tickers(DEFAULT_LIBRARY_PATH, strategy_name)):
+        return False
+    stored = load_library_store(DEFAULT_LIBRARY_PATH, [strategy_name], ["ticker", "fingerprint"])
+    current = cell_fingerprints(close_panel, {strategy_name: spec}, cost_bps)
+    return set(current["fingerprint"]) <= set(stored["fingerprint"])
+
+
+def strategy_trade_returns(strategy_name: str, tickers: List[str], cost_bps: float = DEFAULT_COST_BPS) -> np.ndarray:
+    """A strategy's trade returns over the tickers, in exit-date order.
+
+    Read from the Performance Library when it stores trades for every ticker AND their cell
+    fingerprints match the current strategy definition and data; otherwise (an edited strategy,
+    newly ingested bars) the strategy is backtested here.
+    """
+    spec = resolve_strategy_specs([strategy_name])[strategy_name]
+    close_panel = load_price_panel(tickers)
+    if _stored_trades_fresh(strategy_name, spec, close_panel, cost_bps):
+        trades = load_trades(DEFAULT_LIBRARY_PATH, strategy_name, list(close_panel.columns))
+        return trades.sort_values("exit_date", kind="stable")["return"].to_numpy(dtype=np.float64)
+
+    close = close_panel.to_numpy(dtype=np.float64)
+    simulated = simulate_positions(close, build_positions(spec, close_panel, close), cost_bps)
+    trades = extract_trades(close_panel.index, close_panel.columns.to_numpy(), simulated["returns"], simulated["held"])
+    return trades["return"].to_numpy(dtype=np.float64)
+
+
+def simulate_path_chunk(
+    trade_returns: np.ndarray,
+    n_paths: int,
+    method: str,
+    seed: np.random.SeedSequence,
+    checkpoints: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Worker entry point: simulates one chunk of paths and returns per-path summaries only."""
+    rng = np.random.default_rng(seed)
+    n_trades = len(trade_returns)
+    if method == "bootstrap":
+        sampled = trade_returns[rng.integers(0, n_trades, size=(n_paths, n_trades))]
+    else:
+        sampled = trade_returns[rng.permuted(np.broadcast_to(np.arange(n_trades), (n_paths, n_trades)), axis=1)]
+
+    equity = np.cumprod(1.0 + sampled, axis=1)
+    peak = np.maximum(np.maximum.accumulate(equity, axis=1), 1.0)  # starting equity of 1 counts as a peak
+    return {
+        "final_return": equity[:, -1] - 1.0,
+        "max_drawdown": (equity / peak - 1.0).min(axis=1),
+        "checkpoints": equity[:, checkpoints],
+    }
+
+
+def run_stress_test(
+    trade_returns: np.ndarray,
+    method: str = "bootstrap",
+    n_paths: int = DEFAULT_PATHS,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    on_progress: Optional[Callable[[int, int, str], None]] = None,
+) -> Dict[str, Any]:
+    """Resamples the trade list into `n_paths` equity paths and returns percentile bands.
+
+    Returns {"summary": percentiles of final return and max drawdown, "bands": equity percentiles
+    at each checkpoint (by trade number), "prob_loss", "paths", "trades"}.
+    """
+    if method not in MC_METHODS:
+        raise MonteCarloError(f"Unknown method: {method!r}")
+    if not 1 <= n_paths <= MAX_PATHS:
+        raise MonteCarloError(f"Paths must be between 1 and {MAX_PATHS}")
+    trade_returns = np.asarray(trade_returns, dtype=np.float64)
+    trade_returns = trade_returns[np.isfinite(trade_returns)]
+    n_trades = len(trade_returns)
+    if n_trades < 2:
+        raise MonteCarloError("The strategy produced fewer than 2 trades; nothing to resample")
+
+    checkpoints = np.unique(np.linspace(0, n_trades - 1, min(EQUITY_CHECKPOINTS, n_trades)).round().astype(int))
+    chunk_paths = max(1, CHUNK_CELLS // n_trades)
+    sizes = [min(chunk_paths, n_paths - start) for start in range(0, n_paths, chunk_paths)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    shard_args = [(trade_returns, size, method, chunk_seed, checkpoints) for size, chunk_seed in zip(sizes, seeds)]
+
+    # Chunk results are written into preallocated per-path arrays as they arrive.
+    final_return = np.empty(n_paths)
+    max_drawdown = np.empty(n_paths)
+    equity = np.empty((n_paths, len(checkpoints)))
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    workers = min(max_workers or default_worker_count(), len(sizes))
+    for done, (index, result) in enumerate(map_shards(simulate_path_chunk, shard_args, workers), start=1):
+        rows = slice(offsets[index], offsets[index + 1])
+        final_return[rows] = result["final_return"]
+        max_drawdown[rows] = result["max_drawdown"]
+        equity[rows] = result["checkpoints"]
+        if on_progress:
+            on_progress(done, len(sizes), f"chunk {index + 1}: {sizes[index]} paths")
+
+    summary = pd.DataFrame(
+        {
+            "final_return": np.percentile(final_return, PERCENTILES),
+            "max_drawdown": np.percentile(max_drawdown, PERCENTILES),
+        },
+        index=pd.Index([f"p{p}" for p in PERCENTILES], name="percentile"),
+    )
+    bands = pd.DataFrame(
+        np.percentile(equity, PERCENTILES, axis=0).T,
+        columns=[f"p{p}" for p in PERCENTILES],
+        index=pd.Index(checkpoints + 1, name="trade"),
+    )
+    return {
+        "summary": summary,
+        "bands": bands,
+        "prob_loss": float((final_return < 0).mean()),
+        "paths": n_paths,
+        "trades": n_trades,
+    }
@@ -0,0 +1,54 @@
+# foundry_dash/core/logic/parallel.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def default_worker_count() -> int:
+    """Cores actually available to this process (respects CPU affinity / container limits)."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+
+def chunk_list(items: Sequence[T], n_chunks: int) -> List[List[T]]:
+    """Splits items into at most `n_chunks` contiguous, near-equal chunks."""
+    n_chunks = max(1, min(n_chunks, len(items)))
+    size, extra = divmod(len(items), n_chunks)
+    chunks, start = [], 0
+    for i in range(n_chunks):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(list(items[start:end]))
+        start = end
+    return [chunk for chunk in chunks if chunk]
+
+
+def map_shards(
+    fn: Callable[..., Any],
+    shard_args: List[Tuple],
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[int, Any]]:
+    """Runs `fn(*args)` for every shard across a process pool, yielding (shard index, result) as each finishes.
+
+    Runs inline when only one worker or one shard is involved, so small jobs skip the pool start-up cost.
+    A failing shard cancels the shards that have not started yet and re-raises in the caller.
+    """
+    workers = min(max_workers or default_worker_count(), len(shard_args))
+    if workers <= 1:
+        for index, args in enumerate(shard_args):
+            yield index, fn(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fn, *args): index for index, args in enumerate(shard_args)}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
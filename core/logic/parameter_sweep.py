@@ -0,0 +1,298 @@
+# foundry_dash/core/logic/parameter_sweep.py
+
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from core.logic.backtest_engine import (
+    DEFAULT_COST_BPS, TRADING_DAYS_PER_YEAR, rolling_extreme, rolling_mean, shift,
+)
+
+# Parameter sweeps for the preset signal families, run as one batched
+# computation instead of one backtest per grid point:
+#   1. every indicator the grid needs is computed ONCE per distinct window and
+#      stacked into a (windows, bars, tickers) array;
+#   2. positions for a chunk of grid points come from fancy-indexing that stack,
+#      giving a (grid, bars, tickers) array, and are simulated in one pass with
+#      the grid as an extra leading axis;
+#   3. returns are summed once per fold segment (np.add.reduceat) and the few
+#      segment sums are accumulated, so every walk-forward fold reuses the same
+#      indicators and returns, and costs O(1) per fold on top of the simulation.
+#
+# Indicators are trailing (no look-ahead), so computing them once over the full
+# history and slicing per fold gives the same signals as recomputing per fold.
+
+DEFAULT_FOLDS = 4
+MAX_GRID_POINTS = 2_000
+# Grid points per simulation chunk are chosen so a chunk holds about this many
+# (grid x bars x tickers) float64 cells, bounding memory on large universes.
+CHUNK_CELLS = 2_000_000
+
+
+class SweepError(ValueError):
+    """Raised when a sweep definition (family, parameter ranges or folds) is invalid."""
+
+
+# Position builders: `indicators[kind]` is the (windows, bars, tickers) stack and
+# `grid` holds, per grid point, each parameter's row in its indicator's stack.
+def _sma_positions(close, indicators, grid):
+    sma = indicators["sma"]
+    with np.errstate(invalid="ignore"):
+        return sma[grid[:, 0]] > sma[grid[:, 1]]
+
+
+def _trend_positions(close, indicators, grid):
+    with np.errstate(invalid="ignore"):
+        return close[None] > indicators["sma"][grid[:, 0]]
+
+
+def _roc_positions(close, indicators, grid):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return close[None] / indicators["lag"][grid[:, 0]] - 1.0 > 0
+
+
+def _breakout_positions(close, indicators, grid):
+    prior_high, prior_low = indicators["prior_high"], indicators["prior_low"]
+    events = np.full((len(grid),) + close.shape, np.nan)
+    with np.errstate(invalid="ignore"):
+        events[close[None] < prior_low[grid[:, 1]]] = 0.0
+        events[close[None] > prior_high[grid[:, 0]]] = 1.0
+    # Forward fill along the bar axis (as backtest_engine.forward_fill, with the grid axis in front).
+    row_idx = np.where(~np.isnan(events), np.arange(close.shape[0])[None, :, None], 0)
+    np.maximum.accumulate(row_idx, axis=1, out=row_idx)
+    filled = np.take_along_axis(events, row_idx, axis=1)
+    return np.where(np.isnan(filled), 0.0, filled)
+
+
+# family -> parameter names, the indicator each parameter indexes, and the batched position builder.
+INDICATOR_BUILDERS: Dict[str, Callable[[np.ndarray, int], np.ndarray]] = {
+    "sma": rolling_mean,
+    "lag": shift,
+    "prior_high": lambda close, window: shift(rolling_extreme(close, window, np.max)),
+    "prior_low": lambda close, window: shift(rolling_extreme(close, window, np.min)),
+}
+SWEEP_FAMILIES: Dict[str, Dict[str, Any]] = {
+    "sma_crossover": {
+        "label": "SMA Crossover", "params": ["fast", "slow"], "indicators": ["sma", "sma"],
+        "positions": _sma_positions, "defaults": ["5:50:5", "50:250:10"],
+    },
+    "trend_filter": {
+        "label": "Trend Filter", "params": ["window"], "indicators": ["sma"],
+        "positions": _trend_positions, "defaults": ["20:300:10"],
+    },
+    "breakout": {
+        "label": "Breakout", "params": ["entry", "exit"], "indicators": ["prior_high", "prior_low"],
+        "positions": _breakout_positions, "defaults": ["20:100:10", "10:50:5"],
+    },
+    "roc_momentum": {
+        "label": "ROC Momentum", "params": ["lookback"], "indicators": ["lag"],
+        "positions": _roc_positions, "defaults": ["21:252:21"],
+    },
+}
+
+
+def parse_param_values(text: str) -> List[int]:
+    """Parses "5:50:5" (start:stop:step, stop inclusive) or "10, 20, 50" into sorted distinct windows."""
+    text = (text or "").strip()
+    try:
+        if ":" in text:
+            parts = [int(p) for p in text.split(":")]
+            if len(parts) not in (2, 3) or (len(parts) == 3 and parts[2] <= 0):
+                raise ValueError
+            start, stop, step = parts[0], parts[1], parts[2] if len(parts) == 3 else 1
+            values = list(range(start, stop + 1, step))
+        else:
+            values = [int(p) for p in text.replace(",", " ").split()]
+    except ValueError:
+        raise SweepError(f"Invalid parameter range: {text!r} (use start:stop:step or a comma list)")
+    values = sorted(set(v for v in values if v > 0))
+    if not values:
+        raise SweepError(f"Parameter range {text!r} contains no positive window")
+    return values
+
+
+def build_grid(family: str, param_values: List[List[int]]) -> pd.DataFrame:
+    """Every combination of the parameter values (crossovers keep only fast < slow)."""
+    if family not in SWEEP_FAMILIES:
+        raise SweepError(f"Unknown strategy family: {family!r}")
+    names = SWEEP_FAMILIES[family]["params"]
+    if len(param_values) != len(names):
+        raise SweepError(f"{SWEEP_FAMILIES[family]['label']} takes {len(names)} parameter ranges")
+    grid = pd.DataFrame(list(itertools.product(*param_values)), columns=names)
+    if family == "sma_crossover":
+        grid = grid[grid["fast"] < grid["slow"]]
+    if grid.empty:
+        raise SweepError("The parameter grid is empty")
+    if len(grid) > MAX_GRID_POINTS:
+        raise SweepError(f"{len(grid)} grid points; the limit is {MAX_GRID_POINTS}")
+    return grid.reset_index(drop=True)
+
+
+def fold_boundaries(n_bars: int, n_folds: int) -> np.ndarray:
+    """Splits the bars into n_folds + 1 equal segments; returns the n_folds + 2 boundary rows."""
+    if n_folds < 1:
+        raise SweepError("At least one walk-forward fold is needed")
+    if n_bars < 2 * (n_folds + 1):
+        raise SweepError(f"{n_bars} bars are too few for {n_folds} folds")
+    return np.linspace(0, n_bars, n_folds + 2).round().astype(int)
+
+
+def _precompute_indicators(family: str, close: np.ndarray, param_values: List[List[int]]):
+    """One matrix per (indicator, distinct window), stacked per indicator.
+
+    Returns ({indicator: (windows, bars, tickers) stack}, {indicator: {window: stack row}}).
+    Parameters sharing an indicator (fast and slow SMA) share its stack.
+    """
+    windows: Dict[str, List[int]] = {}
+    for kind, values in zip(SWEEP_FAMILIES[family]["indicators"], param_values):
+        windows[kind] = sorted(set(windows.get(kind, [])) | set(values))
+    stacks = {
+        kind: np.stack([INDICATOR_BUILDERS[kind](close, window) for window in values])
+        for kind, values in windows.items()
+    }
+    lookups = {kind: {window: i for i, window in enumerate(values)} for kind, values in windows.items()}
+    return stacks, lookups
+
+
+def _at_boundaries(values: np.ndarray, boundaries: np.ndarray) -> np.ndarray:
+    """Running sums along the bar axis (-2), at the boundary rows only.
+
+    Sums each segment in one reduceat pass, then accumulates the few segment sums,
+    instead of a full-length cumulative sum.
+    """
+    segments = np.add.reduceat(values, boundaries[:-1], axis=-2)
+    zeros = np.zeros(values.shape[:-2] + (1, values.shape[-1]))
+    return np.concatenate([zeros, np.cumsum(segments, axis=-2)], axis=-2)
+
+
+def _boundary_sums(
+    bar_returns: np.ndarray,
+    valid: np.ndarray,
+    positions: np.ndarray,
+    boundaries: np.ndarray,
+    cost_bps: float,
+) -> Dict[str, np.ndarray]:
+    """Simulates a (grid, bars, tickers) position block and returns running sums at the boundaries.
+
+    Sums of returns, squared returns, log growth and bars held are shaped (grid, boundaries,
+    tickers). `bar_returns` and `valid` (bars, tickers) are computed once and shared by every chunk.
+    """
+    held = np.zeros(positions.shape)
+    held[:, 1:] = positions[:, :-1]
+    turnover = np.abs(np.diff(held, axis=1, prepend=0.0))
+    returns = held * bar_returns[None] - turnover * (cost_bps / 10_000.0)
+    returns *= valid[None]
+    held *= valid[None]
+    return {
+        "sum": _at_boundaries(returns, boundaries),
+        "sum_sq": _at_boundaries(returns * returns, boundaries),
+        "log_growth": _at_boundaries(np.log1p(np.maximum(returns, -0.999999)), boundaries),
+        "held": _at_boundaries(held, boundaries),
+    }
+
+
+def _window_metrics(sums: Dict[str, np.ndarray], a: int, b: int) -> Dict[str, np.ndarray]:
+    """Per grid point metrics over boundary segments [a, b), averaged across tickers."""
+    n = sums["count"][b] - sums["count"][a]
+    total = sums["sum"][:, b] - sums["sum"][:, a]
+    total_sq = sums["sum_sq"][:, b] - sums["sum_sq"][:, a]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / n
+        var = (total_sq - n * mean ** 2) / (n - 1)
+        std = np.sqrt(np.maximum(var, 0.0))
+        sharpe = np.where((n > 1) & (std > 0), mean / std * np.sqrt(TRADING_DAYS_PER_YEAR), np.nan)
+        exposure = (sums["held"][:, b] - sums["held"][:, a]) / n
+    total_return = np.expm1(sums["log_growth"][:, b] - sums["log_growth"][:, a])
+    active = n > 1
+    return {
+        "sharpe": _mean_over_tickers(np.where(active, sharpe, np.nan)),
+        "total_return": _mean_over_tickers(np.where(active, total_return, np.nan)),
+        "exposure": _mean_over_tickers(np.where(active, exposure, np.nan)),
+    }
+
+
+def _mean_over_tickers(values: np.ndarray) -> np.ndarray:
+    """nanmean along the ticker axis, NaN (without a warning) where no ticker has a value."""
+    counts = (~np.isnan(values)).sum(axis=1)
+    return np.divide(np.nansum(values, axis=1), counts, out=np.full(values.shape[0], np.nan), where=counts > 0)
+
+
+def run_sweep(
+    close_panel: pd.DataFrame,
+    family: str,
+    param_values: List[List[int]],
+    n_folds: int = DEFAULT_FOLDS,
+    cost_bps: float = DEFAULT_COST_BPS,
+    on_progress: Optional[Callable[[int, int, str], None]] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Sweeps the grid over a date x ticker close panel with anchored walk-forward folds.
+
+    Returns (grid results: full-period mean metrics per grid point, walk-forward table: for each
+    fold, the grid point with the best in-sample Sharpe and its out-of-sample metrics).
+    """
+    grid = build_grid(family, param_values)
+    close = close_panel.to_numpy(dtype=np.float64)
+    boundaries = fold_boundaries(close.shape[0], n_folds)
+    spec = SWEEP_FAMILIES[family]
+    names = spec["params"]
+
+    stacks, lookups = _precompute_indicators(family, close, param_values)
+    indices = np.column_stack([
+        grid[name].map(lookups[kind]).to_numpy() for name, kind in zip(names, spec["indicators"])
+    ])
+
+    # Bar returns and the valid-bar count do not depend on the grid point: computed once.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bar_returns = np.zeros(close.shape)
+        bar_returns[1:] = close[1:] / close[:-1] - 1.0
+    bar_returns = np.nan_to_num(bar_returns, nan=0.0, posinf=0.0, neginf=0.0)
+    valid = (~np.isnan(close)).astype(np.float64)
+    count = _at_boundaries(valid, boundaries)
+
+    chunk_size = max(1, CHUNK_CELLS // max(1, close.size))
+    n_segments = len(boundaries) - 1
+    full = {key: np.empty(len(grid)) for key in ("sharpe", "total_return", "exposure")}
+    train_sharpe = np.empty((len(grid), n_folds))
+    test = {key: np.empty((len(grid), n_folds)) for key in ("sharpe", "total_return", "exposure")}
+
+    n_chunks = -(-len(grid) // chunk_size)
+    for chunk_no, start in enumerate(range(0, len(grid), chunk_size), start=1):
+        rows = slice(start, start + chunk_size)
+        positions = spec["positions"](close, stacks, indices[rows]).astype(np.float64)
+        sums = _boundary_sums(bar_returns, valid, positions, boundaries, cost_bps)
+        sums["count"] = count
+
+        for key, values in _window_metrics(sums, 0, n_segments).items():
+            full[key][rows] = values
+        for fold in range(n_folds):
+            # Anchored: train on every segment before the test segment.
+            train_sharpe[rows, fold] = _window_metrics(sums, 0, fold + 1)["sharpe"]
+            for key, values in _window_metrics(sums, fold + 1, fold + 2).items():
+                test[key][rows, fold] = values
+        if on_progress:
+            on_progress(chunk_no, n_chunks, f"grid points {start + 1}-{min(start + chunk_size, len(grid))} of {len(grid)}")
+
+    results = grid.copy()
+    for key, values in full.items():
+        results[key] = values
+    results = results.sort_values("sharpe", ascending=False, na_position="last").reset_index(drop=True)
+
+    dates = close_panel.index
+    folds = []
+    for fold in range(n_folds):
+        scores = train_sharpe[:, fold]
+        if np.isnan(scores).all():
+            continue
+        best = int(np.nanargmax(scores))
+        folds.append({
+            "fold": fold + 1,
+            "train": f"{dates[0]:%Y-%m-%d} → {dates[boundaries[fold + 1] - 1]:%Y-%m-%d}",
+            "test": f"{dates[boundaries[fold + 1]]:%Y-%m-%d} → {dates[boundaries[fold + 2] - 1]:%Y-%m-%d}",
+            "params": ", ".join(f"{name}={grid.iloc[best][name]}" for name in names),
+            "train_sharpe": scores[best],
+            "test_sharpe": test["sharpe"][best, fold],
+            "test_return": test["total_return"][best, fold],
+            "test_exposure": test["exposure"][best, fold],
+        })
+    return results, pd.DataFrame(folds)
@@ -0,0 +1,57 @@
+# foundry_dash/core/logic/quick_stats.py
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+from core.io.data_persistence import DEFAULT_LIBRARY_PATH, DEFAULT_UNIVERSES_PATH, list_universe_names
+from core.io.library_store import library_row_count, library_version
+from core.io.strategy_store import DEFAULT_STRATEGIES_PATH
+from core.io.universe_store import get_universe_store
+from core.logic.backtest_engine import list_strategy_names
+
+# Counts shown on the Home page. Page layouts are functions, so every page load
+# asks for fresh numbers; they are served from an in-process cache keyed on the
+# source files' versions, so a page load only re-reads what changed on disk
+# (the library row count comes from its manifest; no library data is loaded).
+
+
+def _file_version(path: Path) -> Tuple:
+    try:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+    except FileNotFoundError:
+        return ()
+
+
+def stats_version(
+    universes_path: Path = DEFAULT_UNIVERSES_PATH,
+    library_path: Path = DEFAULT_LIBRARY_PATH,
+    strategies_path: Path = DEFAULT_STRATEGIES_PATH,
+) -> Tuple:
+    """Versions of the universe store, library manifest and strategies file (no data is read)."""
+    return (
+        get_universe_store(universes_path).version(),
+        library_version(library_path),
+        _file_version(strategies_path),
+    )
+
+
+@lru_cache(maxsize=2)
+def _compute_quick_stats(universes_path: Path, library_path: Path, version: Tuple) -> Dict[str, int]:
+    return {
+        'strategies': len(list_strategy_names()),
+        'universes': len(list_universe_names(universes_path)),
+        'library_size': library_row_count(library_path),
+    }
+
+
+def get_quick_stats(
+    universes_path: Path = DEFAULT_UNIVERSES_PATH,
+    library_path: Path = DEFAULT_LIBRARY_PATH,
+    strategies_path: Path = DEFAULT_STRATEGIES_PATH,
+) -> Dict[str, int]:
+    """Strategy, universe and library-run counts, recomputed only when their files change."""
+    return _compute_quick_stats(
+        universes_path, library_path, stats_version(universes_path, library_path, strategies_path)
+    )
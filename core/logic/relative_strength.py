@@ -0,0 +1,97 @@
+# foundry_dash/core/logic/relative_strength.py
+
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from core.io.data_persistence import DEFAULT_UNIVERSES_PATH, get_all_known_tickers, get_universe_members, list_universe_names
+from core.io.market_data import load_price_panel
+from core.io.shared_cache import BARS_GENERATION, cache, cache_generation
+
+# Cross-sectional RS: a weighted blend of 3/6/9/12-month returns (the most recent
+# quarter counts double), ranked against every known ticker as a 1-99 percentile.
+# The whole cross-section is scored in one pass over a (bars x tickers) matrix,
+# once per trading day and bar store generation (an ingestion run re-ranks);
+# consumers then read ranks from a dict.
+
+RS_WEIGHTS: Dict[int, float] = {63: 0.4, 126: 0.2, 189: 0.2, 252: 0.2}
+RS_CACHE_PREFIX = "rs-rankings"
+RS_CACHE_TTL_SECONDS = 36 * 3600
+# Calendar-day lookback that covers the longest RS period plus holidays.
+RS_LOOKBACK_DAYS = 400
+
+_memo: Dict[str, Dict[str, int]] = {}
+_memo_lock = Lock()
+
+
+def compute_rs_scores(close: np.ndarray) -> np.ndarray:
+    """Weighted multi-period return per column of a (bars x tickers) close matrix (NaN if history is too short)."""
+    close = np.asarray(close, dtype=np.float64)
+    scores = np.zeros(close.shape[1])
+    latest = close[-1]
+    for period, weight in RS_WEIGHTS.items():
+        if period >= close.shape[0]:
+            return np.full(close.shape[1], np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores += weight * (latest / close[-1 - period] - 1.0)
+    return scores
+
+
+def rank_percentiles(scores: np.ndarray) -> np.ndarray:
+    """Maps scores to 1-99 percentile ranks (99 = strongest); NaN scores get rank 0."""
+    ranks = np.zeros(len(scores), dtype=np.int64)
+    valid = ~np.isnan(scores)
+    n_valid = int(valid.sum())
+    if n_valid == 0:
+        return ranks
+    order = np.argsort(np.argsort(scores[valid], kind="stable"), kind="stable")
+    if n_valid == 1:
+        ranks[valid] = 99
+    else:
+        ranks[valid] = 1 + np.floor(order / (n_valid - 1) * 98).astype(np.int64)
+    return ranks
+
+
+def rs_universe(universes_path: Path = DEFAULT_UNIVERSES_PATH) -> List[str]:
+    """Every ticker the app knows about: the known-ticker list plus all universe members."""
+    members = {t for name in list_universe_names(universes_path) for t in get_universe_members(name, universes_path)}
+    return sorted(set(get_all_known_tickers(universes_path)) | members)
+
+
+def build_rs_rankings(tickers: List[str], as_of: Optional[pd.Timestamp] = None) -> Dict[str, int]:
+    """Scores and ranks the whole cross-section in one vectorized pass."""
+    if not tickers:
+        return {}
+    as_of = as_of or pd.Timestamp.today().normalize()
+    start = (as_of - pd.Timedelta(days=RS_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+    panel = load_price_panel(tickers, "close", start=start, end=as_of.strftime("%Y-%m-%d")).ffill()
+    ranks = rank_percentiles(compute_rs_scores(panel.to_numpy()))
+    return {ticker: rank for ticker, rank in zip(panel.columns, ranks.tolist()) if rank}
+
+
+def get_rs_rankings(as_of: Optional[pd.Timestamp] = None) -> Dict[str, int]:
+    """Today's ticker -> RS rank map: in-process memo, then the shared cache, then a fresh build."""
+    as_of = as_of or pd.Timestamp.today().normalize()
+    day_key = f"{RS_CACHE_PREFIX}:{as_of:%Y-%m-%d}:{cache_generation(BARS_GENERATION)}"
+
+    rankings = _memo.get(day_key)
+    if rankings is not None:
+        return rankings
+
+    with _memo_lock:
+        rankings = _memo.get(day_key)
+        if rankings is None:
+            rankings = cache.get(day_key)
+            if rankings is None:
+                rankings = build_rs_rankings(rs_universe(), as_of)
+                cache.set(day_key, rankings, expire=RS_CACHE_TTL_SECONDS)
+            _memo.clear()
+            _memo[day_key] = rankings
+    return rankings
+
+
+def rs_rank(ticker: str) -> Optional[int]:
+    """O(1) lookup of a ticker's RS rank for today (None if it is outside the ranked cross-section)."""
+    return get_rs_rankings().get(ticker)
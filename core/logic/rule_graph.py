@@ -0,0 +1,153 @@
+# foundry_dash/core/logic/rule_graph.py
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Visual Rule Builder strategies are stored as an expression DAG, not as code.
+# Rules like {"left": "close", "op": "crosses above", "right": "sma(50)"} compile
+# into a flat, topologically ordered node list where every node is
+# [op, *args] and args are either earlier node ids or literal parameters.
+# Nodes are hash-consed: an identical subexpression (say the SMA 50 used by
+# both entry and exit) is stored, and later evaluated, exactly once. The
+# backtest engine evaluates each node as one array op over (bars x tickers).
+
+PRICE_FIELDS = ["open", "high", "low", "close", "volume"]
+# term name -> node op; every windowed term is applied to the close series.
+WINDOWED_TERMS = {
+    "sma": "sma",
+    "ema": "ema",
+    "rsi": "rsi",
+    "highest": "highest",
+    "lowest": "lowest",
+    "roc": "roc",
+}
+COMPARISON_OPS = {">": "gt", ">=": "ge", "<": "lt", "<=": "le"}
+CROSS_OPS = {"crosses above": "gt", "crosses below": "lt"}
+RULE_OPERATORS = list(COMPARISON_OPS) + list(CROSS_OPS)
+# Ops whose arguments are all node ids.
+NODE_ID_OPS = {"gt", "ge", "lt", "le", "and", "not"}
+
+# Suggested terms for the builder's dropdowns; any "name(window)" term is accepted.
+RULE_TERMS = [
+    "close", "open", "high", "low", "volume",
+    "sma(20)", "sma(50)", "sma(200)", "ema(20)", "ema(50)", "rsi(14)",
+    "highest(55)", "lowest(20)", "roc(63)",
+]
+
+_TERM_PATTERN = re.compile(r"^\s*([a-z_]+)\s*\(\s*(\d+)\s*\)\s*$")
+MAX_WINDOW = 2520
+
+Graph = Dict[str, Any]
+
+
+class RuleGraphError(ValueError):
+    """Raised when builder rules reference an unknown term/operator or cannot compile."""
+
+
+class RuleGraphBuilder:
+    """Builds a hash-consed node list: adding an existing (op, args) returns the existing node id."""
+
+    def __init__(self):
+        self.nodes: List[List[Any]] = []
+        self._ids: Dict[Tuple[Any, ...], int] = {}
+
+    def node(self, op: str, *args: Any) -> int:
+        key = (op,) + args
+        node_id = self._ids.get(key)
+        if node_id is None:
+            node_id = len(self.nodes)
+            self.nodes.append([op, *args])
+            self._ids[key] = node_id
+        return node_id
+
+    def term(self, token: Any) -> int:
+        """A price field, an indicator term like "sma(50)", or a numeric constant."""
+        if isinstance(token, str):
+            name = token.strip().lower()
+            if name in PRICE_FIELDS:
+                return self.node("field", name)
+            match = _TERM_PATTERN.match(name)
+            if match:
+                kind, window = match.group(1), int(match.group(2))
+                if kind not in WINDOWED_TERMS:
+                    raise RuleGraphError(f"Unknown indicator: {kind!r}")
+                if not 1 <= window <= MAX_WINDOW:
+                    raise RuleGraphError(f"Window must be between 1 and {MAX_WINDOW}: {token!r}")
+                return self.node(WINDOWED_TERMS[kind], self.node("field", "close"), window)
+        try:
+            value = float(token)
+        except (TypeError, ValueError):
+            raise RuleGraphError(f"Unknown term: {token!r}")
+        if value != value or value in (float("inf"), float("-inf")):
+            raise RuleGraphError(f"Value must be a finite number: {token!r}")
+        return self.node("const", value)
+
+    def shifted(self, node_id: int) -> int:
+        """The node's value one bar earlier; a constant is the same on every bar, so it is reused."""
+        if self.nodes[node_id][0] == "const":
+            return node_id
+        return self.node("shift", node_id, 1)
+
+    def condition(self, rule: Dict[str, Any]) -> int:
+        op = str(rule.get("op", "")).strip()
+        left, right = self.term(rule.get("left")), self.term(rule.get("right"))
+        if op in COMPARISON_OPS:
+            return self.node(COMPARISON_OPS[op], left, right)
+        if op in CROSS_OPS:
+            # Crossed on this bar: the relation holds now but did not hold on the previous bar.
+            now = self.node(CROSS_OPS[op], left, right)
+            before = self.node(CROSS_OPS[op], self.shifted(left), self.shifted(right))
+            return self.node("and", now, self.node("not", before))
+        raise RuleGraphError(f"Unknown operator: {op!r}")
+
+    def all_of(self, rules: List[Dict[str, Any]]) -> Optional[int]:
+        ids = sorted(set(self.condition(rule) for rule in rules))
+        if not ids:
+            return None
+        return ids[0] if len(ids) == 1 else self.node("and", *ids)
+
+
+def compile_rule_graph(entry_rules: List[Dict[str, Any]], exit_rules: Optional[List[Dict[str, Any]]] = None) -> Graph:
+    """Compiles entry/exit rule lists (each ANDed) into one shared DAG.
+
+    Without exit rules the position is simply "entry conditions hold"; with them, a position
+    opens when all entry rules hold and stays open until all exit rules hold.
+    """
+    builder = RuleGraphBuilder()
+    entry = builder.all_of(entry_rules or [])
+    if entry is None:
+        raise RuleGraphError("Add at least one entry rule")
+    exit_ = builder.all_of(exit_rules or [])
+    return {"nodes": builder.nodes, "entry": entry, "exit": exit_}
+
+
+def graph_hash(graph: Graph) -> str:
+    return hashlib.sha256(json.dumps(graph, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def graph_fields(graph: Graph) -> List[str]:
+    """Price fields the graph reads, in PRICE_FIELDS order."""
+    used = {node[1] for node in graph["nodes"] if node[0] == "field"}
+    return [field for field in PRICE_FIELDS if field in used]
+
+
+def node_children(node: List[Any]) -> List[int]:
+    """Ids of the nodes a node reads (windowed ops and shift carry one literal parameter after their input)."""
+    op, args = node[0], node[1:]
+    if op in ("field", "const"):
+        return []
+    if op in NODE_ID_OPS:
+        return list(args)
+    return [args[0]]
+
+
+def describe_graph(graph: Graph, rule_count: int) -> str:
+    """Short summary for the builder, e.g. "4 rules -> 9 nodes (3 shared)"."""
+    readers: Dict[int, int] = {}
+    for node in graph["nodes"]:
+        for child in node_children(node):
+            readers[child] = readers.get(child, 0) + 1
+    shared = sum(1 for count in readers.values() if count > 1)
+    return f"{rule_count} rules -> {len(graph['nodes'])} nodes ({shared} shared)"
@@ -0,0 +1,148 @@
+# foundry_dash/core/logic/screener.py
+
+import hashlib
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from core.io.market_data import load_field_panels
+from core.io.shared_cache import BARS_GENERATION, cache, cache_generation
+from core.logic.backtest_engine import rolling_extreme, rolling_mean
+from core.logic.indicators import indicator_cache
+from core.logic.relative_strength import get_rs_rankings
+
+# A screen is a list of rules like {"left": "close", "op": ">", "right": "sma50"}.
+# Rules compile into ONE boolean expression over the cross-section frame (one row
+# per ticker, one column per field), evaluated for every ticker at once.
+
+# Calendar-day window that covers 252 trading bars (52-week high, SMA200) plus holidays.
+SCREEN_LOOKBACK_DAYS = 400
+SCREEN_CACHE_PREFIX = "screen-cross-section"
+SCREEN_CACHE_TTL_SECONDS = 6 * 3600
+
+SCREEN_FIELDS: Dict[str, str] = {
+    "close": "Last close",
+    "change_pct": "Change (%)",
+    "sma20": "SMA 20",
+    "sma50": "SMA 50",
+    "sma200": "SMA 200",
+    "rsi14": "RSI (14)",
+    "volume": "Volume",
+    "avg_volume20": "Avg volume (20)",
+    "volume_ratio": "Volume / avg volume (20)",
+    "high_52w": "52-week high",
+    "pct_from_high": "% below 52-week high",
+    "rs": "RS ranking",
+}
+SCREEN_OPERATORS = [">", ">=", "<", "<=", "==", "!="]
+
+SCREEN_PRESETS: Dict[str, List[Dict[str, Any]]] = {
+    "Price above SMA50": [{"left": "close", "op": ">", "right": "sma50"}],
+    "Price above SMA200": [{"left": "close", "op": ">", "right": "sma200"}],
+    "SMA50 above SMA200": [{"left": "sma50", "op": ">", "right": "sma200"}],
+    "RS > 80": [{"left": "rs", "op": ">", "right": 80}],
+    "Volume surge (1.5x)": [{"left": "volume_ratio", "op": ">=", "right": 1.5}],
+    "Within 10% of 52-week high": [{"left": "pct_from_high", "op": "<=", "right": 10}],
+    "RSI (14) oversold": [{"left": "rsi14", "op": "<", "right": 30}],
+}
+
+
+class ScreenRuleError(ValueError):
+    """Raised when a screen rule references an unknown field or operator."""
+
+
+def _latest_indicator(tickers: List[str], name: str, params: Dict[str, Any], as_of: str) -> np.ndarray:
+    """Each ticker's indicator value on its last bar up to `as_of`, from the shared indicator cache."""
+    values = [indicator_cache.latest(ticker, name, params, as_of=as_of) for ticker in tickers]
+    return np.array([v[-1] if len(v) else np.nan for v in values], dtype=np.float64)
+
+
+def build_cross_section(tickers: List[str], as_of: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """Computes every screen field for every ticker from (bars x tickers) panels in one pass."""
+    if not tickers:
+        return pd.DataFrame(columns=list(SCREEN_FIELDS))
+    as_of = as_of or pd.Timestamp.today().normalize()
+    start = (as_of - pd.Timedelta(days=SCREEN_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+    end = as_of.strftime("%Y-%m-%d")
+
+    panels = load_field_panels(tickers, ["close", "volume"], start=start, end=end)
+    close_panel = panels["close"].ffill()
+    close = close_panel.to_numpy(dtype=np.float64)
+    volume = panels["volume"].to_numpy(dtype=np.float64)
+
+    last = close[-1]
+    avg_volume20 = rolling_mean(volume, 20)[-1]
+    high_52w = rolling_extreme(close, min(252, len(close)), np.max)[-1]
+    rankings = get_rs_rankings(as_of)
+    tickers = list(close_panel.columns)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frame = pd.DataFrame({
+            "close": last,
+            "change_pct": (last / close[-2] - 1.0) * 100 if len(close) > 1 else np.nan,
+            # Moving averages/RSI come from the indicator cache (shared with the Signal
+            # column and rule-graph strategies), so a repeat scan recomputes none of them.
+            "sma20": _latest_indicator(tickers, "sma", {"window": 20}, end),
+            "sma50": _latest_indicator(tickers, "sma", {"window": 50}, end),
+            "sma200": _latest_indicator(tickers, "sma", {"window": 200}, end),
+            "rsi14": _latest_indicator(tickers, "rsi", {"window": 14}, end),
+            "volume": volume[-1],
+            "avg_volume20": avg_volume20,
+            "volume_ratio": volume[-1] / avg_volume20,
+            "high_52w": high_52w,
+            "pct_from_high": (1.0 - last / high_52w) * 100,
+            "rs": [rankings.get(t, np.nan) for t in tickers],
+        }, index=pd.Index(close_panel.columns, name="ticker"))
+    return frame
+
+
+def get_cross_section(tickers: List[str], as_of: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """Cross-section for a ticker set, built once per trading day (and bar store generation) and shared through the diskcache."""
+    as_of = as_of or pd.Timestamp.today().normalize()
+    digest = hashlib.sha1("|".join(sorted(set(tickers))).encode("utf-8")).hexdigest()
+    key = f"{SCREEN_CACHE_PREFIX}:{as_of:%Y-%m-%d}:{cache_generation(BARS_GENERATION)}:{digest}"
+    frame = cache.get(key)
+    if frame is None:
+        frame = build_cross_section(tickers, as_of)
+        cache.set(key, frame, expire=SCREEN_CACHE_TTL_SECONDS)
+    return frame
+
+
+def _operand(value: Any) -> str:
+    if isinstance(value, str) and value in SCREEN_FIELDS:
+        return value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ScreenRuleError(f"Unknown field or value: {value!r}")
+    if not math.isfinite(number):
+        raise ScreenRuleError(f"Value must be a finite number: {value!r}")
+    return repr(number)
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(rule_key: Tuple[Tuple[str, str, str], ...]) -> str:
+    clauses = []
+    for left, op, right in rule_key:
+        if left not in SCREEN_FIELDS:
+            raise ScreenRuleError(f"Unknown field: {left!r}")
+        if op not in SCREEN_OPERATORS:
+            raise ScreenRuleError(f"Unknown operator: {op!r}")
+        clauses.append(f"({left} {op} {_operand(right)})")
+    return " & ".join(clauses)
+
+
+def compile_rules(rules: List[Dict[str, Any]]) -> str:
+    """Validates rules and compiles them into a single boolean expression string (cached per rule set)."""
+    rule_key = tuple((r["left"], r["op"], str(r["right"])) for r in rules)
+    return _compile_expression(rule_key)
+
+
+def run_screen(cross_section: pd.DataFrame, rules: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Evaluates the compiled rules over the whole cross-section at once and returns the matching rows."""
+    if not rules or cross_section.empty:
+        return cross_section
+    mask = cross_section.eval(compile_rules(rules))
+    return cross_section[mask.fillna(False).astype(bool)]
@@ -0,0 +1,239 @@
+# foundry_dash/core/logic/strategy_sandbox.py
+
+import ast
+import builtins
+import hashlib
+import math
+import multiprocessing
+import signal
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
+import numpy as np
+import pandas as pd
+
+from core.io.market_data import get_synthetic_bars, load_bars
+
+# Coder's Pad strategies must define `signals(df) -> ndarray`, where `df` is one
+# ticker's OHLCV frame and the result holds one target position (0..1) per bar.
+#
+# Source is validated once (AST checks) and compiled once per content hash. Each
+# worker process executes the module body once and then calls `signals` per
+# ticker, so nothing is re-parsed or exec'd per ticker.
+#
+# Strategy code never sees a real module: `np`, `pd` and `math` (predefined, or
+# bound by `import numpy as np` etc.) are namespaces holding an allow-listed set
+# of array and math functions, and EVERY attribute access in the source must
+# use an allow-listed name. A chain that would reach os/sys/io through a module
+# or object (e.g. `pd.io.common.os.system`) or a pandas file writer
+# (`df.to_csv`) is therefore rejected before anything runs. Strategies still
+# execute in worker processes under a time limit, never in the web worker.
+
+# Data and array attributes used on `df`, Series, ndarrays and ufuncs.
+DATA_ATTRIBUTES = {
+    "open", "high", "low", "close", "volume",
+    "rolling", "ewm", "expanding", "mean", "median", "max", "min", "std", "var", "sum", "prod", "count",
+    "quantile", "rank", "shift", "diff", "pct_change", "cumsum", "cumprod", "cummax", "cummin",
+    "fillna", "ffill", "bfill", "dropna", "isna", "notna", "where", "mask", "clip", "abs", "round",
+    "astype", "to_numpy", "values", "copy", "reshape", "ravel", "any", "all", "apply",
+    "iloc", "loc", "index", "columns", "shape", "size", "ndim", "T", "accumulate", "reduce",
+}
+# The whole API of the `np`, `pd` and `math` namespaces handed to strategies.
+NUMPY_API = {
+    "where", "select", "zeros", "ones", "full", "zeros_like", "ones_like", "full_like", "empty_like",
+    "array", "asarray", "arange", "linspace", "concatenate", "stack", "roll",
+    "maximum", "minimum", "abs", "sign", "log", "log1p", "exp", "expm1", "sqrt", "power",
+    "isnan", "isfinite", "nan_to_num", "clip", "diff", "cumsum", "cumprod", "mean", "std", "sum",
+    "max", "min", "nanmean", "nanstd", "nanmax", "nanmin", "nansum", "percentile",
+    "logical_and", "logical_or", "logical_not", "greater", "less", "float64", "int64", "nan", "inf",
+}
+PANDAS_API = {"Series", "DataFrame", "isna", "notna", "concat"}
+MATH_API = {"sqrt", "log", "exp", "floor", "ceil", "isnan", "isfinite", "fabs", "pi", "e", "inf", "nan"}
+ALLOWED_ATTRIBUTES = DATA_ATTRIBUTES | NUMPY_API | PANDAS_API | MATH_API
+SAFE_MODULES = {
+    "numpy": SimpleNamespace(**{name: getattr(np, name) for name in NUMPY_API}),
+    "pandas": SimpleNamespace(**{name: getattr(pd, name) for name in PANDAS_API}),
+    "math": SimpleNamespace(**{name: getattr(math, name) for name in MATH_API}),
+}
+FORBIDDEN_NAMES = {
+    "eval", "exec", "compile", "open", "__import__", "globals", "locals", "vars",
+    "getattr", "setattr", "delattr", "input", "breakpoint", "exit", "quit", "memoryview",
+}
+SAFE_BUILTINS = {
+    name: getattr(builtins, name) for name in (
+        "abs", "all", "any", "bool", "dict", "enumerate", "float", "int", "isinstance", "len",
+        "list", "max", "min", "range", "reversed", "round", "set", "sorted", "str", "sum",
+        "tuple", "zip", "ValueError", "Exception",
+    )
+}
+DEFAULT_CALL_TIMEOUT_SECONDS = 10.0
+DRY_RUN_TIMEOUT_SECONDS = 5.0
+
+_compiled: Dict[str, Any] = {}
+_signal_functions: Dict[str, Callable[[pd.DataFrame], np.ndarray]] = {}
+
+
+class StrategyValidationError(ValueError):
+    """Raised when strategy source is rejected before it is ever executed."""
+
+
+class StrategyExecutionError(RuntimeError):
+    """Raised when a strategy fails, times out or returns a malformed signal array."""
+
+
+def source_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def validate_strategy_source(source: str) -> ast.Module:
+    """Parses and checks strategy source; raises StrategyValidationError with a user-facing reason."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as e:
+        raise StrategyValidationError(f"Syntax error on line {e.lineno}: {e.msg}")
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            modules = [alias.name for alias in node.names] if isinstance(node, ast.Import) else [node.module or ""]
+            for module in modules:
+                if module not in SAFE_MODULES:
+                    raise StrategyValidationError(f"Import of '{module}' is not allowed (allowed: {', '.join(sorted(SAFE_MODULES))})")
+            if isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    if alias.name not in ALLOWED_ATTRIBUTES:
+                        raise StrategyValidationError(f"Import of '{alias.name}' from '{node.module}' is not allowed")
+        elif isinstance(node, ast.Name) and (node.id in FORBIDDEN_NAMES or node.id.startswith("__")):
+            raise StrategyValidationError(f"Use of '{node.id}' is not allowed")
+        elif isinstance(node, ast.Attribute) and node.attr not in ALLOWED_ATTRIBUTES:
+            raise StrategyValidationError(f"Attribute '{node.attr}' is not allowed")
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            raise StrategyValidationError("global/nonlocal statements are not allowed")
+
+    has_signals = any(
+        isinstance(node, ast.FunctionDef) and node.name == "signals" and len(node.args.args) == 1
+        for node in tree.body
+    )
+    if not has_signals:
+        raise StrategyValidationError("Strategy must define a top-level function `signals(df)`")
+    return tree
+
+
+def compile_strategy(source: str) -> Any:
+    """Validates and compiles source to a code object, cached by content hash."""
+    digest = source_hash(source)
+    code = _compiled.get(digest)
+    if code is None:
+        tree = validate_strategy_source(source)
+        code = compile(tree, filename=f"<strategy:{digest[:12]}>", mode="exec")
+        _compiled[digest] = code
+    return code
+
+
+def _restricted_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """Binds `import numpy` and friends to the allow-listed namespaces, never the real modules."""
+    if name not in SAFE_MODULES or level:
+        raise ImportError(f"Import of '{name}' is not allowed")
+    return SAFE_MODULES[name]
+
+
+def load_signals_function(source: str) -> Callable[[pd.DataFrame], np.ndarray]:
+    """Executes the module body once per process and returns its `signals` function (cached by hash)."""
+    digest = source_hash(source)
+    fn = _signal_functions.get(digest)
+    if fn is None:
+        namespace = {
+            "__builtins__": dict(SAFE_BUILTINS, __import__=_restricted_import),
+            "np": SAFE_MODULES["numpy"], "pd": SAFE_MODULES["pandas"], "math": SAFE_MODULES["math"],
+        }
+        exec(compile_strategy(source), namespace)
+        fn = namespace["signals"]
+        _signal_functions[digest] = fn
+    return fn
+
+
+@contextmanager
+def time_limit(seconds: Optional[float]):
+    """Raises StrategyExecutionError if the block runs longer than `seconds` (POSIX main thread only)."""
+    usable = seconds and hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread()
+    if not usable:
+        yield
+        return
+
+    def _on_timeout(signum, frame):
+        raise StrategyExecutionError(f"timed out after {seconds:.0f}s")
+
+    previous = signal.signal(signal.SIGALRM, _on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def evaluate_signals(source: str, bars: pd.DataFrame, timeout: Optional[float] = DEFAULT_CALL_TIMEOUT_SECONDS) -> np.ndarray:
+    """Runs `signals(df)` for one ticker and checks the result is one finite 0..1 position per bar."""
+    fn = load_signals_function(source)
+    try:
+        with time_limit(timeout):
+            result = np.asarray(fn(bars.copy()), dtype=np.float64).reshape(-1)
+    except StrategyExecutionError:
+        raise
+    except Exception as e:
+        raise StrategyExecutionError(f"{type(e).__name__}: {e}")
+    if result.shape[0] != len(bars):
+        raise StrategyExecutionError(f"signals() returned {result.shape[0]} values for {len(bars)} bars")
+    return np.clip(np.nan_to_num(result, nan=0.0), 0.0, 1.0)
+
+
+def python_strategy_positions(source: str, close_panel: pd.DataFrame) -> np.ndarray:
+    """Position matrix for a Coder's Pad strategy, aligned to a date x ticker close panel."""
+    start, end = close_panel.index[0], close_panel.index[-1]
+    positions = np.zeros(close_panel.shape)
+    for col, ticker in enumerate(close_panel.columns):
+        bars = load_bars(ticker, None, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+        if bars.empty:
+            continue
+        signals = pd.Series(evaluate_signals(source, bars), index=bars.index)
+        positions[:, col] = signals.reindex(close_panel.index).fillna(0.0).to_numpy()
+    return positions
+
+
+def _dry_run_target(source: str, connection):
+    try:
+        bars = get_synthetic_bars("DRY-RUN")
+        evaluate_signals(source, bars, timeout=None)
+        connection.send(None)
+    except Exception as e:
+        connection.send(str(e))
+    finally:
+        connection.close()
+
+
+def dry_run_strategy(source: str, timeout: float = DRY_RUN_TIMEOUT_SECONDS) -> Optional[str]:
+    """Validates, then test-runs a strategy on sample bars in a separate process.
+
+    Returns None on success or an error message. A hanging strategy is killed after `timeout`,
+    so saving a bad strategy never blocks the calling (web) worker.
+    """
+    try:
+        validate_strategy_source(source)
+    except StrategyValidationError as e:
+        return str(e)
+
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_dry_run_target, args=(source, sender), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            return f"Test run timed out after {timeout:.0f}s"
+        return receiver.recv()
+    except EOFError:
+        return "Test run crashed before returning a result"
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join(timeout=1)
+        receiver.close()
@@ -0,0 +1,161 @@
+# foundry_dash/core/logic/telemetry.py
+
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:  # falls back to load average and /proc (or peak RSS) below
+    psutil = None
+
+from core.io.shared_cache import cache
+
+# System-health telemetry for the sidebar. One daemon thread per process takes
+# a snapshot every SAMPLE_INTERVAL_SECONDS into a fixed-size ring buffer; the
+# sidebar callback only reads the newest entry, so a refresh costs a deque
+# lookup and monitoring load does not grow with the number of open browsers.
+#
+# Engine activity happens in background-callback processes, so it is counted
+# in the shared diskcache: live jobs heartbeat into one dict, and computed
+# cells go to an atomic counter whose rate the sampler turns into throughput.
+
+SAMPLE_INTERVAL_SECONDS = 5.0
+HISTORY_SAMPLES = 720  # one hour at the default interval
+DISK_PATH = Path("./data")
+
+ENGINE_JOBS_KEY = "telemetry:engine-jobs"
+ENGINE_CELLS_KEY = "telemetry:engine-cells"
+ENGINE_JOB_STALE_SECONDS = 600  # a job that stopped heartbeating (killed, cancelled) drops out after this
+
+
+# --- Engine counters (called from engine jobs, any process) ---
+def engine_job_heartbeat(job_id: str):
+    """Marks an engine job as live (call when it starts and as it progresses)."""
+    with cache.transact():
+        jobs = cache.get(ENGINE_JOBS_KEY, default={})
+        jobs[job_id] = time.time()
+        cache.set(ENGINE_JOBS_KEY, jobs)
+
+
+def engine_job_finished(job_id: str):
+    with cache.transact():
+        jobs = cache.get(ENGINE_JOBS_KEY, default={})
+        if jobs.pop(job_id, None) is not None:
+            cache.set(ENGINE_JOBS_KEY, jobs)
+
+
+def record_engine_cells(count: int):
+    """Adds computed backtest cells to the shared throughput counter."""
+    if count:
+        cache.incr(ENGINE_CELLS_KEY, count, default=0)
+
+
+# --- Probes (each falls back to something cheap when psutil is missing) ---
+def _cpu_percent() -> Optional[float]:
+    if psutil is not None:
+        return psutil.cpu_percent(interval=None)  # since the previous call: no blocking
+    try:
+        return min(100.0, 100.0 * os.getloadavg()[0] / (os.cpu_count() or 1))
+    except (AttributeError, OSError):
+        return None
+
+
+def _rss_mb() -> Optional[float]:
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 1e6
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3  # peak, in KB on Linux
+    except ImportError:
+        return None
+
+
+def _ram_percent() -> Optional[float]:
+    if psutil is not None:
+        return psutil.virtual_memory().percent
+    try:
+        pages, available = os.sysconf("SC_PHYS_PAGES"), os.sysconf("SC_AVPHYS_PAGES")
+        return 100.0 * (1 - available / pages)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _disk_percent(path: Path) -> Optional[float]:
+    try:
+        usage = shutil.disk_usage(path if path.exists() else Path("."))
+        return 100.0 * usage.used / usage.total
+    except OSError:
+        return None
+
+
+class TelemetrySampler:
+    """Samples system and engine metrics on a daemon thread into a ring buffer."""
+
+    def __init__(self, interval_seconds: float = SAMPLE_INTERVAL_SECONDS, history: int = HISTORY_SAMPLES):
+        self.interval_seconds = interval_seconds
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._last_cells: Optional[int] = None
+        self._last_at: Optional[float] = None
+
+    def sample(self) -> Dict[str, Any]:
+        now = time.time()
+        jobs = cache.get(ENGINE_JOBS_KEY, default={})
+        cells = cache.get(ENGINE_CELLS_KEY, default=0)
+        throughput = 0.0
+        if self._last_cells is not None and now > self._last_at:
+            throughput = max(0, cells - self._last_cells) / (now - self._last_at)
+        self._last_cells, self._last_at = cells, now
+        return {
+            "at": now,
+            "cpu_percent": _cpu_percent(),
+            "ram_percent": _ram_percent(),
+            "rss_mb": _rss_mb(),
+            "disk_percent": _disk_percent(DISK_PATH),
+            "cache_mb": cache.volume() / 1e6,
+            "queue_depth": sum(1 for beat in jobs.values() if now - beat < ENGINE_JOB_STALE_SECONDS),
+            "engine_cells_per_second": throughput,
+        }
+
+    def _run(self):
+        while True:
+            try:
+                snapshot = self.sample()
+                with self._lock:
+                    self._samples.append(snapshot)
+            except Exception as e:
+                print(f"[TELEMETRY] Sample failed: {e}")
+            time.sleep(self.interval_seconds)
+
+    def start(self):
+        """Starts the sampling thread once per process (safe to call from every request)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="telemetry-sampler", daemon=True)
+            self._thread.start()
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Newest snapshot (None until the first sample lands)."""
+        self.start()
+        with self._lock:
+            return self._samples[-1] if self._samples else None
+
+    def history(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._samples)
+
+
+# Shared per process: started lazily by the first reader, so each gunicorn worker samples on its own thread.
+telemetry_sampler = TelemetrySampler()
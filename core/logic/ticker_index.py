@@ -0,0 +1,107 @@
+# foundry_dash/core/logic/ticker_index.py
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from core.io.data_persistence import DEFAULT_UNIVERSES_PATH, get_all_known_tickers, known_tickers_version
+from core.logic.instruments import ParsedTicker, parse_ticker
+
+# In-memory search index over the ticker master, so the add-stocks dropdown can
+# ask the server for the top matches of what the user typed instead of
+# receiving the whole master list on every change.
+#
+# Every ticker is parsed into exchange / symbol / series ("NSE:RELIANCE-EQ" ->
+# NSE, RELIANCE, EQ). Symbol prefixes (a flattened trie) answer the common
+# "start typing the symbol" case with one dict lookup; character trigrams
+# answer substring queries ("AUTO" finding BAJAJ-AUTO) by intersecting
+# posting lists, so neither path scans the full master.
+
+MAX_PREFIX_LENGTH = 12
+DEFAULT_SEARCH_LIMIT = 25
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TickerIndex:
+    """Prefix and trigram index over a ticker list; `search` returns ranked top matches."""
+
+    def __init__(self, tickers: Iterable[str]):
+        self.tickers: List[str] = sorted(set(tickers))
+        self.parsed: List[ParsedTicker] = [parse_ticker(t) for t in self.tickers]
+        self._prefixes: Dict[str, List[int]] = {}
+        self._trigram_postings: Dict[str, Set[int]] = {}
+        for ticker_id, (ticker, parsed) in enumerate(zip(self.tickers, self.parsed)):
+            keys = {parsed.symbol, ticker.upper()}
+            for key in keys:
+                for length in range(1, min(len(key), MAX_PREFIX_LENGTH) + 1):
+                    postings = self._prefixes.setdefault(key[:length], [])
+                    if not postings or postings[-1] != ticker_id:
+                        postings.append(ticker_id)
+            for gram in _trigrams(parsed.symbol):
+                self._trigram_postings.setdefault(gram, set()).add(ticker_id)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def _prefix_ids(self, prefix: str) -> List[int]:
+        if len(prefix) <= MAX_PREFIX_LENGTH:
+            return self._prefixes.get(prefix, [])
+        # Longer than the indexed prefixes: narrow with the longest one, then check.
+        return [i for i in self._prefixes.get(prefix[:MAX_PREFIX_LENGTH], [])
+                if self.tickers[i].upper().startswith(prefix) or self.parsed[i].symbol.startswith(prefix)]
+
+    def _substring_ids(self, text: str) -> List[int]:
+        grams = _trigrams(text)
+        if not grams:
+            return []
+        postings = sorted((self._trigram_postings.get(g, set()) for g in grams), key=len)
+        return [i for i in set.intersection(*postings) if text in self.parsed[i].symbol]
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT, exclude: Iterable[str] = ()) -> List[str]:
+        """Top `limit` tickers for a query, best first: exact symbol, symbol/ticker prefix, then substring.
+
+        The query is parsed like a ticker, so "NSE:REL" skips other exchanges' listings and "TCS-EQ" matches TCS.
+        """
+        excluded = set(exclude)
+        text = (query or "").strip().upper()
+        if not text:
+            return [t for t in self.tickers if t not in excluded][:limit]
+        wanted = parse_ticker(text)
+
+        ranked: Dict[int, Tuple[int, int, str]] = {}
+        for rank, ids in (
+            (0, [i for i in self._prefix_ids(wanted.symbol) if self.parsed[i].symbol == wanted.symbol]),
+            (1, self._prefix_ids(text)),
+            (1, self._prefix_ids(wanted.symbol)),
+            (2, self._substring_ids(wanted.symbol)),
+        ):
+            for i in ids:
+                if i not in ranked:
+                    ranked[i] = (rank, len(self.parsed[i].symbol), self.tickers[i])
+
+        results = []
+        for i in sorted(ranked, key=ranked.get):
+            parsed = self.parsed[i]
+            if wanted.exchange and parsed.exchange not in (None, wanted.exchange):
+                continue
+            if wanted.series and parsed.series not in (None, wanted.series):
+                continue
+            if self.tickers[i] in excluded:
+                continue
+            results.append(self.tickers[i])
+            if len(results) == limit:
+                break
+        return results
+
+
+@lru_cache(maxsize=2)
+def _build_master_index(universes_path: Path, version: Tuple) -> TickerIndex:
+    return TickerIndex(get_all_known_tickers(universes_path))
+
+
+def get_ticker_index(universes_path: Path = DEFAULT_UNIVERSES_PATH) -> TickerIndex:
+    """Shared index over the ticker master, rebuilt only when the master list can have changed."""
+    return _build_master_index(universes_path, known_tickers_version(universes_path))
@@ -1,70 +1,104 @@
 # foundry_dash/core/logic/universe_helpers.py (Complete Code)
 
-import copy # Required for deepcopy
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
 import pandas as pd
 
-def get_available_stocks(current_stocks: List[str], all_tickers: List[str]) -> List[str]:
-    """Calculates which stocks can be added (available minus current)."""
-    current_stocks_set = set(current_stocks)
-    available_stocks = [s for s in all_tickers if s not in current_stocks_set]
-    return sorted(available_stocks)
+from core.io.market_data import load_bars
+from core.io.shared_cache import BARS_GENERATION, cache
+from core.logic.details_provider import StockDetailsProvider
+from core.logic.indicators import indicator_cache
+from core.logic.instruments import canonicalize_tickers
+from core.logic.relative_strength import rs_rank
 
 def apply_universe_changes(
-    current_universes: Dict[str, List[str]],
-    selected_universe: str,
+    current_stocks: List[str],
     stocks_to_add: List[str],
     stocks_to_remove: List[str],
     manual_stocks_text: str
-) -> Dict[str, List[str]]:
-    """Applies additions and removals to the selected universe and returns the updated dict."""
+) -> List[str]:
+    """Applies additions and removals to one universe's members and returns the new sorted list."""
     
-    if not selected_universe or selected_universe not in current_universes:
-        return current_universes
-    
-    # CRITICAL FIX: Use deepcopy to prevent state mutation in other universes (Bug 2)
-    new_universes = copy.deepcopy(current_universes) 
-    
-    # Work on a set for efficient manipulation
-    current_stocks = set(new_universes.get(selected_universe, []))
+    # Work on a set of canonical IDs, so NSE:TCS-EQ / BSE:TCS-EQ / TCS collapse to one member
+    new_stocks = set(canonicalize_tickers(current_stocks))
     
     # 1. Additions from Checkboxes
-    current_stocks.update(set(s for s in stocks_to_add if s))
+    new_stocks.update(canonicalize_tickers(stocks_to_add))
 
     # 2. Additions from Manual Entry
     if manual_stocks_text:
-        manual_additions = {s.strip().upper() for s in manual_stocks_text.splitlines() if s.strip()}
-        current_stocks.update(manual_additions)
+        manual_additions = canonicalize_tickers(manual_stocks_text.splitlines())
+        new_stocks.update(manual_additions)
         
     # 3. Removals
-    stocks_to_remove_set = set(s for s in stocks_to_remove if s)
-    current_stocks.difference_update(stocks_to_remove_set)
-    
-    # Update the specific universe list
-    new_universes[selected_universe] = sorted(list(current_stocks))
+    stocks_to_remove_set = set(canonicalize_tickers(stocks_to_remove))
+    new_stocks.difference_update(stocks_to_remove_set)
     
-    return new_universes
+    return sorted(new_stocks)
 
 def create_table_data(stocks: List[str]) -> List[Dict[str, str]]:
     """Converts a list of stocks into the format Dash DataTable expects."""
     # NOTE: This function is required and was previously missing from imports.
     return [{"tickers": s} for s in stocks]
 
-# --- Placeholder function for V2.0 Stock Details (Pricing, etc.) ---
+# --- V2.0 Stock Details (Pricing from the bar store, RS and Signal from shared engines) ---
+STOCK_DETAIL_COLUMNS = ["Ticker", "Price (INR)", "Change (%)", "RS Ranking", "Signal"]
+
+def compute_stock_details(ticker: str) -> Dict:
+    """Computes one viewer row, reading only the last two closes of the ticker."""
+    closes = load_bars(ticker, ["close"], last_n=2)["close"].to_numpy()
+    price = closes[-1] if len(closes) else float("nan")
+    change = (closes[-1] / closes[-2] - 1) * 100 if len(closes) == 2 else float("nan")
+    return {
+        "Ticker": ticker,
+        "Price (INR)": round(float(price), 2),
+        "Change (%)": round(float(change), 2),
+        "RS Ranking": rs_rank(ticker),
+        "Signal": classify_signal(closes, indicator_cache.latest(ticker, "sma", {"window": 50}, n=2)),
+    }
+
+def classify_signal(closes, sma50) -> str:
+    """Viewer signal from the last two closes against the (cached) 50-bar SMA."""
+    if len(closes) < 2 or len(sma50) < 2 or np.isnan(sma50).any():
+        return "HOLD"
+    if closes[-1] > sma50[-1] * 1.10:
+        return "EXTENDED"
+    if closes[-2] <= sma50[-2] and closes[-1] > sma50[-1]:
+        return "TRIGGERED_BUY"
+    if sma50[-1] * 0.97 <= closes[-1] <= sma50[-1]:
+        return "WATCHLIST"
+    return "HOLD"
+
+# Shared across callbacks: universes that share tickers reuse the same cached rows.
+# Rows are recomputed in every worker once an ingestion run bumps the bar store's generation.
+stock_details_provider = StockDetailsProvider(compute_stock_details, cache=cache, depends_on=(BARS_GENERATION,))
+
 def get_stock_details_df(stocks: List[str]) -> pd.DataFrame:
-    """Mocks fetching real-time data for the current universe stocks."""
+    """Builds the viewer rows for the given stocks from the cached details provider."""
     if not stocks:
-        return pd.DataFrame()
-        
-    # Mock data for demonstration and new layout
-    data = []
-    for i, ticker in enumerate(stocks):
-        data.append({
-            "Ticker": ticker,
-            "Price (INR)": round(1500 + i * 10.5, 2),
-            "Change (%)": round((-0.5 + (i % 5) / 4) * 1.5, 2),
-            "RS Ranking": (i % 99) + 1,
-            "Signal": ["HOLD", "TRIGGERED_BUY", "WATCHLIST", "EXTENDED"][i % 4]
-        })
-        
-    return pd.DataFrame(data)
\ No newline at end of file
+        return pd.DataFrame(columns=STOCK_DETAIL_COLUMNS)
+    return pd.DataFrame(stock_details_provider.get_many(stocks), columns=STOCK_DETAIL_COLUMNS)
+
+def get_stock_details_page(
+    stocks: List[str],
+    page_current: int,
+    page_size: int,
+    sort_by: Optional[List[Dict[str, str]]] = None,
+) -> pd.DataFrame:
+    """Returns one page of viewer rows, computing details only for the visible tickers when possible."""
+    sort_by = [s for s in (sort_by or []) if s.get("column_id") in STOCK_DETAIL_COLUMNS]
+    start = max(page_current or 0, 0) * page_size
+
+    # Ticker order needs no details at all: sort the symbols, then build the slice.
+    if all(s["column_id"] == "Ticker" for s in sort_by):
+        descending = bool(sort_by) and sort_by[0].get("direction") == "desc"
+        ordered = sorted(stocks, reverse=descending)
+        return get_stock_details_df(ordered[start:start + page_size])
+
+    details = get_stock_details_df(stocks).sort_values(
+        by=[s["column_id"] for s in sort_by],
+        ascending=[s.get("direction", "asc") == "asc" for s in sort_by],
+        kind="stable",
+        na_position="last",
+    )
+    return details.iloc[start:start + page_size]
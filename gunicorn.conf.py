@@ -0,0 +1,31 @@
+# foundry_dash/gunicorn.conf.py
+
+import multiprocessing
+import os
+
+# Multi-worker production settings for `gunicorn -c gunicorn.conf.py wsgi:server`.
+# Every setting can be overridden from the environment.
+
+bind = os.environ.get("FOUNDRY_BIND", "0.0.0.0:8050")
+
+# One process per core for CPU-bound callbacks (backtests, screens, RS ranks),
+# with a few threads each so I/O-bound callbacks don't queue behind them.
+workers = int(os.environ.get("FOUNDRY_WORKERS", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = int(os.environ.get("FOUNDRY_THREADS", "4"))
+
+# Long engine jobs run as background callbacks, not in the request; this only
+# bounds slow page loads.
+timeout = int(os.environ.get("FOUNDRY_TIMEOUT", "120"))
+graceful_timeout = 30
+
+# No preload: the diskcache's SQLite connections must not be shared across a
+# fork, so each worker opens its own. Startup stays cheap (lazy page layouts).
+preload_app = False
+
+# Recycle workers now and then to cap memory held by in-process caches.
+max_requests = int(os.environ.get("FOUNDRY_MAX_REQUESTS", "2000"))
+max_requests_jitter = 200
+
+# Production mode: the app only enables debug tooling when run directly.
+raw_env = ["FOUNDRY_DEBUG=0"]
@@ -1,7 +1,7 @@
 # foundry_dash/layouts/helpers.py
 
 import dash_bootstrap_components as dbc
-from dash import html
+from dash import dcc, html
 
 def render_page_header(title, subtitle):
     """Creates a consistent, professional header card with reduced vertical space."""
@@ -17,14 +17,15 @@ def render_page_header(title, subtitle):
 
 def system_health_sidebar():
     """Renders the persistent health monitoring panel with high-contrast text."""
-    # NOTE: This content is moved here from app.py
+    # NOTE: This content is moved here from app.py. Values are filled in by the
+    # health callback from the telemetry sampler's latest snapshot.
     return html.Div(
         [
             # Headers are correct (text-white)
             html.H5("📊 SYSTEM HEALTH", className="text-white mt-4 mb-2"),
-            dbc.Progress(value=45, label="CPU: 45%", color="success", className="mb-2"),
-            dbc.Progress(value=62, label="RAM: 62%", color="warning", className="mb-2"),
-            dbc.Progress(value=78, label="Disk: 78%", color="warning", className="mb-4"),
+            dbc.Progress(id='health-cpu-bar', value=0, label="CPU: –", color="success", className="mb-2"),
+            dbc.Progress(id='health-ram-bar', value=0, label="RAM: –", color="success", className="mb-2"),
+            dbc.Progress(id='health-disk-bar', value=0, label="Disk: –", color="success", className="mb-4"),
             
             html.H5("📈 DATA STATUS", className="text-white mt-4 mb-2"),
             html.Hr(className="border-light my-1"), 
@@ -32,10 +33,14 @@ def system_health_sidebar():
             # CRITICAL FIX: Ensure ALL essential text is explicitly text-white
             html.P("✅ Fresh (Updated 2h ago)", className="text-white small"), 
             html.P("Last Library Build: ✅ Success", className="text-white small"), 
-            html.P("250/250 Strategies Processed", className="text-white small"), # Changed from text-muted
+            html.P("Engine: waiting for first sample", id='health-engine-text', className="text-white small"),
+            html.P(id='health-process-text', className="text-white small"),
             
             html.H5("🐛 DEBUG", className="text-white mt-4 mb-2"),
-            dbc.Button("Show Debug Info", color="secondary", outline=True, size="sm")
+            dbc.Button("Show Debug Info", color="secondary", outline=True, size="sm"),
+
+            # Reads only the newest snapshot; disabled while the sidebar is hidden.
+            dcc.Interval(id='health-interval', interval=5000, n_intervals=0),
         ],
         className="w-64 bg-dark p-3 h-full fixed overflow-auto"
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,72 @@
+#foundry_dash/pages/02_screener.py
+import dash
+from dash import dcc, html, dash_table
+import dash_bootstrap_components as dbc
+
+# --- CORE UTILS ---
+from core.logic.screener import SCREEN_FIELDS, SCREEN_OPERATORS, SCREEN_PRESETS
+
+
+# --- Register the Page ---
+dash.register_page(
+    __name__,
+    path='/screener',
+    name='🔭 Screener',
+    order=2
+)
+
+# --- Reduced Header Content (Global Page Header) ---
+reduced_header = html.Div(
+    [
+        html.H3("Screener", className="text-primary fw-bold mb-1"),
+        html.H6("Scan a whole universe at once with compiled, vectorized filter rules.", className="text-muted"),
+        html.Hr(className="my-3")
+    ]
+)
+
+field_options = [{'label': label, 'value': field} for field, label in SCREEN_FIELDS.items()]
+
+# --- Screen Definition Card ---
+screen_controls = dbc.Card([
+    dbc.CardHeader(html.H4("Screen Definition", className="mb-0")),
+    dbc.CardBody([
+        dbc.Row([
+            dbc.Col(dcc.Dropdown(id='screener-universe-selector', placeholder="Select Stock Universe"), md=4),
+            dbc.Col(dcc.Dropdown(
+                id='screener-preset-selector',
+                options=list(SCREEN_PRESETS.keys()),
+                placeholder="Select Preset Rules",
+                multi=True
+            ), md=8),
+        ], className="mb-3 g-2"),
+
+        html.P("Custom rule (optional): field, operator and a number or another field.", className="text-muted small mb-1"),
+        dbc.Row([
+            dbc.Col(dcc.Dropdown(id='screener-custom-left', options=field_options, placeholder="Field"), md=4),
+            dbc.Col(dcc.Dropdown(id='screener-custom-op', options=SCREEN_OPERATORS, value='>', clearable=False), md=2),
+            dbc.Col(dcc.Input(
+                id='screener-custom-right',
+                type='text',
+                placeholder="Number or field name (e.g. 1.5 or sma50)",
+                className="form-control"
+            ), md=6),
+        ], className="mb-3 g-2"),
+
+        dbc.Button("🔎 Run Scan", id='run-screen-button', color="primary", className="w-100"),
+    ])
+], className="mb-4")
+
+# --- Page Layout ---
+layout = html.Div([
+    reduced_header,
+    screen_controls,
+    dbc.Alert("Choose a universe and at least one rule, then run the scan.", id='screener-status', color="secondary"),
+    dash_table.DataTable(
+        id='screener-results-table',
+        data=[],
+        columns=[{'name': 'Ticker', 'id': 'ticker'}] + [{'name': label, 'id': field} for field, label in SCREEN_FIELDS.items()],
+        page_size=20,
+        sort_action='native',
+        style_header={'backgroundColor': 'var(--bs-gray-200)', 'fontWeight': 'bold'},
+    ),
+])
@@ -0,0 +1,62 @@
+#foundry_dash/pages/03_audit_lab.py
+import dash
+from dash import dcc, html, dash_table
+import dash_bootstrap_components as dbc
+
+# --- CORE UTILS ---
+from core.logic.monte_carlo import DEFAULT_PATHS, MAX_PATHS, MC_METHODS
+
+
+# --- Register the Page ---
+dash.register_page(
+    __name__,
+    path='/audit',
+    name='🔥 Audit Lab',
+    order=3
+)
+
+# --- Reduced Header Content (Global Page Header) ---
+reduced_header = html.Div(
+    [
+        html.H3("Audit Lab", className="text-primary fw-bold mb-1"),
+        html.H6("Stress-test a strategy's trade list with Monte Carlo bootstrap and trade-shuffle resampling.", className="text-muted"),
+        html.Hr(className="my-3")
+    ]
+)
+
+# --- Stress Test Definition Card ---
+stress_controls = dbc.Card([
+    dbc.CardHeader(html.H4("Stress Test", className="mb-0")),
+    dbc.CardBody([
+        dbc.Row([
+            dbc.Col(dcc.Dropdown(id='audit-universe-selector', placeholder="Select Stock Universe"), md=3),
+            dbc.Col(dcc.Dropdown(id='audit-strategy-selector', placeholder="Select Strategy"), md=3),
+            dbc.Col(dcc.Dropdown(id='audit-method-selector', options=MC_METHODS, value='bootstrap', clearable=False), md=3),
+            dbc.Col(dbc.InputGroup([
+                dbc.InputGroupText("Paths"),
+                dbc.Input(id='audit-paths-input', type='number', min=100, max=MAX_PATHS, step=100, value=DEFAULT_PATHS),
+            ]), md=3),
+        ], className="mb-3 g-2"),
+
+        dbc.Button("🔥 Run Stress Test", id='run-audit-button', color="danger", className="w-100"),
+        dbc.Progress(id='audit-progress-bar', value=0, striped=True, animated=True, className="mt-3"),
+    ])
+], className="mb-4")
+
+# --- Page Layout ---
+layout = html.Div([
+    reduced_header,
+    stress_controls,
+    dbc.Alert("Choose a universe and a strategy, then run the stress test.", id='audit-status', color="secondary"),
+    dbc.Row([
+        dbc.Col([
+            html.H5("Percentiles across paths"),
+            dash_table.DataTable(
+                id='audit-summary-table',
+                data=[],
+                style_header={'backgroundColor': 'var(--bs-gray-200)', 'fontWeight': 'bold'},
+            ),
+        ], md=4),
+        dbc.Col(dcc.Graph(id='audit-equity-bands-graph', figure={'data': [], 'layout': {'title': 'Equity percentile bands'}}), md=8),
+    ], className="g-4"),
+])
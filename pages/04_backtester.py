@@ -0,0 +1,83 @@
+#foundry_dash/pages/04_backtester.py
+import dash
+from dash import dcc, html, dash_table
+import dash_bootstrap_components as dbc
+
+# --- CORE UTILS ---
+from core.logic.parameter_sweep import DEFAULT_FOLDS, SWEEP_FAMILIES
+
+
+# --- Register the Page ---
+dash.register_page(
+    __name__,
+    path='/backtester',
+    name='🔬 Backtester',
+    order=4
+)
+
+# --- Reduced Header Content (Global Page Header) ---
+reduced_header = html.Div(
+    [
+        html.H3("Backtester", className="text-primary fw-bold mb-1"),
+        html.H6("Sweep a parameter grid over a universe in one batched run, validated walk-forward.", className="text-muted"),
+        html.Hr(className="my-3")
+    ]
+)
+
+family_options = [{'label': spec['label'], 'value': family} for family, spec in SWEEP_FAMILIES.items()]
+
+# --- Sweep Definition Card ---
+sweep_controls = dbc.Card([
+    dbc.CardHeader(html.H4("Sweep Definition", className="mb-0")),
+    dbc.CardBody([
+        dbc.Row([
+            dbc.Col(dcc.Dropdown(id='backtester-universe-selector', placeholder="Select Stock Universe"), md=4),
+            dbc.Col(dcc.Dropdown(
+                id='backtester-family-selector',
+                options=family_options,
+                value='sma_crossover',
+                clearable=False
+            ), md=4),
+            dbc.Col(dbc.InputGroup([
+                dbc.InputGroupText("Folds"),
+                dbc.Input(id='backtester-folds-input', type='number', min=1, max=12, step=1, value=DEFAULT_FOLDS),
+            ]), md=4),
+        ], className="mb-3 g-2"),
+
+        html.P("Parameter ranges: start:stop:step (stop included) or a comma list.", className="text-muted small mb-1"),
+        dbc.Row([
+            dbc.Col(dbc.InputGroup([
+                dbc.InputGroupText(id='backtester-param-1-label'),
+                dbc.Input(id='backtester-param-1-input', type='text'),
+            ]), md=6),
+            dbc.Col(dbc.InputGroup([
+                dbc.InputGroupText(id='backtester-param-2-label'),
+                dbc.Input(id='backtester-param-2-input', type='text'),
+            ], id='backtester-param-2-group'), md=6),
+        ], className="mb-3 g-2"),
+
+        dbc.Button("🔬 Run Sweep", id='run-sweep-button', color="primary", className="w-100"),
+        dbc.Progress(id='backtester-progress-bar', value=0, striped=True, animated=True, className="mt-3"),
+    ])
+], className="mb-4")
+
+# --- Page Layout ---
+layout = html.Div([
+    reduced_header,
+    sweep_controls,
+    dbc.Alert("Choose a universe and a parameter grid, then run the sweep.", id='backtester-status', color="secondary"),
+    html.H5("Walk-forward (best in-sample grid point per fold, out-of-sample results)", className="mt-3"),
+    dash_table.DataTable(
+        id='backtester-walk-forward-table',
+        data=[],
+        style_header={'backgroundColor': 'var(--bs-gray-200)', 'fontWeight': 'bold'},
+    ),
+    html.H5("Full-period grid results (mean across tickers)", className="mt-4"),
+    dash_table.DataTable(
+        id='backtester-grid-table',
+        data=[],
+        page_size=20,
+        sort_action='native',
+        style_header={'backgroundColor': 'var(--bs-gray-200)', 'fontWeight': 'bold'},
+    ),
+])
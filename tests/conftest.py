@@ -0,0 +1,7 @@
+# foundry_dash/tests/conftest.py
+
+import sys
+from pathlib import Path
+
+# Modules import each other as `core.…` / `callbacks.…` from the project root (as app.py arranges).
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
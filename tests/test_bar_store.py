@@ -0,0 +1,62 @@
+# foundry_dash/tests/test_bar_store.py
+
+import numpy as np
+import pandas as pd
+
+from core.io.bar_store import VERSIONS_DIR, list_tickers, read_bars, read_dates, ticker_dir, write_bars
+
+TICKER = "NSE:RELIANCE-EQ"
+
+
+def _bars(start, periods, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, periods))
+    return pd.DataFrame({
+        "open": close - 0.5, "high": close + 1, "low": close - 1, "close": close,
+        "volume": rng.integers(1_000, 5_000, periods).astype(np.float64),
+    }, index=pd.bdate_range(start, periods=periods, name="date"))
+
+
+def _assert_same_bars(read, expected):
+    # The store keeps day precision; the index resolution it comes back with may differ from the input's.
+    pd.testing.assert_frame_equal(read, expected, check_freq=False, check_index_type=False)
+
+
+def test_round_trip(tmp_path):
+    bars = _bars("2024-01-01", 50)
+    write_bars(TICKER, bars, root=tmp_path)
+
+    _assert_same_bars(read_bars(TICKER, root=tmp_path), bars)
+    assert list_tickers(tmp_path) == [TICKER]
+    assert ticker_dir(TICKER, tmp_path).is_symlink()
+
+
+def test_column_range_and_tail_reads(tmp_path):
+    bars = _bars("2024-01-01", 50)
+    write_bars(TICKER, bars, root=tmp_path)
+
+    window = read_bars(TICKER, ["close"], start="2024-01-10", end="2024-01-31", root=tmp_path)
+    _assert_same_bars(window, bars.loc["2024-01-10":"2024-01-31", ["close"]])
+    tail = read_bars(TICKER, ["close", "volume"], last_n=3, root=tmp_path)
+    _assert_same_bars(tail, bars[["close", "volume"]].iloc[-3:])
+    dates = read_dates(TICKER, tmp_path)
+    assert len(dates) == 50 and dates[-1] == np.datetime64(bars.index[-1].date())
+
+
+def test_append_replaces_history_and_keeps_one_previous_version(tmp_path):
+    history = _bars("2024-01-01", 60)
+    write_bars(TICKER, history.iloc[:40], root=tmp_path)
+    write_bars(TICKER, history.iloc[:50], root=tmp_path)
+    stored = read_bars(TICKER, root=tmp_path)
+    # Overlapping bars are de-duplicated (last write wins) and the result stays date-sorted.
+    write_bars(TICKER, pd.concat([stored, history.iloc[45:]]), root=tmp_path)
+
+    _assert_same_bars(read_bars(TICKER, root=tmp_path), history)
+    versions = list((tmp_path / VERSIONS_DIR).iterdir())[0]
+    assert len(list(versions.iterdir())) == 2
+
+
+def test_missing_ticker_reads_empty(tmp_path):
+    assert read_bars("NOPE", ["close"], root=tmp_path).empty
+    assert len(read_dates("NOPE", tmp_path)) == 0
+    assert list_tickers(tmp_path / "absent") == []
@@ -0,0 +1,68 @@
+# foundry_dash/tests/test_cell_fingerprints.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.logic import backtest_engine
+from core.logic.backtest_engine import STRATEGY_PRESETS, cell_fingerprints, run_build_shard
+
+SPECS = {name: dict(STRATEGY_PRESETS[name], type="preset") for name in ("SMA Crossover 20/50", "Trend Filter 200")}
+
+
+def _panel(periods=300):
+    rng = np.random.default_rng(7)
+    index = pd.bdate_range("2023-01-02", periods=periods, name="date")
+    data = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (periods, 3)), axis=0))
+    return pd.DataFrame(data, index=index, columns=["AAA", "BBB", "CCC"])
+
+
+def _by_cell(cells):
+    return cells.set_index(["strategy", "ticker"])["fingerprint"]
+
+
+def test_unchanged_data_keeps_fingerprints():
+    panel = _panel()
+    pd.testing.assert_series_equal(_by_cell(cell_fingerprints(panel, SPECS)), _by_cell(cell_fingerprints(panel.copy(), SPECS)))
+
+
+@pytest.mark.parametrize("edit", ["append", "historical"])
+def test_changed_ticker_invalidates_only_its_cells(edit):
+    panel = _panel()
+    before = _by_cell(cell_fingerprints(panel, SPECS))
+    if edit == "append":
+        changed = pd.concat([panel, panel.iloc[[-1]].set_axis([panel.index[-1] + pd.offsets.BDay()])])
+        changed.loc[changed.index[-1], ["AAA", "CCC"]] = np.nan
+    else:
+        # Same range, bar count and last close: only the content digest can notice this.
+        changed = panel.copy()
+        changed.iloc[100, 1] *= 1.05
+    after = _by_cell(cell_fingerprints(changed, SPECS))
+
+    moved = (before != after).groupby(level="ticker").all()
+    assert moved.to_dict() == {"AAA": False, "BBB": True, "CCC": False}
+
+
+def test_strategy_and_cost_are_part_of_the_fingerprint():
+    panel = _panel()
+    base = cell_fingerprints(panel, SPECS)
+    assert not base["fingerprint"].isin(cell_fingerprints(panel, SPECS, cost_bps=25.0)["fingerprint"]).any()
+    edited = {name: dict(spec, params={k: v + 1 for k, v in spec["params"].items()}) for name, spec in SPECS.items()}
+    assert not base["fingerprint"].isin(cell_fingerprints(panel, edited)["fingerprint"]).any()
+
+
+def test_build_shard_skips_known_cells_and_recomputes_stale_ones(monkeypatch):
+    panel = _panel()
+    monkeypatch.setattr(backtest_engine, "load_price_panel", lambda tickers: panel[tickers])
+    tickers = list(panel.columns)
+
+    fresh, cells, errors, curves = run_build_shard(tickers, SPECS, set())
+    assert len(fresh) == len(cells) == 6 and not errors
+    assert set(curves) == set(SPECS)
+
+    fresh, cells, _, curves = run_build_shard(tickers, SPECS, set(cells["fingerprint"]))
+    assert fresh.empty and len(cells) == 6 and not curves
+
+    known = set(cells.loc[cells["ticker"] != "BBB", "fingerprint"])
+    fresh, _, _, _ = run_build_shard(tickers, SPECS, known)
+    assert sorted(fresh["ticker"]) == ["BBB", "BBB"]
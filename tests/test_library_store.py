@@ -0,0 +1,91 @@
+# foundry_dash/tests/test_library_store.py
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.io.library_store import (
+    INDEXED_METRICS, MANIFEST_FILE, TABLE_COLUMNS, load_library_store, query_top_runs, save_library_store,
+)
+
+UNIVERSES = ["Nifty 50", "Bank", "IT"]
+STRATEGIES = ["SMA Crossover 20/50", "Breakout 55/20", "Trend Filter 200"]
+
+
+def _library(seed=3, tickers=40):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for strategy in STRATEGIES:
+        for t in range(tickers):
+            for universe in rng.choice(UNIVERSES, size=rng.integers(1, 3), replace=False):
+                rows.append({"universe": universe, "strategy": strategy, "ticker": f"T{t:03d}"})
+    library = pd.DataFrame(rows)
+    for metric in ["total_return", "cagr", "sharpe", "max_drawdown", "win_rate", "exposure"]:
+        library[metric] = rng.normal(0, 1, len(library)).astype(np.float32)
+    library.loc[rng.choice(len(library), 10, replace=False), "sharpe"] = np.nan
+    library["trades"] = rng.integers(0, 50, len(library))
+    library["bars"] = 500
+    library["start_date"] = pd.Timestamp("2020-01-01")
+    library["end_date"] = pd.Timestamp("2024-01-01")
+    library["fingerprint"] = [f"{i:040x}" for i in range(len(library))]
+    return library[TABLE_COLUMNS]
+
+
+def _brute_force(library, metric, n, universes=None, strategies=None, ascending=False):
+    rows = library[library[metric].notna()]
+    if universes is not None:
+        rows = rows[rows["universe"].isin(universes)]
+    if strategies is not None:
+        rows = rows[rows["strategy"].isin(strategies)]
+    return rows.sort_values(metric, ascending=ascending, kind="stable").head(n)
+
+
+@pytest.fixture
+def stored(tmp_path):
+    library = _library()
+    save_library_store(tmp_path, library)
+    return tmp_path, library
+
+
+@pytest.mark.parametrize("metric", INDEXED_METRICS)
+@pytest.mark.parametrize("filters", [{}, {"universes": ["Bank"]}, {"strategies": STRATEGIES[:2]}, {"universes": ["IT", "Bank"], "ascending": True}])
+def test_top_runs_match_a_full_sort(stored, metric, filters):
+    root, library = stored
+    top = query_top_runs(root, metric, 25, **filters)
+    expected = _brute_force(library, metric, 25, **filters)
+
+    assert list(top.columns) == TABLE_COLUMNS
+    np.testing.assert_array_equal(top[metric].to_numpy(), expected[metric].to_numpy())
+    assert set(zip(top["universe"].astype(str), top["strategy"].astype(str), top["ticker"].astype(str))) \
+        == set(zip(expected["universe"], expected["strategy"], expected["ticker"]))
+
+
+def test_top_runs_with_no_match(stored):
+    root, _ = stored
+    assert query_top_runs(root, "sharpe", 10, universes=["Pharma"]).empty
+    with pytest.raises(KeyError):
+        query_top_runs(root, "trades", 10)
+
+
+def test_save_publishes_new_partitions_through_the_manifest(stored):
+    root, library = stored
+    first = json.loads((root / MANIFEST_FILE).read_text())
+
+    changed = library.copy()
+    changed.loc[changed["strategy"] == STRATEGIES[0], "fingerprint"] = "f" * 40
+    save_library_store(root, changed)
+    second = json.loads((root / MANIFEST_FILE).read_text())
+    assert second[STRATEGIES[0]]["dir"] != first[STRATEGIES[0]]["dir"]
+    assert second[STRATEGIES[1]]["dir"] == first[STRATEGIES[1]]["dir"]  # unchanged partitions are not rewritten
+    assert (root / first[STRATEGIES[0]]["dir"]).exists()  # kept for readers of the previous manifest
+
+    remaining = changed[changed["strategy"] != STRATEGIES[2]]
+    save_library_store(root, remaining)
+    partitions = {p.name for p in root.iterdir() if p.is_dir()}
+    assert partitions == {entry["dir"] for entry in second.values()}  # the version replaced two saves ago is gone
+    assert sorted(load_library_store(root)["strategy"].unique()) == sorted(STRATEGIES[:2])
+
+    save_library_store(root, remaining)
+    assert not (root / second[STRATEGIES[2]]["dir"]).exists()  # the dropped strategy, once no manifest names it
@@ -0,0 +1,64 @@
+# foundry_dash/tests/test_rule_graph.py
+
+import numpy as np
+import pytest
+
+from core.logic.backtest_engine import evaluate_rule_graph
+from core.logic.rule_graph import RuleGraphError, compile_rule_graph, graph_hash
+
+
+def _ops(graph, op):
+    return [node for node in graph["nodes"] if node[0] == op]
+
+
+def test_shared_subexpressions_are_stored_once():
+    graph = compile_rule_graph(
+        [{"left": "close", "op": ">", "right": "sma(50)"}, {"left": "sma(50)", "op": ">", "right": "sma(200)"}],
+        [{"left": "close", "op": "<", "right": "sma(50)"}],
+    )
+    assert _ops(graph, "field") == [["field", "close"]]
+    assert len(_ops(graph, "sma")) == 2  # sma(50) and sma(200)
+    assert len({tuple(node) for node in graph["nodes"]}) == len(graph["nodes"])
+
+
+def test_duplicate_rules_compile_to_one_condition():
+    rule = {"left": "close", "op": ">", "right": "sma(20)"}
+    assert compile_rule_graph([rule, dict(rule)]) == compile_rule_graph([rule])
+
+
+def test_equal_rules_hash_equal():
+    rules = [{"left": "rsi(14)", "op": "<", "right": 30}]
+    assert graph_hash(compile_rule_graph(rules)) == graph_hash(compile_rule_graph([dict(r) for r in rules]))
+
+
+def test_cross_against_a_constant_reuses_the_constant():
+    graph = compile_rule_graph([{"left": "close", "op": "crosses above", "right": 100}])
+    assert _ops(graph, "const") == [["const", 100.0]]
+    # Only the price side is shifted; the constant is the same on every bar.
+    assert len(_ops(graph, "shift")) == 1
+
+
+def test_constant_cross_fires_on_the_crossing_bar_only():
+    graph = compile_rule_graph([{"left": "close", "op": "crosses above", "right": 100}])
+    close = np.array([[98.0], [99.0], [101.0], [102.0], [99.0], [103.0]])
+    assert evaluate_rule_graph(graph, {"close": close})[:, 0].tolist() == [0, 0, 1, 0, 0, 1]
+
+
+def test_cross_below_with_exit_holds_until_exit():
+    graph = compile_rule_graph(
+        [{"left": "close", "op": "crosses below", "right": 100}],
+        [{"left": "close", "op": ">", "right": 105}],
+    )
+    close = np.array([[101.0], [99.0], [98.0], [104.0], [106.0], [102.0]])
+    assert evaluate_rule_graph(graph, {"close": close})[:, 0].tolist() == [0, 1, 1, 1, 0, 0]
+
+
+@pytest.mark.parametrize("rule", [
+    {"left": "close", "op": ">", "right": "macd(12)"},
+    {"left": "close", "op": "=>", "right": 1},
+    {"left": "close", "op": ">", "right": "nan"},
+    {"left": "close", "op": ">", "right": "sma(0)"},
+])
+def test_invalid_rules_are_rejected(rule):
+    with pytest.raises(RuleGraphError):
+        compile_rule_graph([rule])
@@ -0,0 +1,64 @@
+# foundry_dash/tests/test_strategy_sandbox.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.logic.strategy_sandbox import (
+    StrategyValidationError, evaluate_signals, load_signals_function, validate_strategy_source,
+)
+
+ESCAPE_PAYLOAD = '''
+def signals(df):
+    pd.io.common.os.system("echo ESCAPED > /tmp/escaped.txt")
+    return np.zeros(len(df))
+'''
+
+
+def _bars(n=120):
+    close = 100 + np.cumsum(np.sin(np.arange(n) / 5.0))
+    index = pd.date_range("2024-01-01", periods=n, freq="B")
+    return pd.DataFrame({"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1e5}, index=index)
+
+
+def test_module_attribute_chain_is_rejected(tmp_path):
+    with pytest.raises(StrategyValidationError, match="Attribute '.*' is not allowed"):
+        validate_strategy_source(ESCAPE_PAYLOAD)
+    with pytest.raises(StrategyValidationError):
+        evaluate_signals(ESCAPE_PAYLOAD.replace("/tmp/escaped.txt", str(tmp_path / "escaped.txt")), _bars(), timeout=None)
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+@pytest.mark.parametrize("source", [
+    "import os\ndef signals(df):\n    return df['close'] * 0",
+    "import numpy.lib\ndef signals(df):\n    return df['close'] * 0",
+    "from numpy import load\ndef signals(df):\n    return load('x')",
+    "def signals(df):\n    df.to_csv('/tmp/x.csv')\n    return df['close'] * 0",
+    "def signals(df):\n    return np.load('/etc/passwd')",
+    "def signals(df):\n    return df.__class__",
+    "def signals(df):\n    return __builtins__['open']('/etc/passwd')",
+    "def signals(df):\n    return eval('1')",
+    "def helper(df):\n    return df",
+])
+def test_rejected_sources(source):
+    with pytest.raises(StrategyValidationError):
+        validate_strategy_source(source)
+
+
+def test_strategy_sees_namespaces_not_modules():
+    source = "import numpy as np\nimport pandas as pd\ndef signals(df):\n    return np.zeros(len(df))"
+    fn = load_signals_function(source)
+    assert fn.__globals__["np"] is not np
+    assert not hasattr(fn.__globals__["pd"], "io")
+
+
+def test_template_strategy_runs():
+    source = (
+        "import numpy as np\n"
+        "def signals(df):\n"
+        "    sma = df['close'].rolling(20).mean()\n"
+        "    return np.where(df['close'] > sma, 1.0, 0.0)\n"
+    )
+    positions = evaluate_signals(source, _bars(), timeout=None)
+    assert positions.shape == (120,)
+    assert set(np.unique(positions)) <= {0.0, 1.0}
@@ -0,0 +1,60 @@
+# foundry_dash/tests/test_universe_store.py
+
+import yaml
+
+from core.io.universe_store import UniverseStore
+
+
+def _store(tmp_path, **kwargs):
+    return UniverseStore(tmp_path / "universes.yaml", **kwargs)
+
+
+def test_log_replays_in_a_fresh_store(tmp_path):
+    store = _store(tmp_path)
+    store.save({"Tech": ["TCS", "INFY"], "Banks": ["SBIN"]})
+    store.replace_members("Tech", ["INFY", "WIPRO"])
+    store.append([{"op": "delete", "universe": "Banks"}])
+
+    assert not (tmp_path / "universes.yaml").exists()  # only the log has been written
+    assert _store(tmp_path).load() == {"Tech": ["INFY", "WIPRO"]}
+
+
+def test_replay_is_idempotent(tmp_path):
+    store = _store(tmp_path)
+    changes = [{"op": "create", "universe": "Tech"}, {"op": "add", "universe": "Tech", "tickers": ["TCS", "INFY"]}]
+    store.append(changes)
+    store.append(changes)
+    assert store.members("Tech") == ["TCS", "INFY"]
+
+
+def test_torn_final_line_is_ignored(tmp_path):
+    store = _store(tmp_path)
+    store.save({"Tech": ["TCS"]})
+    with open(store.log_path, "ab") as f:
+        f.write(b'{"op":"add","universe":"Tech","tickers":["INFY"]')
+    assert _store(tmp_path).members("Tech") == ["TCS"]
+
+
+def test_compaction_folds_the_log_into_the_snapshot(tmp_path):
+    store = _store(tmp_path, compact_after_changes=4)
+    store.save({"Tech": ["TCS"]})
+    store.replace_members("Tech", ["TCS", "INFY"])
+    store.replace_members("Tech", ["INFY"])
+
+    assert store.log_path.stat().st_size == 0
+    with open(tmp_path / "universes.yaml") as f:
+        assert yaml.safe_load(f) == {"Tech": ["INFY"]}
+    assert _store(tmp_path).load() == {"Tech": ["INFY"]}
+
+
+def test_other_process_sees_changes_after_compaction(tmp_path):
+    reader = _store(tmp_path)
+    writer = _store(tmp_path, compact_after_changes=2)
+    writer.save({"Tech": ["TCS"]})
+    assert reader.members("Tech") == ["TCS"]
+    revision = reader.revision()
+
+    writer.replace_members("Tech", ["TCS", "INFY"])  # compacts
+    writer.append([{"op": "create", "universe": "Pharma"}])
+    assert reader.load() == {"Tech": ["TCS", "INFY"], "Pharma": []}
+    assert reader.revision() != revision
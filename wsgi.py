@@ -0,0 +1,8 @@
+# foundry_dash/wsgi.py
+
+# Production entry point: gunicorn -c gunicorn.conf.py wsgi:server
+# Each worker imports the app on its own (no preload), then serves callbacks
+# in parallel; shared state lives on disk (universe store, bar store, library)
+# and in the shared diskcache, so workers stay coherent without talking to
+# each other.
+from app import app, server  # noqa: F401